@@ -0,0 +1,101 @@
+"""
+Compare JSON decoders on payloads shaped like large FMP responses.
+
+Payloads are generated from the models registered for each endpoint, so no
+API key is needed. Run from the repository root:
+
+    python benchmarks/bench_decoding.py [--rows 50000] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import time
+import typing
+
+from fmpsdk import decoding
+from fmpsdk.columnar import record_model
+from fmpsdk.model_registry import ENDPOINT_MODEL_MAP
+
+ENDPOINTS = (
+    "stock_list",
+    "etf_holder_bulk",
+    "eod_bulk",
+    "bulk_profiles",
+    "financial_statement_full_as_reported",
+)
+
+
+def _value(annotation: typing.Any, rng: random.Random) -> typing.Any:
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        annotation = args[0] if args else None
+    if annotation is float:
+        return round(rng.uniform(0, 1000), 4)
+    if annotation is int:
+        return rng.randrange(10**9)
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is str:
+        return "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(8))
+    if typing.get_origin(annotation) is dict:
+        return {f"item{i}": round(rng.uniform(0, 1e6), 2) for i in range(20)}
+    return None
+
+
+def make_payload(endpoint: str, rows: int, seed: int = 0) -> bytes:
+    """
+    Build a JSON array of ``rows`` records for the endpoint's model.
+    """
+    rng = random.Random(seed)
+    model = record_model(ENDPOINT_MODEL_MAP[endpoint])
+    fields = {
+        info.alias or name: info.annotation for name, info in model.model_fields.items()
+    }
+    records = [
+        {key: _value(annotation, rng) for key, annotation in fields.items()}
+        for _ in range(rows)
+    ]
+    return json.dumps(records).encode()
+
+
+def _best_time(func: typing.Callable[[], typing.Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    available = []
+    for name in decoding.DECODERS:
+        try:
+            decoding.set_json_decoder(name)
+        except ImportError:
+            continue
+        available.append(name)
+    decoding.set_json_decoder()
+
+    print(f"{'endpoint':<40}{'MB':>8}" + "".join(f"{n:>10}" for n in available))
+    for endpoint in ENDPOINTS:
+        payload = make_payload(endpoint, args.rows)
+        timings = []
+        for name in available:
+            decoding.set_json_decoder(name)
+            timings.append(_best_time(lambda: decoding.loads(payload), args.repeat))
+        decoding.set_json_decoder()
+        print(
+            f"{endpoint:<40}{len(payload) / 1e6:>8.1f}"
+            + "".join(f"{t * 1000:>8.1f}ms" for t in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -343,7 +343,7 @@ from .statements import (
 from .technical_indicators import technical_indicators
 
 # Utility functions
-from .utils import iterate_over_pages, to_dataframe, to_dict_list
+from .utils import iter_pages, iterate_over_pages, to_dataframe, to_dict_list
 
 # Make all functions available at package level
 __all__ = [
@@ -596,6 +596,7 @@ __all__ = [
     # Technical Indicators
     "technical_indicators",
     # Utils
+    "iter_pages",
     "iterate_over_pages",
     "to_dataframe",
     "to_dict_list",
@@ -0,0 +1,175 @@
+"""
+Asyncio client for the FMP API.
+
+Every endpoint function in ``fmpsdk`` has an awaitable twin here with the same
+name, signature and ``parse_response`` model validation. Requests share one
+aiohttp session with a concurrency-limited connection pool, so a single event
+loop can keep hundreds of requests in flight.
+
+Usage:
+    import asyncio
+    from fmpsdk import aio
+
+    async def main():
+        quotes = await asyncio.gather(
+            *(aio.quote(apikey="your_api_key", symbol=s) for s in ["AAPL", "MSFT"])
+        )
+        await aio.close_session()
+
+    asyncio.run(main())
+
+Requires the optional ``aiohttp`` dependency.
+"""
+
+import functools
+import importlib
+import types
+import typing
+
+from ..retry import RetryPolicy
+from ..utils import CALL_OPTIONS, validate_response
+from .transport import (
+    close_session,
+    configure_transport,
+    get_session,
+    return_binary_stable,
+    return_json,
+    set_session,
+)
+
+# Imported by name: several endpoint functions shadow their module on the package.
+ENDPOINT_MODULES = tuple(
+    importlib.import_module(f"fmpsdk.{name}")
+    for name in (
+        "analyst",
+        "bulk",
+        "calendar_module",
+        "chart",
+        "commitment_of_traders",
+        "commodity",
+        "company",
+        "crypto",
+        "directory",
+        "discounted_cash_flow",
+        "earnings_transcript",
+        "economics",
+        "esg",
+        "etf",
+        "forex",
+        "form13f",
+        "fundraising",
+        "indexes",
+        "insider_trades",
+        "market_hours",
+        "market_performance",
+        "mutual_funds",
+        "news",
+        "quote",
+        "search",
+        "sec_filings",
+        "senate",
+        "statements",
+        "technical_indicators",
+    )
+)
+
+_JSON_FETCHER = "__return_json"
+_BINARY_FETCHER = "__return_binary_stable"
+
+
+class _PendingRequest(typing.NamedTuple):
+    """A request captured from a synchronous endpoint body, not yet sent."""
+
+    binary: bool
+    args: typing.Tuple
+    kwargs: typing.Dict
+
+    async def fetch(self) -> typing.Any:
+        if self.binary:
+            return await return_binary_stable(*self.args, **self.kwargs)
+        return await return_json(*self.args, **self.kwargs)
+
+
+def _capture_json(*args: typing.Any, **kwargs: typing.Any) -> _PendingRequest:
+    return _PendingRequest(False, args, kwargs)
+
+
+def _capture_binary(*args: typing.Any, **kwargs: typing.Any) -> _PendingRequest:
+    return _PendingRequest(True, args, kwargs)
+
+
+def _make_async(func: typing.Callable[..., typing.Any]) -> typing.Callable:
+    """
+    Build the awaitable twin of a synchronous endpoint function.
+
+    The endpoint's own body still validates arguments and builds the path and
+    query variables; it just runs against capturing stand-ins for the transport
+    functions, and the captured request is then awaited on the async transport.
+    """
+    raw = getattr(func, "__wrapped__", func)
+    validated = raw is not func
+    request_builder = types.FunctionType(
+        raw.__code__,
+        {
+            **raw.__globals__,
+            _JSON_FETCHER: _capture_json,
+            _BINARY_FETCHER: _capture_binary,
+        },
+        raw.__name__,
+        raw.__defaults__,
+        raw.__closure__,
+    )
+    request_builder.__kwdefaults__ = raw.__kwdefaults__
+
+    @functools.wraps(func)
+    async def endpoint(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        options = {k: kwargs.pop(k) for k in CALL_OPTIONS if k in kwargs}
+        policy = options.pop("retry_policy", None)
+        if policy is not None and not isinstance(policy, RetryPolicy):
+            raise TypeError("retry_policy must be a RetryPolicy instance.")
+        result = request_builder(*args, **kwargs)
+        if isinstance(result, _PendingRequest):
+            if policy is not None and not result.binary:
+                result = result._replace(
+                    kwargs={**result.kwargs, "retry_policy": policy}
+                )
+            result = await result.fetch()
+        if validated:
+            return validate_response(raw.__name__, result, **options)
+        return result
+
+    endpoint.__module__ = __name__
+    return endpoint
+
+
+def _is_endpoint(module: types.ModuleType, obj: typing.Any) -> bool:
+    raw = getattr(obj, "__wrapped__", obj)
+    return (
+        isinstance(raw, types.FunctionType)
+        and raw.__module__ == module.__name__
+        and not raw.__name__.startswith("_")
+        and bool({_JSON_FETCHER, _BINARY_FETCHER} & set(raw.__code__.co_names))
+    )
+
+
+def _build_endpoints() -> typing.Dict[str, typing.Callable]:
+    endpoints = {}
+    for module in ENDPOINT_MODULES:
+        for name, obj in vars(module).items():
+            if _is_endpoint(module, obj):
+                endpoints[name] = _make_async(obj)
+    return endpoints
+
+
+_ENDPOINTS = _build_endpoints()
+globals().update(_ENDPOINTS)
+
+__all__ = [
+    "close_session",
+    "configure_transport",
+    "get_session",
+    "return_binary_stable",
+    "return_json",
+    "set_session",
+]
+__all__ += sorted(_ENDPOINTS)
@@ -0,0 +1,324 @@
+import asyncio
+import csv
+import io
+import logging
+import typing
+
+from requests.structures import CaseInsensitiveDict
+
+from .. import decoding, rate_limit, retry
+from ..exceptions import RATE_LIMIT_STATUS_CODE
+from ..retry import RetryPolicy
+from ..url_methods import (
+    BASE_URL_STABLE,
+    BASE_URL_V3,
+    BASE_URL_V4,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+)
+from ..utils import raise_for_exception
+
+# Total number of open connections shared by every request on the event loop.
+MAX_CONNECTIONS = 100
+# Maximum open connections to a single host (0 means no per-host limit).
+LIMIT_PER_HOST = 0
+# Maximum number of requests awaiting a response at the same time.
+MAX_CONCURRENCY = 100
+
+_config: typing.Dict[str, int] = {
+    "max_connections": MAX_CONNECTIONS,
+    "limit_per_host": LIMIT_PER_HOST,
+    "max_concurrency": MAX_CONCURRENCY,
+}
+# Sessions and semaphores are bound to the event loop that created them.
+_session: typing.Any = None
+_session_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+_semaphore: typing.Optional[asyncio.Semaphore] = None
+_semaphore_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+
+
+class _BufferedResponse:
+    """
+    Fully read aiohttp response exposing the attributes raise_for_exception uses.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        reason: str,
+        content: bytes,
+        url: str,
+        headers: typing.Optional[typing.Mapping[str, str]] = None,
+    ):
+        self.status_code = status
+        self.reason = reason or ""
+        self.content = content
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers or {})
+
+    @property
+    def retry_after(self) -> typing.Optional[float]:
+        return retry.parse_retry_after(self)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+def _get_base_url(version: str) -> str:
+    """
+    Get the base URL for the API requests.
+    """
+    base_urls = {"stable": BASE_URL_STABLE, "v4": BASE_URL_V4, "v3": BASE_URL_V3}
+    return base_urls.get(version, BASE_URL_STABLE)
+
+
+def _encode_params(query_vars: typing.Dict) -> typing.List[typing.Tuple[str, str]]:
+    """
+    Encode query values the way requests does: drop None, repeat list values.
+    """
+    params: typing.List[typing.Tuple[str, str]] = []
+    for key, value in query_vars.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        params.extend((key, str(v)) for v in values)
+    return params
+
+
+def configure_transport(
+    max_connections: int = MAX_CONNECTIONS,
+    limit_per_host: int = LIMIT_PER_HOST,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> None:
+    """
+    Configure the asyncio connection pool.
+
+    Takes effect for sessions created afterwards; call ``close_session`` first to
+    replace a session that is already open.
+
+    :param max_connections: Total open connections across all hosts
+    :param limit_per_host: Open connections per host (0 for no limit)
+    :param max_concurrency: Requests allowed in flight at once
+    """
+    global _semaphore, _semaphore_loop
+    if max_connections < 1 or max_concurrency < 1 or limit_per_host < 0:
+        raise ValueError(
+            "max_connections and max_concurrency must be at least 1 and "
+            "limit_per_host must not be negative."
+        )
+    _config.update(
+        max_connections=max_connections,
+        limit_per_host=limit_per_host,
+        max_concurrency=max_concurrency,
+    )
+    _semaphore, _semaphore_loop = None, None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(_config["max_concurrency"])
+        _semaphore_loop = loop
+    return _semaphore
+
+
+def _release_session(session: typing.Any, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close a default session created on an event loop that is no longer current.
+    """
+    if loop.is_running():
+        # Still serving another thread: close it on its own loop
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    connector = session.connector
+    session.detach()
+    if connector is not None:
+        # close() would schedule its cleanup on the stale loop; this is what
+        # aiohttp itself does for a connector that is garbage collected
+        connector._close()
+
+
+def get_session() -> typing.Any:
+    """
+    Return the aiohttp session for the running event loop, creating it on first use.
+
+    :raises ImportError: If aiohttp is not installed
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is not None and (_session_loop is None or _session_loop is loop):
+        return _session
+    if _session is not None and _session_loop is not None:
+        _release_session(_session, _session_loop)
+
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "The fmpsdk.aio client requires aiohttp. Install it with "
+            "'pip install aiohttp'."
+        ) from e
+
+    connector = aiohttp.TCPConnector(
+        limit=_config["max_connections"], limit_per_host=_config["limit_per_host"]
+    )
+    _session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+            sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+        ),
+    )
+    _session_loop = loop
+    return _session
+
+
+def set_session(session: typing.Any) -> None:
+    """
+    Install a caller-managed aiohttp ``ClientSession`` (or compatible object).
+
+    The caller remains responsible for closing it. Passing ``None`` makes the
+    next request create a default session.
+    """
+    global _session, _session_loop
+    _session, _session_loop = session, None
+
+
+async def close_session() -> None:
+    """
+    Close the default session and release its pooled connections.
+    """
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None:
+        await session.close()
+
+
+async def _fetch(url: str, query_vars: typing.Dict) -> _BufferedResponse:
+    limiter = rate_limit.get_rate_limiter()
+    if limiter is not None:
+        if isinstance(limiter, rate_limit.FileTokenBucket):
+            # Waiting for the file lock would block every coroutine on the loop
+            loop = asyncio.get_running_loop()
+            wait = await loop.run_in_executor(None, limiter.reserve)
+        else:
+            wait = limiter.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    async with _get_semaphore():
+        async with get_session().get(url, params=_encode_params(query_vars)) as resp:
+            content = await resp.read()
+            return _BufferedResponse(
+                resp.status,
+                resp.reason,
+                content,
+                str(resp.url),
+                getattr(resp, "headers", None),
+            )
+
+
+async def return_json(
+    path: str,
+    query_vars: typing.Dict,
+    version: str = "stable",
+    retries: typing.Optional[int] = None,
+    retry_delay: typing.Optional[float] = None,
+    retry_policy: typing.Optional[RetryPolicy] = None,
+) -> typing.Optional[typing.List[typing.Any]]:
+    """
+    Asynchronous equivalent of ``url_methods.__return_json``.
+
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param version: API version to use ("stable", "v4" or "v3")
+    :param retries: Number of retries with a fixed delay (legacy)
+    :param retry_delay: Fixed delay in seconds between retries (legacy)
+    :param retry_policy: Retry policy for this call
+    :return: JSON response
+    """
+    url = f"{_get_base_url(version)}{path}"
+    policy = retry.resolve_policy(retries, retry_delay, retry_policy)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    attempt = 0
+    while True:
+        retry_after = None
+        timeout_error: typing.Optional[BaseException] = None
+        try:
+            response = await _fetch(url, query_vars)
+        except asyncio.TimeoutError as e:
+            logging.error(f"Read timeout occurred while connecting to {url}.")
+            timeout_error = e
+            reason = "timeout"
+        else:
+            if response.status_code != RATE_LIMIT_STATUS_CODE:
+                break
+            processed_query_vars = {
+                i: j for i, j in query_vars.items() if i != "apikey"
+            }
+            logging.warning(
+                f"Rate limit occurred: {response.status_code}. "
+                f"Query variables: {processed_query_vars}"
+            )
+            retry_after = response.retry_after
+            reason = "rate_limit"
+
+        delay = policy.next_delay(attempt, loop.time() - started, retry_after)
+        if delay is None:
+            retry.record_give_up()
+            if timeout_error is not None:
+                raise timeout_error
+            break
+        logging.info(
+            f"Retrying in {delay} seconds... "
+            f"({policy.max_retries - attempt} retries left)"
+        )
+        retry.record_retry(
+            reason, delay, retry_after is not None and policy.respect_retry_after
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
+
+    raise_for_exception(response)
+
+    return_var = None
+    if len(response.content) > 0:
+        if query_vars.get("datatype") == "csv":
+            reader = csv.DictReader(io.StringIO(response.content.decode("utf-8")))
+            return_var = [row for row in reader]
+        else:
+            return_var = decoding.loads(response.content)
+
+    if len(response.content) == 0 or (
+        isinstance(return_var, dict) and len(return_var.keys()) == 0
+    ):
+        logging.warning("Response appears to have no data.  Returning empty List.")
+        return_var = []
+    return return_var
+
+
+async def return_binary_stable(
+    path: str, query_vars: typing.Dict
+) -> typing.Optional[bytes]:
+    """
+    Asynchronous equivalent of ``url_methods.__return_binary_stable``.
+
+    :param path: Path after TLD of URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :return: Binary response content, or None if the request failed
+    """
+    url = f"{BASE_URL_STABLE}{path}"
+    try:
+        response = await _fetch(url, query_vars)
+    except Exception as e:
+        logging.error(f"Request to {url} failed: {e}")
+        return None
+    if response.status_code >= 400:
+        logging.error(
+            f"HTTP error occurred: {response.status_code} {response.reason} for {url}"
+        )
+        return None
+    if len(response.content) == 0:
+        logging.warning("Response appears to have no data.")
+    return response.content
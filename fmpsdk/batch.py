@@ -0,0 +1,154 @@
+import collections
+import contextvars
+import itertools
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+# Default number of worker threads used by map_endpoint.
+MAX_WORKERS = 8
+
+
+class BatchResult(typing.NamedTuple):
+    """
+    Outcome of one endpoint call made by ``map_endpoint``.
+
+    Exactly one of ``result`` and ``error`` is set: per-item failures such as
+    ``PremiumEndpointException`` are captured here instead of aborting the batch.
+    ``position`` is the 0-based position of ``params`` in the parameter grid.
+    """
+
+    position: int
+    params: typing.Dict[str, typing.Any]
+    result: typing.Any = None
+    error: typing.Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def expand_param_grid(
+    param_grid: typing.Union[
+        typing.Mapping[str, typing.Iterable[typing.Any]],
+        typing.Iterable[typing.Mapping[str, typing.Any]],
+    ],
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """
+    Turn a parameter grid into a stream of keyword-argument dictionaries.
+
+    A mapping of parameter name to candidate values is expanded to its
+    cartesian product; an iterable of dictionaries is used as-is.
+
+    Examples:
+        >>> list(expand_param_grid({"symbol": ["AAPL", "MSFT"], "period": ["FY"]}))
+        [{'symbol': 'AAPL', 'period': 'FY'}, {'symbol': 'MSFT', 'period': 'FY'}]
+    """
+    if isinstance(param_grid, typing.Mapping):
+        names = list(param_grid)
+        value_lists = [
+            [values] if isinstance(values, str) else list(values)
+            for values in param_grid.values()
+        ]
+        for combination in itertools.product(*value_lists):
+            yield dict(zip(names, combination))
+    else:
+        for params in param_grid:
+            yield dict(params)
+
+
+def _call(
+    func: typing.Callable[..., typing.Any],
+    position: int,
+    params: typing.Dict[str, typing.Any],
+    common_kwargs: typing.Dict[str, typing.Any],
+) -> BatchResult:
+    try:
+        return BatchResult(position, params, func(**common_kwargs, **params))
+    except Exception as e:
+        return BatchResult(position, params, error=e)
+
+
+def map_endpoint(
+    func: typing.Callable[..., typing.Any],
+    param_grid: typing.Union[
+        typing.Mapping[str, typing.Iterable[typing.Any]],
+        typing.Iterable[typing.Mapping[str, typing.Any]],
+    ],
+    max_workers: int = MAX_WORKERS,
+    ordered: bool = False,
+    **common_kwargs: typing.Any,
+) -> typing.Iterator[BatchResult]:
+    """
+    Call an endpoint function concurrently over a grid of parameters.
+
+    Requests go through the shared transport, so the client-side rate limiter
+    (``fmpsdk.rate_limit``) and retry policy apply to every worker. Each call
+    runs in a copy of the caller's context, so settings scoped with context
+    managers such as ``retry.use_retry_policy`` or ``cache.bypass_cache`` also
+    apply inside the batch. Parameters
+    are consumed lazily and at most ``2 * max_workers`` calls are queued at a
+    time, so very large universes do not build up pending work in memory.
+
+    Args:
+        func: Endpoint function, e.g. ``fmpsdk.income_statement``
+        param_grid: Iterable of keyword dictionaries, or a mapping of parameter
+            name to values whose cartesian product is called
+        max_workers: Number of concurrent worker threads
+        ordered: Yield results in parameter order instead of completion order
+        **common_kwargs: Keyword arguments passed to every call (e.g. ``apikey``)
+
+    Yields:
+        BatchResult for every parameter set, with ``result`` or ``error`` set
+
+    Examples:
+        >>> for item in map_endpoint(
+        ...     income_statement, {"symbol": symbols}, max_workers=16, apikey=key
+        ... ):
+        ...     if item.ok:
+        ...         store(item.params["symbol"], item.result)
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    params_iter = enumerate(expand_param_grid(param_grid))
+    window = 2 * max_workers
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit_next() -> typing.Optional[Future]:
+        for position, params in params_iter:
+            # One copy per call: a Context cannot be entered by two threads at once
+            context = contextvars.copy_context()
+            return executor.submit(
+                context.run, _call, func, position, params, common_kwargs
+            )
+        return None
+
+    try:
+        if ordered:
+            queue: typing.Deque[Future] = collections.deque()
+            while True:
+                while len(queue) < window:
+                    future = submit_next()
+                    if future is None:
+                        break
+                    queue.append(future)
+                if not queue:
+                    return
+                yield queue.popleft().result()
+
+        pending: typing.Set[Future] = set()
+        while True:
+            while len(pending) < window:
+                future = submit_next()
+                if future is None:
+                    break
+                pending.add(future)
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # Stopping early drops queued calls instead of running them to completion.
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,8 +1,24 @@
+import itertools
+import json
 import logging
+import os
+import threading
+import time
 import typing
+import uuid
+from urllib.parse import quote
 
+import pandas as pd
 from pydantic import RootModel
 
+from . import batch, columnar, streaming
+from .exceptions import (
+    InvalidAPIKeyException,
+    InvalidQueryParameterException,
+    PremiumEndpointException,
+    PremiumQueryParameterException,
+)
+from .model_registry import ENDPOINT_MODEL_MAP
 from .models import (
     FMPBalanceSheetGrowth,
     FMPBalanceSheetStatement,
@@ -469,3 +485,500 @@ def eod_bulk(apikey: str, date: str) -> RootModel[typing.List[FMPBulkEOD]]:
     path = "eod-bulk"
     query_vars = {"apikey": apikey, "date": date}
     return __return_json(path, query_vars)  # type: ignore[no-any-return]
+
+
+# Rows per DataFrame read from the socket while a part is downloaded.
+PART_CHUNK_SIZE = 50_000
+
+# Errors that retrying a part cannot fix.
+_FATAL_ERRORS = (
+    InvalidAPIKeyException,
+    InvalidQueryParameterException,
+    PremiumEndpointException,
+    PremiumQueryParameterException,
+)
+
+
+class PartResult(typing.NamedTuple):
+    """
+    Outcome of downloading one part with ``download_parts``.
+    """
+
+    part: int
+    rows: int = 0
+    path: typing.Optional[str] = None
+    attempts: int = 1
+    error: typing.Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _write_part(
+    func: typing.Callable[..., typing.Any],
+    apikey: str,
+    part: int,
+    directory: typing.Optional[str],
+    sink: typing.Optional[typing.Callable[[int, pd.DataFrame], None]],
+) -> PartResult:
+    """
+    Download one part, writing it to ``directory`` and/or handing it to ``sink``.
+    """
+    frames = streaming.stream(
+        func,
+        apikey=apikey,
+        part=str(part),
+        chunk_size=PART_CHUNK_SIZE,
+        output="pandas",
+    )
+    rows = 0
+    path = None
+    kept: typing.List[pd.DataFrame] = []
+    if directory is not None:
+        name = getattr(func, "__name__", "bulk")
+        path = os.path.join(directory, f"{name}_part{part}.csv")
+        partial = f"{path}.partial"
+        try:
+            with open(partial, "w", newline="", encoding="utf-8") as fh:
+                for frame in frames:
+                    frame.to_csv(fh, header=rows == 0, index=False)
+                    rows += len(frame)
+                    if sink is not None:
+                        kept.append(frame)
+            if rows:
+                os.replace(partial, path)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+    else:
+        for frame in frames:
+            rows += len(frame)
+            kept.append(frame)
+    if not rows:
+        return PartResult(part)
+    # The sink gets each part once, after it downloaded completely, so a
+    # retried part is never delivered twice.
+    if sink is not None:
+        sink(part, kept[0] if len(kept) == 1 else pd.concat(kept, ignore_index=True))
+    return PartResult(part, rows, path)
+
+
+def _fetch_part(
+    part: int,
+    endpoint: typing.Callable[..., typing.Any],
+    apikey: str,
+    directory: typing.Optional[str],
+    sink: typing.Optional[typing.Callable[[int, pd.DataFrame], None]],
+    retries: int,
+    retry_delay: float,
+) -> PartResult:
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return _write_part(endpoint, apikey, part, directory, sink)._replace(
+                attempts=attempt
+            )
+        except _FATAL_ERRORS:
+            raise
+        except Exception as e:
+            if attempt > retries:
+                return PartResult(part, attempts=attempt, error=e)
+            delay = retry_delay * 2 ** (attempt - 1)
+            logging.warning(
+                f"Part {part} failed ({e!r}); retrying in {delay} seconds..."
+            )
+            time.sleep(delay)
+
+
+def download_parts(
+    func: typing.Callable[..., typing.Any],
+    apikey: str,
+    directory: typing.Optional[str] = None,
+    sink: typing.Optional[typing.Callable[[int, pd.DataFrame], None]] = None,
+    max_workers: int = batch.MAX_WORKERS,
+    retries: int = 3,
+    retry_delay: float = 1.0,
+) -> typing.List[PartResult]:
+    """
+    Download every part of a multi-part bulk endpoint concurrently.
+
+    Parts 0, 1, 2, ... are requested ``max_workers`` at a time through
+    ``batch.map_endpoint``; no part after the first empty one is requested.
+    Each part is streamed (see ``fmpsdk.streaming``) into
+    ``{directory}/{endpoint}_part{n}.csv`` and/or passed to ``sink`` as one
+    typed DataFrame. Failed parts are retried on their own with exponential
+    backoff; a part that still fails is reported with its error and no later
+    parts are started.
+
+    Example:
+        results = download_parts(bulk_profiles, apikey, directory="profiles")
+        failed = [r.part for r in results if not r.ok]
+
+    :param func: Multi-part endpoint, e.g. ``bulk_profiles`` or ``etf_holder_bulk``
+    :param apikey: Your FMP API key
+    :param directory: Directory for one CSV file per part (created if missing)
+    :param sink: Callable receiving ``(part, DataFrame)`` for every part
+    :param max_workers: Number of parts downloaded at the same time
+    :param retries: Retries per part after the first attempt
+    :param retry_delay: Delay in seconds before the first retry of a part
+    :return: Results of the non-empty and failed parts, ordered by part
+    :raises ValueError: If neither ``directory`` nor ``sink`` is given
+    :raises PremiumEndpointException: And the other API errors that retrying
+        cannot fix, as soon as any part hits them
+    """
+    if directory is None and sink is None:
+        raise ValueError("Pass a directory, a sink or both.")
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+
+    lock = threading.Lock()
+    end: typing.List[typing.Optional[int]] = [None]
+
+    def parts() -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        for part in itertools.count():
+            with lock:
+                if end[0] is not None and part >= end[0]:
+                    return
+            yield {"part": part}
+
+    results = []
+    for item in batch.map_endpoint(
+        _fetch_part,
+        parts(),
+        max_workers=max_workers,
+        endpoint=func,
+        apikey=apikey,
+        directory=directory,
+        sink=sink,
+        retries=retries,
+        retry_delay=retry_delay,
+    ):
+        if not item.ok:
+            raise item.error  # type: ignore[misc]
+        result = item.result
+        if result.rows == 0 or not result.ok:
+            # Stop at the first empty part, or after a part that keeps failing
+            with lock:
+                stop = result.part if result.ok else result.part + 1
+                end[0] = stop if end[0] is None else min(end[0], stop)
+        if result.rows or not result.ok:
+            results.append(result)
+    # Parts already in flight past the end may have failed meanwhile
+    return sorted(
+        (r for r in results if r.rows or end[0] is None or r.part < end[0]),
+        key=lambda r: r.part,
+    )
+
+
+# File formats written by DatasetSink, with their file extensions.
+DATASET_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Directory name used by Hive-style partitioning for missing values.
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _pyarrow() -> typing.Any:
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Writing Parquet/Arrow datasets requires pyarrow. Install it with "
+            "'pip install pyarrow'."
+        ) from e
+    return pyarrow
+
+
+def _record_model(endpoint: typing.Union[str, typing.Callable[..., typing.Any]]):
+    name = endpoint if isinstance(endpoint, str) else endpoint.__name__
+    model = columnar.record_model(ENDPOINT_MODEL_MAP.get(name))
+    if model is None:
+        raise ValueError(f"No record model is registered for endpoint: {name}.")
+    return model
+
+
+def arrow_schema(model: typing.Any) -> typing.Any:
+    """
+    Build the Arrow schema for a record model, e.g. ``FMPBulkEOD``.
+
+    Column names follow ``columnar.to_pandas``; ``float``, ``int`` and ``bool``
+    fields map to ``float64``, ``int64`` and ``bool`` and everything else to
+    ``string`` (non-string values are stored as JSON). All columns are
+    nullable.
+
+    :param model: Record model class
+    :return: ``pyarrow.Schema``
+    :raises ImportError: If pyarrow is not installed
+    """
+    pa = _pyarrow()
+    types = {"float64": pa.float64(), "Int64": pa.int64(), "boolean": pa.bool_()}
+    return pa.schema(
+        [
+            pa.field(name, types.get(dtype, pa.string()))
+            for name, dtype in columnar.field_dtypes(model).items()
+        ]
+    )
+
+
+class DatasetSink:
+    """
+    Write typed DataFrame chunks of a bulk endpoint to a partitioned dataset.
+
+    Rows are split into Hive-style directories (``root/date=2024-01-02/``) by
+    the ``partition_by`` columns and appended to one Parquet or Arrow IPC file
+    per partition, with the schema from ``arrow_schema``. Partition columns
+    are encoded in the path, not stored in the files. Files are written under
+    a temporary name and moved into place by ``close``, so readers never see
+    half-written snapshots.
+
+    Every sink names its files ``basename`` plus the format's extension. The
+    default basename is unique per sink (``part-<UTC time>-<random>``), so
+    runs that land in the same partition, e.g. daily snapshots partitioned by
+    ``"year"``, add files next to each other. With a fixed ``basename`` an
+    existing file raises ``FileExistsError`` unless ``overwrite`` is set, in
+    which case re-running a snapshot replaces it.
+
+    ``partition_by`` names model fields; ``"year"`` may also be given for
+    models with a ``date`` field and no ``year`` field, using the first four
+    characters of ``date``. ``partition_values`` adds fixed partitions, e.g.
+    ``{"snapshot": "2024-01-02"}`` for endpoints without a date.
+
+    A sink can be passed to ``download_parts``, or filled by ``write_dataset``.
+
+    Example:
+        with DatasetSink("prices", "eod_bulk", partition_by="date") as sink:
+            for frame in streaming.stream(
+                eod_bulk, apikey=apikey, date=day, chunk_size=50_000,
+                output="pandas",
+            ):
+                sink.write(frame)
+    """
+
+    def __init__(
+        self,
+        root: str,
+        endpoint: typing.Union[str, typing.Callable[..., typing.Any]],
+        partition_by: typing.Optional[typing.Union[str, typing.Sequence[str]]] = None,
+        partition_values: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        format: str = "parquet",
+        basename: typing.Optional[str] = None,
+        overwrite: bool = False,
+    ):
+        """
+        :param root: Dataset root directory
+        :param endpoint: Endpoint function or name whose model gives the schema
+        :param partition_by: Column name(s) to partition rows by
+        :param partition_values: Fixed partition names and values
+        :param format: "parquet" or "arrow" (Arrow IPC file format)
+        :param basename: File name, without extension, inside each partition;
+            unique per sink by default
+        :param overwrite: Replace existing files of the same name instead of
+            raising ``FileExistsError``
+        :raises ValueError: For unknown formats or partition columns
+        :raises ImportError: If pyarrow is not installed
+        """
+        if format not in DATASET_FORMATS:
+            raise ValueError(f"format must be one of {tuple(DATASET_FORMATS)}.")
+        model = _record_model(endpoint)
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        self.partition_by = list(partition_by or [])
+        fields = model.model_fields
+        for column in self.partition_by:
+            derived = column == "year" and "date" in fields
+            if column not in fields and not derived:
+                raise ValueError(f"{model.__name__} has no field {column!r}.")
+        self.partition_values = dict(partition_values or {})
+        self.root = root
+        self.format = format
+        if basename is None:
+            stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+            basename = f"part-{stamp}-{uuid.uuid4().hex[:8]}"
+        self.basename = basename
+        self.overwrite = overwrite
+        self.model = model
+        self._pa = _pyarrow()
+        # Partition columns are encoded in the directory names instead
+        self._dropped = [c for c in self.partition_by if c in fields]
+        self.schema = arrow_schema(model)
+        for column in self._dropped:
+            self.schema = self.schema.remove(self.schema.get_field_index(column))
+        # Object columns that are not declared as strings are stored as JSON
+        dtypes = columnar.field_dtypes(model)
+        self._json_columns = []
+        for name, info in fields.items():
+            declared = (info.annotation, *typing.get_args(info.annotation))
+            if dtypes[name] == "object" and str not in declared:
+                if name not in self._dropped:
+                    self._json_columns.append(name)
+        self._writers: typing.Dict[str, typing.Tuple[typing.Any, str]] = {}
+        self._paths: typing.List[str] = []
+        self._lock = threading.Lock()
+        self.rows = 0
+
+    @property
+    def paths(self) -> typing.List[str]:
+        """
+        Files written, in partition order.
+        """
+        return sorted(self._paths)
+
+    def _directory(self, values: typing.Sequence[typing.Any]) -> str:
+        parts = [
+            f"{quote(str(k), safe='')}={quote(str(v), safe='')}"
+            for k, v in self.partition_values.items()
+        ]
+        for column, value in zip(self.partition_by, values):
+            if value is None or (isinstance(value, float) and value != value):
+                value = NULL_PARTITION
+            parts.append(f"{quote(column, safe='')}={quote(str(value), safe='')}")
+        return os.path.join(self.root, *parts)
+
+    def _writer(self, directory: str) -> typing.Any:
+        entry = self._writers.get(directory)
+        if entry is None:
+            os.makedirs(directory, exist_ok=True)
+            final = os.path.join(
+                directory, self.basename + DATASET_FORMATS[self.format]
+            )
+            if not self.overwrite and os.path.exists(final):
+                raise FileExistsError(
+                    f"{final} already exists; pass overwrite=True to replace it "
+                    "or use another basename."
+                )
+            path = f"{final}.partial"
+            pa = self._pa
+            if self.format == "parquet":
+                writer = pa.parquet.ParquetWriter(path, self.schema)
+            else:
+                writer = pa.ipc.new_file(path, self.schema)
+            entry = self._writers[directory] = (writer, path)
+            self._paths.append(final)
+        return entry[0]
+
+    def _table(self, frame: pd.DataFrame) -> typing.Any:
+        frame = frame.drop(columns=self._dropped)
+        for column in self._json_columns:
+            frame[column] = frame[column].map(
+                lambda v: v if v is None or isinstance(v, str) else json.dumps(v),
+            )
+        return self._pa.Table.from_pandas(
+            frame, schema=self.schema, preserve_index=False
+        )
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """
+        Append a DataFrame with the columns of ``columnar.to_pandas``.
+
+        :param frame: Typed rows, e.g. one chunk from ``streaming.stream``
+        """
+        if frame.empty:
+            return
+        if self.partition_by:
+            keys = [
+                (
+                    frame["date"].astype(object).str[:4]
+                    if column == "year" and column not in frame.columns
+                    else frame[column].astype(object)
+                )
+                for column in self.partition_by
+            ]
+            groups = frame.groupby(keys, sort=False, dropna=False)
+        else:
+            groups = [((), frame)]
+        with self._lock:
+            for values, group in groups:
+                if not isinstance(values, tuple):
+                    values = (values,)
+                self._writer(self._directory(values)).write_table(self._table(group))
+            self.rows += len(frame)
+
+    def __call__(self, part: int, frame: pd.DataFrame) -> None:
+        # download_parts sink interface
+        self.write(frame)
+
+    def close(self) -> None:
+        """
+        Finish every file and move it into place.
+        """
+        with self._lock:
+            for writer, path in self._writers.values():
+                writer.close()
+                os.replace(path, path[: -len(".partial")])
+            self._writers.clear()
+
+    def abort(self) -> None:
+        """
+        Discard every file written so far, leaving existing snapshots alone.
+        """
+        with self._lock:
+            for writer, path in self._writers.values():
+                writer.close()
+                os.remove(path)
+            self._writers.clear()
+            self._paths.clear()
+
+    def __enter__(self) -> "DatasetSink":
+        return self
+
+    def __exit__(self, exc_type: typing.Any, *exc_info: typing.Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_dataset(
+    func: typing.Callable[..., typing.Any],
+    root: str,
+    *args: typing.Any,
+    partition_by: typing.Optional[typing.Union[str, typing.Sequence[str]]] = None,
+    partition_values: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    format: str = "parquet",
+    chunk_size: int = PART_CHUNK_SIZE,
+    basename: typing.Optional[str] = None,
+    overwrite: bool = False,
+    **kwargs: typing.Any,
+) -> typing.List[str]:
+    """
+    Stream a bulk endpoint straight into a partitioned Parquet/Arrow dataset.
+
+    The response is parsed in chunks of ``chunk_size`` rows and written as it
+    arrives, without building model objects (see ``DatasetSink``).
+
+    Example:
+        write_dataset(eod_bulk, "prices", apikey=apikey, date="2024-01-02",
+                      partition_by="date")
+        write_dataset(income_statement_bulk, "income", apikey=apikey,
+                      year="2023", period="FY", partition_by=["fiscalYear", "period"])
+
+    :param func: Bulk endpoint function, e.g. ``eod_bulk``
+    :param root: Dataset root directory
+    :param args: Positional arguments for the endpoint
+    :param partition_by: Column name(s) to partition rows by
+    :param partition_values: Fixed partition names and values
+    :param format: "parquet" or "arrow"
+    :param chunk_size: Rows parsed and written at a time
+    :param basename: File name, without extension, inside each partition;
+        unique per call by default
+    :param overwrite: Replace existing files of the same name
+    :param kwargs: Keyword arguments for the endpoint (e.g. ``apikey``)
+    :return: Paths of the files written
+    """
+    with DatasetSink(
+        root,
+        func,
+        partition_by,
+        partition_values,
+        format=format,
+        basename=basename,
+        overwrite=overwrite,
+    ) as sink:
+        for frame in streaming.stream(
+            func, *args, chunk_size=chunk_size, output="pandas", **kwargs
+        ):
+            sink.write(frame)
+    return sink.paths
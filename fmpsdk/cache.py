@@ -0,0 +1,266 @@
+import contextlib
+import contextvars
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+from urllib.parse import urlencode
+
+from . import decoding
+
+# Default location and size bound of the on-disk response cache.
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "fmpsdk", "responses.sqlite3"
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "fmpsdk_cache_bypass", default=False
+)
+
+
+# Keys of the JSON objects the API answers with (often with HTTP 200) instead
+# of data, e.g. for an invalid API key or an exhausted plan limit.
+ERROR_KEYS = ("Error Message", "Error")
+
+
+def is_cacheable(value: typing.Any) -> bool:
+    """
+    Return True if a decoded response is a successful, non-empty payload.
+
+    Empty results and API error objects are never cached, so a transient
+    failure is not replayed until its TTL runs out.
+    """
+    if not value:
+        return False
+    if isinstance(value, dict) and any(key in value for key in ERROR_KEYS):
+        return False
+    return True
+
+
+def make_key(version: str, path: str, query_vars: typing.Dict) -> str:
+    """
+    Build a cache key from the request, excluding the API key.
+
+    Query variables are sorted so equivalent requests share an entry.
+    """
+    items = sorted(
+        (str(k), str(v))
+        for k, v in query_vars.items()
+        if k != "apikey" and v is not None
+    )
+    return f"{version}/{path}?{urlencode(items)}"
+
+
+class DiskCache:
+    """
+    SQLite-backed response cache with per-entry TTLs and LRU size eviction.
+
+    Values are stored as JSON text. Reads refresh an entry's access time; when
+    the total stored size exceeds ``max_bytes`` the least recently used entries
+    are evicted. The database may be shared by several processes.
+    """
+
+    def __init__(
+        self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def get(self, key: str) -> typing.Any:
+        """
+        Return the cached value for ``key``, or None if absent or expired.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return decoding.loads(value)
+
+    def set(
+        self,
+        key: str,
+        value: typing.Any,
+        ttl: float,
+        endpoint: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Store ``value`` for ``ttl`` seconds, evicting old entries if needed.
+        """
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, payload, size, now + ttl, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self, endpoint: typing.Optional[str] = None) -> None:
+        """
+        Remove every entry, or only the entries of one endpoint.
+        """
+        with self._lock, self._conn:
+            if endpoint is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ?", (endpoint,)
+                )
+
+    def size(self) -> int:
+        """
+        Total stored payload size in bytes.
+        """
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return int(total)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_lock = threading.Lock()
+_cache: typing.Optional[DiskCache] = None
+_ttl_overrides: typing.Dict[str, typing.Optional[float]] = {}
+
+
+def configure_cache(
+    path: str = DEFAULT_CACHE_PATH,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    ttl_overrides: typing.Optional[typing.Dict[str, typing.Optional[float]]] = None,
+) -> DiskCache:
+    """
+    Enable the on-disk response cache.
+
+    :param path: SQLite database file
+    :param max_bytes: Size bound; least recently used entries are evicted beyond it
+    :param ttl_overrides: TTLs in seconds keyed by endpoint function name,
+        merged over ``model_registry.ENDPOINT_CACHE_TTL``. A value of None or 0
+        disables caching for that endpoint.
+    :return: The installed cache
+    """
+    global _cache
+    cache = DiskCache(path, max_bytes)
+    with _lock:
+        previous, _cache = _cache, cache
+        _ttl_overrides.clear()
+        _ttl_overrides.update(ttl_overrides or {})
+    if previous is not None:
+        previous.close()
+    return cache
+
+
+def disable_cache() -> None:
+    """
+    Disable the on-disk response cache.
+    """
+    global _cache
+    with _lock:
+        previous, _cache = _cache, None
+        _ttl_overrides.clear()
+    if previous is not None:
+        previous.close()
+
+
+def get_cache() -> typing.Optional[DiskCache]:
+    """
+    Return the active cache, or None when caching is disabled or bypassed.
+    """
+    if _bypass.get():
+        return None
+    return _cache
+
+
+def ttl_for(endpoint: typing.Optional[str]) -> typing.Optional[float]:
+    """
+    Return the cache TTL in seconds for an endpoint, or None if it is not cached.
+    """
+    from .model_registry import ENDPOINT_CACHE_TTL
+
+    if endpoint is None:
+        return None
+    if endpoint in _ttl_overrides:
+        return _ttl_overrides[endpoint] or None
+    return ENDPOINT_CACHE_TTL.get(endpoint)
+
+
+@contextlib.contextmanager
+def bypass_cache() -> typing.Iterator[None]:
+    """
+    Neither read from nor write to the disk cache inside the ``with`` block.
+
+    Example:
+        with bypass_cache():
+            fresh = fmpsdk.company_profile(apikey=apikey, symbol="AAPL")
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
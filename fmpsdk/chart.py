@@ -1,7 +1,9 @@
+import datetime
 import typing
 
 from pydantic import RootModel
 
+from . import batch
 from .models import (
     FMPHistoricalDataPointAdjusted,
     FMPHistoricalDataPointFull,
@@ -9,7 +11,22 @@ from .models import (
     FMPIntradayDataPoint,
 )
 from .url_methods import __return_json
-from .utils import parse_response
+from .utils import CALL_OPTIONS, parse_response, validate_response
+
+# Calendar days per historical_chart_range request, small enough that the API
+# returns every bar of the window.
+CHART_CHUNK_DAYS = {
+    "1min": 3,
+    "5min": 15,
+    "15min": 45,
+    "30min": 90,
+    "1hour": 180,
+    "4hour": 365,
+}
+
+# Most bars the API returns for one historical_chart request; a window that
+# comes back this full is assumed truncated and fetched again in halves.
+CHART_ROW_LIMIT = 5000
 
 
 @parse_response
@@ -99,7 +116,11 @@ def historical_price_eod_dividend_adjusted(
 
 @parse_response
 def historical_chart(
-    symbol: str, interval: str, apikey: str
+    symbol: str,
+    interval: str,
+    apikey: str,
+    from_date: str = None,
+    to_date: str = None,
 ) -> RootModel[typing.List[FMPIntradayDataPoint]]:
     """
     Get historical intraday chart data for a symbol at a specified interval.
@@ -112,6 +133,10 @@ def historical_chart(
         Interval for the chart. One of: '1min', '5min', '15min', '30min', '1hour', '4hour'.
     apikey : str
         Your FMP API key.
+    from_date : str, optional
+        Start date (YYYY-MM-DD).
+    to_date : str, optional
+        End date (YYYY-MM-DD).
 
     Returns
     -------
@@ -125,4 +150,124 @@ def historical_chart(
         )
     path = f"historical-chart/{interval}"
     query_vars = {"apikey": apikey, "symbol": symbol}
+    if from_date:
+        query_vars["from"] = from_date
+    if to_date:
+        query_vars["to"] = to_date
     return __return_json(path, query_vars)  # type: ignore[no-any-return]
+
+
+def _date_chunks(
+    from_date: str, to_date: str, days: int
+) -> typing.Iterator[typing.Dict[str, str]]:
+    start = datetime.date.fromisoformat(from_date)
+    end = datetime.date.fromisoformat(to_date)
+    if end < start:
+        raise ValueError("to_date must not be before from_date.")
+    while start <= end:
+        stop = min(start + datetime.timedelta(days=days - 1), end)
+        yield {"from_date": start.isoformat(), "to_date": stop.isoformat()}
+        start = stop + datetime.timedelta(days=1)
+
+
+def _split_window(window: typing.Dict[str, str]) -> typing.List[typing.Dict[str, str]]:
+    start = datetime.date.fromisoformat(window["from_date"])
+    end = datetime.date.fromisoformat(window["to_date"])
+    if start == end:
+        return []
+    middle = start + (end - start) // 2
+    return [
+        {"from_date": start.isoformat(), "to_date": middle.isoformat()},
+        {
+            "from_date": (middle + datetime.timedelta(days=1)).isoformat(),
+            "to_date": end.isoformat(),
+        },
+    ]
+
+
+def historical_chart_range(
+    symbol: str,
+    interval: str,
+    apikey: str,
+    from_date: str,
+    to_date: str = None,
+    chunk_days: int = None,
+    max_workers: int = batch.MAX_WORKERS,
+    **options: typing.Any,
+) -> typing.Any:
+    """
+    Get intraday chart data for a date range of any length.
+
+    The API truncates long ``historical_chart`` responses, so the range is
+    split into windows of ``chunk_days`` calendar days (``CHART_CHUNK_DAYS``
+    by default) that are fetched concurrently with ``batch.map_endpoint``,
+    under the shared rate limiter and retry policy. Bars repeated at window
+    boundaries are kept once and the result is one series, newest first like
+    ``historical_chart``. A window that returns ``CHART_ROW_LIMIT`` bars is
+    taken to be truncated and fetched again as two halves, down to single
+    days, so a dense range costs extra requests rather than missing bars.
+
+    Example:
+        bars = historical_chart_range("AAPL", "1min", apikey, "2022-01-01")
+
+    :param symbol: The ticker symbol (e.g., 'AAPL').
+    :param interval: One of '1min', '5min', '15min', '30min', '1hour', '4hour'.
+    :param apikey: Your FMP API key.
+    :param from_date: Start date (YYYY-MM-DD).
+    :param to_date: End date (YYYY-MM-DD), default today.
+    :param chunk_days: Calendar days requested per call.
+    :param max_workers: Number of windows fetched at the same time.
+    :param options: ``output``, ``trusted``, ``validate_sample`` and
+        ``retry_policy``, as for any endpoint.
+    :return: The bars of the whole range, in the requested output form.
+    :raises Exception: The first error of any window; no partial series is
+        returned.
+    """
+    if interval not in CHART_CHUNK_DAYS:
+        raise ValueError(
+            f"Invalid interval: {interval}. Must be one of {list(CHART_CHUNK_DAYS)}."
+        )
+    unknown = set(options) - set(CALL_OPTIONS)
+    if unknown:
+        raise TypeError(f"Unexpected keyword arguments: {sorted(unknown)}")
+    policy = options.pop("retry_policy", None)
+    # Reject bad options before any request is sent
+    validate_response("historical_chart", [], **options)
+    days = chunk_days or CHART_CHUNK_DAYS[interval]
+    if days < 1:
+        raise ValueError("chunk_days must be at least 1.")
+    to_date = to_date or datetime.date.today().isoformat()
+
+    bars: typing.Dict[str, typing.Any] = {}
+    windows = list(_date_chunks(from_date, to_date, days))
+    while windows:
+        truncated: typing.List[typing.Dict[str, str]] = []
+        for item in batch.map_endpoint(
+            historical_chart,
+            windows,
+            max_workers=max_workers,
+            ordered=True,
+            symbol=symbol,
+            interval=interval,
+            apikey=apikey,
+            output="raw",
+            retry_policy=policy,
+        ):
+            if not item.ok:
+                raise item.error  # type: ignore[misc]
+            window = item.result
+            if isinstance(window, dict):
+                if "Error Message" in window:
+                    raise Exception(
+                        f"API request failed with error: {window['Error Message']}",
+                        window,
+                    )
+                # Empty objects are how the API reports no data
+                window = []
+            if len(window or []) >= CHART_ROW_LIMIT:
+                truncated.extend(_split_window(item.params))
+            for bar in window or []:
+                bars[bar["date"]] = bar
+        windows = truncated
+    series = [bars[date] for date in sorted(bars, reverse=True)]
+    return validate_response("historical_chart", series, **options)
@@ -0,0 +1,180 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, RootModel
+
+# Output modes accepted by every endpoint through ``output=``.
+OUTPUT_MODES = ("models", "raw", "columns", "pandas", "series")
+
+_NUMERIC_DTYPES = {float: "float64", int: "Int64", bool: "boolean"}
+
+
+def record_model(model: typing.Any) -> typing.Optional[typing.Type[BaseModel]]:
+    """
+    Return X for a ``RootModel[List[X]]`` whose items are models, else None.
+    """
+    if not (isinstance(model, type) and issubclass(model, RootModel)):
+        return None
+    annotation = model.model_fields["root"].annotation
+    args = typing.get_args(annotation)
+    if typing.get_origin(annotation) is list and args:
+        item = args[0]
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item
+    return None
+
+
+def _scalar_type(annotation: typing.Any) -> typing.Any:
+    """
+    Strip ``Optional[...]`` from an annotation.
+    """
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def field_dtypes(model: typing.Type[BaseModel]) -> typing.Dict[str, str]:
+    """
+    Map each field of a record model to the pandas dtype used for its column.
+
+    ``float`` fields become ``float64``; ``int`` and ``bool`` fields use the
+    nullable ``Int64``/``boolean`` dtypes so missing values survive; strings
+    and everything else are left as objects.
+    """
+    return {
+        name: _NUMERIC_DTYPES.get(_scalar_type(info.annotation), "object")
+        for name, info in model.model_fields.items()
+    }
+
+
+def _convert_column(column: pd.Series, dtype: str) -> pd.Series:
+    # FMPBaseModel turns "None" strings into None; do the same per column
+    column = column.mask(column.astype(object) == "None")
+    if dtype == "float64":
+        return pd.to_numeric(column, errors="coerce").astype("float64")
+    if dtype == "Int64":
+        return pd.to_numeric(column, errors="coerce").astype("Int64")
+    if dtype == "boolean":
+        if column.dtype != bool:
+            column = column.map(
+                lambda v: v if not isinstance(v, str) else v.lower() == "true",
+                na_action="ignore",
+            )
+        return column.astype("boolean")
+    return column.astype(object).where(column.notna(), None)
+
+
+def to_pandas(raw: typing.Any, model: typing.Any) -> pd.DataFrame:
+    """
+    Build a DataFrame straight from a decoded response, without model objects.
+
+    Columns follow the registered model's fields (named like ``model_dump``
+    output) with dtypes from ``field_dtypes``; numeric values that cannot be
+    parsed become missing. Responses of endpoints without a record model are
+    passed to ``pandas.DataFrame`` unchanged.
+
+    :param raw: Decoded JSON/CSV response (a list of dictionaries)
+    :param model: Model registered for the endpoint
+    :return: DataFrame with one row per record
+    """
+    item_model = record_model(model)
+    if raw is None:
+        raw = []
+    if isinstance(raw, dict):
+        raw = [raw]
+    if item_model is None:
+        return pd.DataFrame(raw)
+
+    keys = [info.alias or name for name, info in item_model.model_fields.items()]
+    return convert_frame(pd.DataFrame.from_records(raw, columns=keys), model)
+
+
+def convert_frame(frame: pd.DataFrame, model: typing.Any) -> pd.DataFrame:
+    """
+    Type the columns of a DataFrame of response values, one column at a time.
+
+    ``frame`` has one column per response key (e.g. strings read from a CSV
+    chunk); the result has the columns and dtypes ``to_pandas`` produces.
+    Keys missing from ``frame`` give empty columns and unknown keys are
+    dropped. Frames for endpoints without a record model are returned as is.
+
+    :param frame: Untyped response values, columns named by response keys
+    :param model: Model registered for the endpoint
+    :return: DataFrame with one typed column per model field
+    """
+    item_model = record_model(model)
+    if item_model is None:
+        return frame
+    dtypes = field_dtypes(item_model)
+    columns = {}
+    for name, info in item_model.model_fields.items():
+        key = info.alias or name
+        if key in frame.columns:
+            column = frame[key]
+        else:
+            column = pd.Series(None, index=frame.index, dtype=object)
+        columns[name] = _convert_column(column, dtypes[name])
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def to_columns(raw: typing.Any, model: typing.Any) -> typing.Dict[str, np.ndarray]:
+    """
+    Build NumPy column arrays straight from a decoded response.
+
+    Float columns are ``float64`` with NaN for missing values; integer columns
+    are ``int64``, or ``float64`` if any value is missing; other columns are
+    object arrays with None for missing values.
+
+    :param raw: Decoded JSON/CSV response (a list of dictionaries)
+    :param model: Model registered for the endpoint
+    :return: Mapping of field name to column array
+    """
+    return frame_columns(to_pandas(raw, model))
+
+
+def frame_columns(frame: pd.DataFrame) -> typing.Dict[str, np.ndarray]:
+    """
+    Turn a DataFrame built by ``to_pandas``/``convert_frame`` into the NumPy
+    column mapping returned by ``to_columns``.
+    """
+    columns = {}
+    for name, column in frame.items():
+        if column.dtype == "Int64":
+            if column.hasnans:
+                columns[name] = column.to_numpy(dtype="float64", na_value=np.nan)
+            else:
+                columns[name] = column.to_numpy(dtype="int64")
+        elif column.dtype == "boolean":
+            if column.hasnans:
+                columns[name] = column.to_numpy(dtype=object, na_value=None)
+            else:
+                columns[name] = column.to_numpy(dtype=bool)
+        else:
+            columns[name] = column.to_numpy()
+    return columns
+
+
+def convert_output(raw: typing.Any, model: typing.Any, output: str) -> typing.Any:
+    """
+    Convert a decoded response for a non-model output mode.
+
+    :param raw: Decoded JSON/CSV response
+    :param model: Model registered for the endpoint
+    :param output: "raw", "columns", "pandas" or "series"
+    :return: ``raw`` unchanged, a mapping of column arrays, a DataFrame, or a
+        ``fmpsdk.series.PriceSeries``
+    """
+    if output == "raw":
+        return raw
+    if output == "columns":
+        return to_columns(raw, model)
+    if output == "pandas":
+        return to_pandas(raw, model)
+    if output == "series":
+        from .series import PriceSeries
+
+        return PriceSeries.from_records(raw, model)
+    raise ValueError(f"output must be one of {OUTPUT_MODES}, not {output!r}.")
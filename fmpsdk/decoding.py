@@ -0,0 +1,120 @@
+import json
+import typing
+
+# Decoders tried in order when none is configured; "json" is the stdlib
+# fallback and always available.
+DECODERS = ("orjson", "msgspec", "ujson", "json")
+
+Decoder = typing.Callable[[typing.Union[bytes, str]], typing.Any]
+
+
+def _stdlib_decoder() -> Decoder:
+    return json.loads
+
+
+def _orjson_decoder() -> Decoder:
+    import orjson
+
+    orjson_loads = orjson.loads
+
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+    def loads(data: typing.Union[bytes, str]) -> typing.Any:
+        if isinstance(data, bytes) and type(data) is not bytes:
+            # orjson rejects bytes subclasses; a memoryview avoids a copy
+            return orjson_loads(memoryview(data))
+        return orjson_loads(data)
+
+    return loads
+
+
+def _msgspec_decoder() -> Decoder:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+
+    def loads(data: typing.Union[bytes, str]) -> typing.Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), _as_text(data), 0) from e
+
+    return loads
+
+
+def _ujson_decoder() -> Decoder:
+    import ujson  # type: ignore[import-untyped]
+
+    def loads(data: typing.Union[bytes, str]) -> typing.Any:
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), _as_text(data), 0) from e
+
+    return loads
+
+
+def _as_text(data: typing.Union[bytes, str]) -> str:
+    if isinstance(data, str):
+        return data
+    return bytes(data).decode("utf-8", errors="replace")
+
+
+_FACTORIES: typing.Dict[str, typing.Callable[[], Decoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "ujson": _ujson_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def _detect() -> typing.Tuple[str, Decoder]:
+    for name in DECODERS:
+        try:
+            return name, _FACTORIES[name]()
+        except ImportError:
+            continue
+    return "json", json.loads  # pragma: no cover - stdlib is always last
+
+
+_name, _loads = _detect()
+
+
+def set_json_decoder(
+    decoder: typing.Optional[typing.Union[str, Decoder]] = None,
+) -> None:
+    """
+    Choose the function used to decode JSON response bodies.
+
+    :param decoder: One of ``DECODERS``, a callable taking ``bytes`` (or
+        ``str``) and returning the decoded object, or None to pick the fastest
+        installed library again
+    :raises ValueError: If ``decoder`` is an unknown name
+    :raises ImportError: If the named library is not installed
+    """
+    global _name, _loads
+    if decoder is None:
+        _name, _loads = _detect()
+    elif callable(decoder):
+        _name, _loads = getattr(decoder, "__name__", "custom"), decoder
+    elif decoder in _FACTORIES:
+        _name, _loads = decoder, _FACTORIES[decoder]()
+    else:
+        raise ValueError(f"decoder must be one of {DECODERS} or a callable.")
+
+
+def get_json_decoder() -> str:
+    """
+    Return the name of the JSON decoder in use.
+    """
+    return _name
+
+
+def loads(data: typing.Union[bytes, str]) -> typing.Any:
+    """
+    Decode a JSON document with the configured decoder.
+
+    :param data: JSON text as bytes (or str)
+    :return: The decoded object
+    :raises json.JSONDecodeError: If ``data`` is not valid JSON
+    """
+    return _loads(data)
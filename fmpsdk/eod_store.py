@@ -0,0 +1,449 @@
+import datetime
+import os
+import shutil
+import threading
+import typing
+
+import numpy as np
+import pandas as pd
+
+from . import batch, streaming
+from .bulk import eod_bulk
+from .model_registry import get_validator
+
+# Price columns kept for every (symbol, date), as in FMPBulkEOD.
+FIELDS = ("open", "high", "low", "close", "adjClose", "volume")
+
+# Layout of base.npy: one record per (symbol, date), grouped by symbol.
+RECORD_DTYPE = np.dtype([("date", "M8[D]")] + [(f, "f8") for f in FIELDS])
+
+# Layout of a pending day file: one record per symbol id, sorted by id.
+DAY_DTYPE = np.dtype([("symbol", "i4")] + [(f, "f8") for f in FIELDS])
+
+# Pending days merged into the base by EODStore.update.
+COMPACT_AFTER = 20
+
+# Records merged in memory at a time by EODStore.compact.
+COMPACT_BLOCK_ROWS = 1_000_000
+
+# Rows parsed at a time while a day is downloaded.
+DAY_CHUNK_SIZE = 50_000
+
+
+class UpdateResult(typing.NamedTuple):
+    """
+    Days loaded and failed by ``EODStore.update``.
+    """
+
+    loaded: typing.List[str]
+    failed: typing.Dict[str, BaseException]
+
+
+def _fetch_day(date: str, apikey: str) -> pd.DataFrame:
+    frames = list(
+        streaming.stream(
+            eod_bulk,
+            apikey=apikey,
+            date=date,
+            chunk_size=DAY_CHUNK_SIZE,
+            output="pandas",
+        )
+    )
+    if not frames:
+        return pd.DataFrame(columns=["symbol", *FIELDS])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _read_lines(path: str) -> typing.List[str]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as fh:
+        return [line.rstrip("\n") for line in fh if line.strip()]
+
+
+def _save(path: str, array: np.ndarray) -> None:
+    partial = f"{path}.partial"
+    with open(partial, "wb") as fh:
+        np.save(fh, array)
+    os.replace(partial, path)
+
+
+class EODStore:
+    """
+    Local end-of-day OHLCV store keyed by (symbol, date).
+
+    The store fills itself from ``eod_bulk`` one day per request and answers
+    ``historical_price_eod``-style queries from memory-mapped NumPy files, so
+    history that is already held never hits the API again.
+
+    On disk, compacted history lives in ``base.npy`` (records grouped by
+    symbol and sorted by date) with ``offsets.npy`` giving each symbol's
+    slice, so a symbol's history is one contiguous read. Days loaded since
+    the last compaction are kept as ``pending/<date>.npy`` files, sorted by
+    symbol, and merged into query results by binary search. ``symbols.txt``,
+    ``days.txt`` and ``empty.txt`` (past days that came back without prices)
+    are only ever appended to.
+
+    Example:
+        store = EODStore("~/fmp-eod")
+        store.update(apikey, start="2015-01-01")
+        prices = store.history("AAPL", from_date="2024-01-01")
+        prices["close"]
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Store directory; created if it does not exist
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.join(self.path, "pending"), exist_ok=True)
+        self._lock = threading.RLock()
+        self._symbols = _read_lines(self._file("symbols.txt"))
+        self._ids = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._days = set(_read_lines(self._file("days.txt")))
+        # Days listed as empty but loaded with prices since then are not empty
+        self._empty = set(_read_lines(self._file("empty.txt"))) - self._days
+        self._open_base()
+        self._pending: typing.Dict[str, np.ndarray] = {}
+        for name in sorted(os.listdir(os.path.join(self.path, "pending"))):
+            if name.endswith(".npy"):
+                day = name[: -len(".npy")]
+                self._pending[day] = np.load(self._file("pending", name), mmap_mode="r")
+
+    def _file(self, *parts: str) -> str:
+        return os.path.join(self.path, *parts)
+
+    def _open_base(self) -> None:
+        if os.path.exists(self._file("base.npy")):
+            self._base = np.load(self._file("base.npy"), mmap_mode="r")
+            self._offsets = np.load(self._file("offsets.npy"))
+        else:
+            self._base = np.empty(0, RECORD_DTYPE)
+            self._offsets = np.zeros(1, np.int64)
+
+    @property
+    def symbols(self) -> typing.List[str]:
+        """
+        Every symbol seen so far.
+        """
+        return list(self._symbols)
+
+    @property
+    def days(self) -> typing.List[str]:
+        """
+        Loaded days (YYYY-MM-DD), including past days without any prices.
+        """
+        return sorted(self._days | self._empty)
+
+    @property
+    def empty_days(self) -> typing.List[str]:
+        """
+        Past weekdays that were loaded without any prices, e.g. holidays.
+        """
+        return sorted(self._empty)
+
+    def missing_days(
+        self,
+        start: str,
+        end: typing.Optional[str] = None,
+        include_empty: bool = False,
+    ) -> typing.List[str]:
+        """
+        Weekdays between ``start`` and ``end`` (inclusive) not loaded yet.
+
+        :param start: First day (YYYY-MM-DD)
+        :param end: Last day, default today
+        :param include_empty: Also return days that were loaded without prices
+        :return: Missing days in ascending order
+        """
+        end = end or datetime.date.today().isoformat()
+        skip = self._days if include_empty else self._days | self._empty
+        return [
+            day.strftime("%Y-%m-%d")
+            for day in pd.bdate_range(start, end)
+            if day.strftime("%Y-%m-%d") not in skip
+        ]
+
+    def _symbol_ids(self, symbols: typing.Sequence[str]) -> np.ndarray:
+        new = [s for s in dict.fromkeys(symbols) if s not in self._ids]
+        if new:
+            # Symbols must be on disk before any day file refers to their ids
+            with open(self._file("symbols.txt"), "a", encoding="utf-8") as fh:
+                fh.write("".join(f"{s}\n" for s in new))
+            for symbol in new:
+                self._ids[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+        return np.fromiter((self._ids[s] for s in symbols), np.int32, len(symbols))
+
+    def add_day(self, date: str, prices: typing.Any) -> int:
+        """
+        Store one day of prices, replacing any already stored for that day.
+
+        A day without prices before today is remembered in ``empty_days``
+        (usually a holiday) and skipped by ``update`` unless it is asked to
+        refetch empty days; one from today on is not recorded, so ``update``
+        requests it again.
+
+        :param date: Day the prices belong to (YYYY-MM-DD)
+        :param prices: DataFrame or mapping of columns with a ``symbol``
+            column and the ``FIELDS`` columns, e.g. ``eod_bulk`` output
+        :return: Number of symbols stored for the day
+        """
+        date = pd.Timestamp(date).strftime("%Y-%m-%d")
+        symbols = [str(s) for s in prices["symbol"]]
+        with self._lock:
+            records = np.empty(len(symbols), DAY_DTYPE)
+            records["symbol"] = self._symbol_ids(symbols)
+            for field in FIELDS:
+                if field in prices:
+                    values = pd.to_numeric(pd.Series(prices[field]), errors="coerce")
+                    records[field] = values.to_numpy(dtype="f8", na_value=np.nan)
+                else:
+                    records[field] = np.nan
+            # Keep the last row of duplicated symbols, sorted by id
+            order = np.argsort(records["symbol"], kind="stable")[::-1]
+            _, first = np.unique(records["symbol"][order], return_index=True)
+            records = records[order[first]]
+            if not len(records) and date >= datetime.date.today().isoformat():
+                # The API may not have published the day yet; fetch it again later
+                return 0
+            if not len(records):
+                if date not in self._days and date not in self._empty:
+                    with open(self._file("empty.txt"), "a", encoding="utf-8") as fh:
+                        fh.write(f"{date}\n")
+                    self._empty.add(date)
+                return 0
+            _save(self._file("pending", f"{date}.npy"), records)
+            self._pending[date] = records
+            if date not in self._days:
+                with open(self._file("days.txt"), "a", encoding="utf-8") as fh:
+                    fh.write(f"{date}\n")
+                self._days.add(date)
+            self._empty.discard(date)
+        return len(records)
+
+    def update(
+        self,
+        apikey: str,
+        start: str,
+        end: typing.Optional[str] = None,
+        max_workers: int = batch.MAX_WORKERS,
+        refetch_empty: bool = False,
+    ) -> UpdateResult:
+        """
+        Download every missing weekday in a range from ``eod_bulk``.
+
+        Days are fetched concurrently with ``batch.map_endpoint`` and stored
+        as they arrive; weekends are skipped and holidays are remembered as
+        empty days. A day from today on that has no prices yet is neither
+        remembered nor reported as loaded. Pending days are compacted at the
+        end once there are at least ``COMPACT_AFTER`` of them.
+
+        An empty reply for a past weekday may also come from a transient API
+        or plan problem rather than a holiday; pass ``refetch_empty=True`` to
+        request every day in ``empty_days`` again.
+
+        :param apikey: Your FMP API key
+        :param start: First day (YYYY-MM-DD)
+        :param end: Last day, default today
+        :param max_workers: Number of days downloaded at the same time
+        :param refetch_empty: Also request days stored without any prices
+        :return: Days loaded, and the error for every day that failed
+        """
+        loaded: typing.List[str] = []
+        failed: typing.Dict[str, BaseException] = {}
+        for item in batch.map_endpoint(
+            _fetch_day,
+            (
+                {"date": day}
+                for day in self.missing_days(start, end, include_empty=refetch_empty)
+            ),
+            max_workers=max_workers,
+            apikey=apikey,
+        ):
+            if item.ok:
+                self.add_day(item.params["date"], item.result)
+                date = item.params["date"]
+                if date in self._days or date in self._empty:
+                    loaded.append(date)
+            else:
+                failed[item.params["date"]] = item.error  # type: ignore[assignment]
+        if len(self._pending) >= COMPACT_AFTER:
+            self.compact()
+        return UpdateResult(sorted(loaded), failed)
+
+    def compact(self) -> None:
+        """
+        Merge pending days into the symbol-major base files.
+
+        Symbols are merged in blocks of about ``COMPACT_BLOCK_ROWS`` records
+        and streamed to the new base file, so memory use does not grow with
+        the size of the store.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            days = sorted(self._pending)
+            offsets = np.zeros(len(self._symbols) + 1, np.int64)
+            total = 0
+            data_path = self._file("base.npy.data")
+            with open(data_path, "wb") as data:
+                for lo, hi in self._compact_blocks(len(days)):
+                    ids, merged = self._merge_block(lo, hi, days)
+                    ends = np.searchsorted(ids, np.arange(lo + 1, hi + 1))
+                    offsets[lo + 1 : hi + 1] = total + ends
+                    data.write(merged.tobytes())
+                    total += len(merged)
+
+            partial = self._file("base.npy.partial")
+            with open(partial, "wb") as fh:
+                np.lib.format.write_array_header_1_0(
+                    fh,
+                    {
+                        "descr": np.lib.format.dtype_to_descr(RECORD_DTYPE),
+                        "fortran_order": False,
+                        "shape": (total,),
+                    },
+                )
+                with open(data_path, "rb") as data:
+                    shutil.copyfileobj(data, fh)
+            os.remove(data_path)
+            os.replace(partial, self._file("base.npy"))
+            _save(self._file("offsets.npy"), offsets)
+            for day in self._pending:
+                os.remove(self._file("pending", f"{day}.npy"))
+            self._pending = {}
+            self._open_base()
+
+    def _compact_blocks(self, pending: int) -> typing.Iterator[typing.Tuple[int, int]]:
+        """
+        Split symbol ids into ranges holding about ``COMPACT_BLOCK_ROWS``
+        records, counting one pending record per symbol and pending day.
+        """
+        count = len(self._symbols)
+        stored = len(self._offsets) - 1
+        ids = np.arange(count + 1)
+        rows = self._offsets[np.minimum(ids, stored)] + ids * pending
+        lo = 0
+        while lo < count:
+            hi = int(np.searchsorted(rows, rows[lo] + COMPACT_BLOCK_ROWS, "right")) - 1
+            hi = min(max(hi, lo + 1), count)
+            yield lo, hi
+            lo = hi
+
+    def _merge_block(
+        self, lo: int, hi: int, days: typing.List[str]
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Merge the base and pending records of symbol ids ``lo`` to ``hi``.
+
+        :return: Symbol ids and records, sorted by symbol and date
+        """
+        stored = len(self._offsets) - 1
+        first, last = min(lo, stored), min(hi, stored)
+        counts = np.diff(self._offsets[first : last + 1])
+        ids = [np.repeat(np.arange(first, last, dtype=np.int32), counts)]
+        parts = [np.asarray(self._base[self._offsets[first] : self._offsets[last]])]
+        for day in days:
+            records = self._pending[day]
+            start, stop = np.searchsorted(records["symbol"], [lo, hi])
+            part = np.empty(stop - start, RECORD_DTYPE)
+            part["date"] = np.datetime64(day, "D")
+            for field in FIELDS:
+                part[field] = records[field][start:stop]
+            ids.append(np.asarray(records["symbol"][start:stop]))
+            parts.append(part)
+        ids_all = np.concatenate(ids)
+        merged = np.concatenate(parts)
+        # Later parts win for a (symbol, date) stored twice
+        sequence = np.arange(len(merged))
+        order = np.lexsort((sequence, merged["date"], ids_all))
+        ids_all, merged = ids_all[order], merged[order]
+        last_row = np.ones(len(merged), bool)
+        last_row[:-1] = (ids_all[1:] != ids_all[:-1]) | (
+            merged["date"][1:] != merged["date"][:-1]
+        )
+        return ids_all[last_row], merged[last_row]
+
+    def history(
+        self,
+        symbol: str,
+        from_date: typing.Optional[str] = None,
+        to_date: typing.Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Return a symbol's stored prices in ascending date order.
+
+        :param symbol: Ticker symbol
+        :param from_date: Optional first day (YYYY-MM-DD)
+        :param to_date: Optional last day (YYYY-MM-DD)
+        :return: Structured array with ``date`` and ``FIELDS`` columns; a
+            read-only view of the memory-mapped base when no pending day
+            holds the symbol
+        """
+        rows: np.ndarray
+        with self._lock:
+            sid = self._ids.get(symbol)
+            if sid is None:
+                return np.empty(0, RECORD_DTYPE)
+            if sid + 1 < len(self._offsets):
+                rows = self._base[self._offsets[sid] : self._offsets[sid + 1]]
+            else:
+                rows = self._base[:0]
+            extra = []
+            for day, records in self._pending.items():
+                i = np.searchsorted(records["symbol"], sid)
+                if i < len(records) and records["symbol"][i] == sid:
+                    extra.append((day, records[i]))
+        if extra:
+            added = np.empty(len(extra), RECORD_DTYPE)
+            for j, (day, record) in enumerate(extra):
+                added[j]["date"] = np.datetime64(day, "D")
+                for field in FIELDS:
+                    added[j][field] = record[field]
+            # Pending days replace the same day in the base
+            rows = rows[~np.isin(rows["date"], added["date"])]
+            rows = np.concatenate([rows, added])
+            rows = rows[np.argsort(rows["date"], kind="stable")]
+        dates = rows["date"]
+        lo = (
+            0 if from_date is None else np.searchsorted(dates, np.datetime64(from_date))
+        )
+        hi = (
+            len(rows)
+            if to_date is None
+            else np.searchsorted(dates, np.datetime64(to_date), side="right")
+        )
+        return rows[lo:hi]
+
+    def historical_price_eod(
+        self,
+        symbol: str,
+        from_date: typing.Optional[str] = None,
+        to_date: typing.Optional[str] = None,
+    ) -> typing.Any:
+        """
+        Answer a ``chart.historical_price_eod`` query from the store.
+
+        Records are newest first, like the API; fields the store does not
+        hold (``change``, ``changePercent``, ``vwap``) are None.
+
+        :param symbol: Ticker symbol
+        :param from_date: Optional first day (YYYY-MM-DD)
+        :param to_date: Optional last day (YYYY-MM-DD)
+        :return: The model ``historical_price_eod`` returns
+        """
+        rows = self.history(symbol, from_date, to_date)[::-1]
+        dates = np.datetime_as_string(rows["date"], unit="D")
+        columns = {f: rows[f].tolist() for f in ("open", "high", "low", "close")}
+        volume = rows["volume"].tolist()
+        records = [
+            {
+                "symbol": symbol,
+                "date": date,
+                **{f: None if v != v else v for f, v in zip(columns, values)},
+                "volume": None if vol != vol else vol,
+            }
+            for date, vol, *values in zip(dates.tolist(), volume, *columns.values())
+        ]
+        return get_validator("historical_price_eod").validate_python(records)
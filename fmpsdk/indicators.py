@@ -0,0 +1,760 @@
+import abc
+import collections
+import math
+import typing
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from pydantic import RootModel
+
+from .models import FMPTechnicalIndicator
+from .series import PriceSeries
+
+# Indicators accepted by technical_indicators.technical_indicators.
+INDICATORS = (
+    "sma",
+    "ema",
+    "wma",
+    "dema",
+    "tema",
+    "rsi",
+    "standarddeviation",
+    "williams",
+    "adx",
+)
+
+# FMPTechnicalIndicator field holding each indicator's value.
+FIELD_NAMES = {name: name for name in INDICATORS}
+FIELD_NAMES["standarddeviation"] = "standardDeviation"
+
+# Indicators that need high and low prices as well as closes.
+RANGE_INDICATORS = ("williams", "adx")
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class PriceArrays(typing.NamedTuple):
+    """
+    Price histories of several symbols as aligned 2-D arrays.
+
+    Row ``i`` holds ``symbols[i]`` in ascending date order, right-aligned so
+    the latest bar of every symbol is in the last column; shorter histories
+    are padded on the left with NaN prices and None dates.
+    """
+
+    symbols: typing.List[str]
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+def _shift(values: np.ndarray, count: int) -> np.ndarray:
+    """Delay values by ``count`` bars along the last axis, NaN-filled."""
+    shifted = np.full(values.shape, np.nan)
+    if count < values.shape[-1]:
+        shifted[..., count:] = values[..., : values.shape[-1] - count]
+    return shifted
+
+
+def _rolling(values: np.ndarray, period: int, reduce: typing.Callable) -> np.ndarray:
+    """Apply ``reduce(windows)`` over trailing windows of ``period`` bars."""
+    result = np.full(values.shape, np.nan)
+    if period <= values.shape[-1]:
+        windows = sliding_window_view(values, period, axis=-1)
+        result[..., period - 1 :] = reduce(windows)
+    return result
+
+
+def _rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Population standard deviation over trailing windows of ``period`` bars.
+
+    Uses running sums of x and x² (var = E[x²] - E[x]²) instead of window
+    views, so memory stays proportional to the input whatever the period.
+    Each row is shifted by its mean first to limit cancellation; windows that
+    include a NaN are NaN.
+    """
+    result = np.full(values.shape, np.nan)
+    if period > values.shape[-1]:
+        return result
+    missing = np.isnan(values)
+    counts = np.maximum((~missing).sum(axis=-1, keepdims=True), 1)
+    shift = np.where(missing, 0.0, values).sum(axis=-1, keepdims=True) / counts
+    x = np.where(missing, 0.0, values - shift)
+    zeros = np.zeros(values.shape[:-1] + (1,))
+
+    def window_sums(a: np.ndarray) -> np.ndarray:
+        total = np.concatenate([zeros, np.cumsum(a, axis=-1)], axis=-1)
+        sums: np.ndarray = total[..., period:] - total[..., :-period]
+        return sums
+
+    mean = window_sums(x) / period
+    variance = window_sums(x * x) / period - mean * mean
+    std = np.sqrt(np.maximum(variance, 0.0))
+    std[window_sums(missing.astype(float)) > 0] = np.nan
+    result[..., period - 1 :] = std
+    return result
+
+
+def _sma(values: np.ndarray, period: int) -> np.ndarray:
+    return _rolling(values, period, lambda w: w.mean(axis=-1))
+
+
+def _smooth(values: np.ndarray, periods: np.ndarray, wilder: bool) -> np.ndarray:
+    """
+    Exponential smoothing of each row with its own period.
+
+    Each row is seeded with the simple average of its first full window and
+    then updated with ``alpha = 2 / (period + 1)``, or ``1 / period`` for
+    Wilder's smoothing (RSI, ADX). Rows are updated together, one bar at a
+    time, so many symbols and periods cost a single pass over the bars.
+    """
+    seeds = np.full(values.shape, np.nan)
+    for period in np.unique(periods):
+        rows = periods == period
+        seeds[rows] = _sma(values[rows], int(period))
+    alpha = 1.0 / periods if wilder else 2.0 / (periods + 1.0)
+
+    values = np.asfortranarray(values)
+    seeds = np.asfortranarray(seeds)
+    result = np.empty(values.shape, order="F")
+    current = seeds[:, 0]
+    result[:, 0] = current
+    for t in range(1, values.shape[1]):
+        updated = current + alpha * (values[:, t] - current)
+        current = np.where(np.isnan(current), seeds[:, t], updated)
+        result[:, t] = current
+    return np.ascontiguousarray(result)
+
+
+def _ema(values: np.ndarray, periods: np.ndarray, wilder: bool = False) -> np.ndarray:
+    """
+    Smooth (rows, bars) values once per period, returning (periods, rows,
+    bars); values already shaped (periods, rows, bars) are smoothed with the
+    matching period.
+    """
+    shape = (len(periods),) + values.shape[-2:]
+    flat = np.broadcast_to(values, shape).reshape(-1, shape[-1])
+    per_row = np.repeat(periods, shape[1]).astype(float)
+    return _smooth(flat, per_row, wilder).reshape(shape)
+
+
+def _compute(
+    indicator: str,
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    periods: np.ndarray,
+) -> np.ndarray:
+    """Compute one indicator over (rows, bars) arrays for every period."""
+    if indicator == "sma":
+        return np.stack([_sma(close, p) for p in periods])
+    if indicator == "wma":
+        return np.stack(
+            [
+                _rolling(
+                    close,
+                    p,
+                    lambda w, p=p: w @ np.arange(1.0, p + 1) / (p * (p + 1) / 2),
+                )
+                for p in periods
+            ]
+        )
+    if indicator == "standarddeviation":
+        return np.stack([_rolling_std(close, p) for p in periods])
+    if indicator == "williams":
+        highest = np.stack(
+            [_rolling(high, p, lambda w: w.max(axis=-1)) for p in periods]
+        )
+        lowest = np.stack([_rolling(low, p, lambda w: w.min(axis=-1)) for p in periods])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            williams: np.ndarray = -100.0 * (highest - close) / (highest - lowest)
+        return williams
+    if indicator in ("ema", "dema", "tema"):
+        ema = _ema(close, periods)
+        if indicator == "ema":
+            return ema
+        ema2 = _ema(ema, periods)
+        if indicator == "dema":
+            dema: np.ndarray = 2.0 * ema - ema2
+            return dema
+        ema3 = _ema(ema2, periods)
+        tema: np.ndarray = 3.0 * ema - 3.0 * ema2 + ema3
+        return tema
+    if indicator == "rsi":
+        change = close - _shift(close, 1)
+        # The first bar has no change; keep it out of the seed window
+        gains = np.where(np.isnan(change), np.nan, np.maximum(change, 0.0))
+        losses = np.where(np.isnan(change), np.nan, np.maximum(-change, 0.0))
+        average_gain = _ema(gains, periods, wilder=True)
+        average_loss = _ema(losses, periods, wilder=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100.0 - 100.0 / (1.0 + average_gain / average_loss)
+        return np.where(average_loss == 0.0, 100.0, rsi)
+    if indicator == "adx":
+        previous_close = _shift(close, 1)
+        up = high - _shift(high, 1)
+        down = _shift(low, 1) - low
+        true_range = np.fmax(high, previous_close) - np.fmin(low, previous_close)
+        true_range[np.isnan(previous_close)] = np.nan
+        plus = np.where((up > down) & (up > 0), up, 0.0)
+        minus = np.where((down > up) & (down > 0), down, 0.0)
+        plus[np.isnan(true_range)] = minus[np.isnan(true_range)] = np.nan
+        average_range = _ema(true_range, periods, wilder=True)
+        # Flat bars have no direction: their DI and DX are 0, not 0 / 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plus_di = _ema(plus, periods, wilder=True) / average_range
+            minus_di = _ema(minus, periods, wilder=True) / average_range
+            plus_di[average_range == 0.0] = minus_di[average_range == 0.0] = 0.0
+            total = plus_di + minus_di
+            dx = np.where(total == 0.0, 0.0, 100.0 * np.abs(plus_di - minus_di) / total)
+        return _ema(dx, periods, wilder=True)
+    raise ValueError(
+        f"Invalid indicator type. Valid types are: {', '.join(INDICATORS)}"
+    )
+
+
+def compute(
+    indicator: str,
+    close: typing.Any,
+    periodLength: typing.Union[int, typing.Sequence[int]],
+    high: typing.Any = None,
+    low: typing.Any = None,
+) -> np.ndarray:
+    """
+    Compute a technical indicator locally over price arrays.
+
+    Prices are in ascending date order along the last axis; a 2-D array
+    computes every row (symbol) at once, and a sequence of period lengths
+    computes every lookback in the same pass. Bars before an indicator has
+    a full lookback are NaN.
+
+    Moving averages follow the usual definitions: EMA-based indicators
+    (``ema``, ``dema``, ``tema``) are seeded with the simple average of the
+    first window, ``rsi`` and ``adx`` use Wilder's smoothing, and
+    ``standarddeviation`` is the population deviation of closes. The API
+    seeds from history before the requested range, so exponential indicators
+    only agree with its values once the seed has decayed - allow several
+    lookbacks (more for ``tema`` and ``adx``) of extra history.
+
+    :param indicator: One of ``INDICATORS``
+    :param close: Closing prices, shape (bars,) or (symbols, bars)
+    :param periodLength: Lookback, or a sequence of lookbacks
+    :param high: High prices, required for ``williams`` and ``adx``
+    :param low: Low prices, required for ``williams`` and ``adx``
+    :return: Array shaped like ``close``, with a leading period axis when
+        ``periodLength`` is a sequence
+    """
+    if indicator not in INDICATORS:
+        raise ValueError(
+            f"Invalid indicator type. Valid types are: {', '.join(INDICATORS)}"
+        )
+    periods = np.atleast_1d(np.asarray(periodLength, dtype=np.int64))
+    if periods.ndim != 1 or len(periods) == 0 or (periods < 1).any():
+        raise ValueError(
+            "periodLength must be a positive integer or a sequence of them"
+        )
+    if indicator in RANGE_INDICATORS and (high is None or low is None):
+        raise ValueError(f"{indicator} requires high and low prices")
+
+    close = np.asarray(close, dtype=float)
+    single = close.ndim == 1
+    rows = np.atleast_2d(close)
+    if rows.ndim != 2:
+        raise ValueError("Prices must be 1-D or 2-D arrays")
+    highs = lows = rows
+    if indicator in RANGE_INDICATORS:
+        highs = np.asarray(high, dtype=float).reshape(rows.shape)
+        lows = np.asarray(low, dtype=float).reshape(rows.shape)
+
+    result = _compute(indicator, rows, highs, lows, periods)
+    if single:
+        result = result[:, 0]
+    return result if np.ndim(periodLength) else result[0]
+
+
+def _frame(prices: typing.Any) -> pd.DataFrame:
+    """Build an ascending price frame from any historical price output."""
+    if isinstance(prices, RootModel):
+        prices = prices.root
+    if isinstance(prices, PriceSeries):
+        frame = prices.to_pandas()
+    elif isinstance(prices, pd.DataFrame):
+        frame = prices.copy()
+    elif isinstance(prices, np.ndarray):
+        frame = pd.DataFrame(prices)
+    else:
+        frame = pd.DataFrame(
+            [p.model_dump() if hasattr(p, "model_dump") else p for p in prices]
+        )
+    if frame.empty:
+        return pd.DataFrame(columns=["date", *PRICE_COLUMNS])
+    if pd.api.types.is_datetime64_any_dtype(frame["date"]):
+        dates = frame["date"]
+        daily = (dates == dates.dt.normalize()).all()
+        frame["date"] = dates.dt.strftime("%Y-%m-%d" if daily else "%Y-%m-%d %H:%M:%S")
+    for column in PRICE_COLUMNS:
+        frame[column] = pd.to_numeric(frame.get(column), errors="coerce")
+    return frame.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def stack(prices: typing.Mapping[str, typing.Any]) -> PriceArrays:
+    """
+    Align the price histories of several symbols for ``compute``.
+
+    :param prices: Mapping of symbol to its ``historical_price_eod`` or
+        ``historical_chart`` result (model, list of records, DataFrame,
+        PriceSeries or ``EODStore.history`` array), in any date order
+    :return: PriceArrays with one right-aligned row per symbol
+    """
+    frames = {symbol: _frame(p) for symbol, p in prices.items()}
+    bars = max((len(f) for f in frames.values()), default=0)
+    arrays = {c: np.full((len(frames), bars), np.nan) for c in PRICE_COLUMNS}
+    dates = np.full((len(frames), bars), None, dtype=object)
+    for i, frame in enumerate(frames.values()):
+        start = bars - len(frame)
+        dates[i, start:] = frame["date"].to_numpy(dtype=object)
+        for column in PRICE_COLUMNS:
+            arrays[column][i, start:] = frame[column].to_numpy(dtype=float)
+    return PriceArrays(list(frames), dates, **arrays)
+
+
+def technical_indicators(
+    prices: typing.Any,
+    indicator: str,
+    periodLength: int,
+) -> RootModel[typing.List[FMPTechnicalIndicator]]:
+    """
+    Local counterpart of ``technical_indicators.technical_indicators``.
+
+    Computes the indicator over prices already fetched (e.g. from
+    ``historical_price_eod`` or ``historical_chart``) instead of sending one
+    request per symbol, indicator and period. Records are newest first like
+    the API; bars before a full lookback have the indicator set to None.
+
+    :param prices: One symbol's prices, in any form ``stack`` accepts
+    :param indicator: One of ``INDICATORS``
+    :param periodLength: Number of periods for the indicator
+    :return: A list of technical indicators
+    """
+    frame = _frame(prices)
+    values = compute(
+        indicator,
+        frame["close"].to_numpy(dtype=float),
+        periodLength,
+        high=frame["high"].to_numpy(dtype=float),
+        low=frame["low"].to_numpy(dtype=float),
+    )
+    frame = frame[["date", *PRICE_COLUMNS]].astype({"date": str})
+    frame[FIELD_NAMES[indicator]] = values
+    records = frame.iloc[::-1].to_dict(orient="records")
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, float) and value != value:
+                record[key] = None
+    return RootModel[typing.List[FMPTechnicalIndicator]].model_validate(records)
+
+
+class _Smoother:
+    """
+    Exponential average seeded with the simple average of its first window,
+    the per-bar form of ``_smooth``.
+    """
+
+    def __init__(self, period: int, wilder: bool):
+        self.period = period
+        self.alpha = 1.0 / period if wilder else 2.0 / (period + 1.0)
+        self.count = 0
+        self.total = 0.0
+        self.value: typing.Optional[float] = None
+
+    def update(self, x: float) -> typing.Optional[float]:
+        if self.value is not None:
+            self.value += self.alpha * (x - self.value)
+        else:
+            self.count += 1
+            self.total += x
+            if self.count == self.period:
+                self.value = self.total / self.period
+        return self.value
+
+    def state(self) -> typing.Dict[str, typing.Any]:
+        return {"count": self.count, "total": self.total, "value": self.value}
+
+    def restore(self, state: typing.Mapping[str, typing.Any]) -> None:
+        self.count = state["count"]
+        self.total = state["total"]
+        self.value = state["value"]
+
+
+def _bar_values(bar: typing.Any) -> typing.Tuple[float, float, float, typing.Any]:
+    """Return (close, high, low, date) of a number, mapping or model bar."""
+    if isinstance(bar, (int, float)):
+        return float(bar), float(bar), float(bar), None
+    get = (
+        bar.get if isinstance(bar, typing.Mapping) else lambda k: getattr(bar, k, None)
+    )
+    close = float(get("close"))
+    high, low = get("high"), get("low")
+    return (
+        close,
+        close if high is None else float(high),
+        close if low is None else float(low),
+        get("date"),
+    )
+
+
+class Indicator(abc.ABC):
+    """
+    Stateful indicator updated one bar at a time in O(1).
+
+    Values match ``compute`` over the same bars. ``state()`` returns a JSON
+    serializable dictionary and ``from_state`` rebuilds the indicator from
+    it, so a restarted worker continues where it stopped without replaying
+    history.
+
+    Example:
+        bars = fmpsdk.historical_chart("AAPL", "5min", apikey)
+        rsi = indicators.RSI.from_bars(bars, 14)
+        saved = json.dumps(rsi.state())
+        ...
+        rsi = indicators.from_state(json.loads(saved))
+        rsi.update(new_bar)
+    """
+
+    indicator = ""
+
+    def __init__(self, periodLength: int):
+        """
+        :param periodLength: Number of periods for the indicator
+        """
+        if int(periodLength) < 1:
+            raise ValueError("periodLength must be a positive integer")
+        self.periodLength = int(periodLength)
+        self.value: typing.Optional[float] = None
+        self.last_date: typing.Optional[str] = None
+
+    def update(self, bar: typing.Any) -> typing.Optional[float]:
+        """
+        Add the next bar.
+
+        :param bar: Mapping or model with ``close`` (and ``high``/``low`` for
+            range indicators), e.g. a ``historical_chart`` record, or a
+            closing price
+        :return: The indicator after this bar, or None during warm-up
+        """
+        close, high, low, date = _bar_values(bar)
+        self.value = self._update(close, high, low)
+        if date is not None:
+            self.last_date = str(date)
+        return self.value
+
+    @abc.abstractmethod
+    def _update(self, close: float, high: float, low: float) -> typing.Optional[float]:
+        raise NotImplementedError
+
+    def _anchor(self, value: float) -> None:
+        """Align the state with an indicator value reported by the API."""
+
+    @abc.abstractmethod
+    def _state(self) -> typing.Dict[str, typing.Any]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _restore(self, state: typing.Mapping[str, typing.Any]) -> None:
+        raise NotImplementedError
+
+    def state(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the indicator's state as JSON-serializable data.
+        """
+        return {
+            "indicator": self.indicator,
+            "periodLength": self.periodLength,
+            "value": self.value,
+            "last_date": self.last_date,
+            **self._state(),
+        }
+
+    @classmethod
+    def from_bars(cls, prices: typing.Any, periodLength: int) -> "Indicator":
+        """
+        Seed an indicator by replaying raw bars.
+
+        :param prices: Bars in any form ``stack`` accepts, in any date order
+        :param periodLength: Number of periods for the indicator
+        :return: The indicator after the latest bar
+        """
+        indicator = cls(periodLength)
+        frame = _frame(prices)
+        for date, close, high, low in zip(
+            frame["date"], frame["close"], frame["high"], frame["low"]
+        ):
+            indicator.update({"date": date, "close": close, "high": high, "low": low})
+        return indicator
+
+    @classmethod
+    def from_indicators(cls, series: typing.Any, periodLength: int) -> "Indicator":
+        """
+        Seed an indicator from a ``technical_indicators`` response.
+
+        The bars carried by the records are replayed, then the state is
+        aligned with the latest value the API reported, so smoothing started
+        before the first record does not cause drift.
+
+        :param series: ``FMPTechnicalIndicator`` records of this indicator
+        :param periodLength: The ``periodLength`` the series was requested with
+        :return: The indicator after the latest record
+        """
+        indicator = cls.from_bars(series, periodLength)
+        frame = _frame(series)
+        field = FIELD_NAMES[cls.indicator]
+        if len(frame) and field in frame and indicator.value is not None:
+            latest = frame[field].iloc[-1]
+            if latest is not None and latest == latest:
+                indicator._anchor(float(latest))
+                indicator.value = float(latest)
+        return indicator
+
+
+class EMA(Indicator):
+    """
+    Exponential moving average of closes.
+    """
+
+    indicator = "ema"
+
+    def __init__(self, periodLength: int):
+        super().__init__(periodLength)
+        self._average = _Smoother(self.periodLength, wilder=False)
+
+    def _update(self, close, high, low):
+        return self._average.update(close)
+
+    def _anchor(self, value):
+        self._average.value = value
+
+    def _state(self):
+        return {"average": self._average.state()}
+
+    def _restore(self, state):
+        self._average.restore(state["average"])
+
+
+class RSI(Indicator):
+    """
+    Relative strength index with Wilder's smoothing.
+    """
+
+    indicator = "rsi"
+
+    def __init__(self, periodLength: int):
+        super().__init__(periodLength)
+        self._previous: typing.Optional[float] = None
+        self._gain = _Smoother(self.periodLength, wilder=True)
+        self._loss = _Smoother(self.periodLength, wilder=True)
+
+    def _update(self, close, high, low):
+        previous, self._previous = self._previous, close
+        if previous is None:
+            return None
+        change = close - previous
+        gain = self._gain.update(max(change, 0.0))
+        loss = self._loss.update(max(-change, 0.0))
+        if gain is None or loss is None:
+            return None
+        if loss == 0.0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    def _anchor(self, value):
+        # Keep the average loss; the API value fixes the gain/loss ratio
+        if self._loss.value and value < 100.0:
+            self._gain.value = self._loss.value * value / (100.0 - value)
+
+    def _state(self):
+        return {
+            "previous": self._previous,
+            "gain": self._gain.state(),
+            "loss": self._loss.state(),
+        }
+
+    def _restore(self, state):
+        self._previous = state["previous"]
+        self._gain.restore(state["gain"])
+        self._loss.restore(state["loss"])
+
+
+class ADX(Indicator):
+    """
+    Wilder's average directional index.
+    """
+
+    indicator = "adx"
+
+    def __init__(self, periodLength: int):
+        super().__init__(periodLength)
+        self._previous: typing.Optional[typing.List[float]] = None
+        self._range = _Smoother(self.periodLength, wilder=True)
+        self._plus = _Smoother(self.periodLength, wilder=True)
+        self._minus = _Smoother(self.periodLength, wilder=True)
+        self._adx = _Smoother(self.periodLength, wilder=True)
+
+    def _update(self, close, high, low):
+        previous, self._previous = self._previous, [high, low, close]
+        if previous is None:
+            return None
+        previous_high, previous_low, previous_close = previous
+        up, down = high - previous_high, previous_low - low
+        true_range = max(high, previous_close) - min(low, previous_close)
+        average_range = self._range.update(true_range)
+        plus = self._plus.update(up if up > down and up > 0 else 0.0)
+        minus = self._minus.update(down if down > up and down > 0 else 0.0)
+        if average_range is None or plus is None or minus is None:
+            return None
+        if average_range == 0.0:
+            return self._adx.update(0.0)
+        plus_di, minus_di = plus / average_range, minus / average_range
+        total = plus_di + minus_di
+        dx = 0.0 if total == 0.0 else 100.0 * abs(plus_di - minus_di) / total
+        return self._adx.update(dx)
+
+    def _anchor(self, value):
+        self._adx.value = value
+
+    def _state(self):
+        return {
+            "previous": self._previous,
+            "range": self._range.state(),
+            "plus": self._plus.state(),
+            "minus": self._minus.state(),
+            "adx": self._adx.state(),
+        }
+
+    def _restore(self, state):
+        self._previous = state["previous"]
+        self._range.restore(state["range"])
+        self._plus.restore(state["plus"])
+        self._minus.restore(state["minus"])
+        self._adx.restore(state["adx"])
+
+
+class StandardDeviation(Indicator):
+    """
+    Rolling population standard deviation of closes.
+
+    The mean and sum of squared deviations are updated as a bar enters and
+    another leaves the window (Welford's method), so no window is re-summed.
+    """
+
+    indicator = "standarddeviation"
+
+    def __init__(self, periodLength: int):
+        super().__init__(periodLength)
+        self._window: typing.Deque[float] = collections.deque()
+        self._mean = 0.0
+        self._squares = 0.0
+
+    def _update(self, close, high, low):
+        window = self._window
+        if len(window) < self.periodLength:
+            window.append(close)
+            delta = close - self._mean
+            self._mean += delta / len(window)
+            self._squares += delta * (close - self._mean)
+        else:
+            oldest = window.popleft()
+            window.append(close)
+            mean = self._mean + (close - oldest) / self.periodLength
+            self._squares += (close - oldest) * (close - mean + oldest - self._mean)
+            self._mean = mean
+        if len(window) < self.periodLength:
+            return None
+        return math.sqrt(max(self._squares, 0.0) / self.periodLength)
+
+    def _state(self):
+        return {
+            "window": list(self._window),
+            "mean": self._mean,
+            "squares": self._squares,
+        }
+
+    def _restore(self, state):
+        self._window = collections.deque(state["window"])
+        self._mean = state["mean"]
+        self._squares = state["squares"]
+
+
+class Williams(Indicator):
+    """
+    Williams %R over the highest high and lowest low of the window.
+
+    The window extremes are kept in monotonic queues, so each bar costs
+    amortized O(1) instead of a scan of the window.
+    """
+
+    indicator = "williams"
+
+    def __init__(self, periodLength: int):
+        super().__init__(periodLength)
+        self._count = 0
+        self._highs: typing.Deque[typing.List[float]] = collections.deque()
+        self._lows: typing.Deque[typing.List[float]] = collections.deque()
+
+    def _update(self, close, high, low):
+        self._count += 1
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._highs.append([self._count, high])
+        self._lows.append([self._count, low])
+        for queue in (self._highs, self._lows):
+            if queue[0][0] <= self._count - self.periodLength:
+                queue.popleft()
+        if self._count < self.periodLength:
+            return None
+        highest, lowest = self._highs[0][1], self._lows[0][1]
+        if highest == lowest:
+            return None
+        return -100.0 * (highest - close) / (highest - lowest)
+
+    def _state(self):
+        return {
+            "count": self._count,
+            "highs": list(self._highs),
+            "lows": list(self._lows),
+        }
+
+    def _restore(self, state):
+        self._count = state["count"]
+        self._highs = collections.deque(list(item) for item in state["highs"])
+        self._lows = collections.deque(list(item) for item in state["lows"])
+
+
+# Stateful indicator class for each indicator name.
+STATEFUL: typing.Dict[str, typing.Type[Indicator]] = {
+    cls.indicator: cls for cls in (EMA, RSI, ADX, StandardDeviation, Williams)
+}
+
+
+def from_state(state: typing.Mapping[str, typing.Any]) -> Indicator:
+    """
+    Rebuild a stateful indicator from ``Indicator.state()``.
+
+    :param state: Saved state, e.g. loaded back from JSON
+    :return: The indicator, ready for the next bar
+    """
+    if state.get("indicator") not in STATEFUL:
+        raise ValueError(
+            f"Invalid indicator state. Valid types are: {', '.join(STATEFUL)}"
+        )
+    indicator = STATEFUL[state["indicator"]](state["periodLength"])
+    indicator.value = state["value"]
+    indicator.last_date = state["last_date"]
+    indicator._restore(state)
+    return indicator
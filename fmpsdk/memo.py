@@ -0,0 +1,209 @@
+import collections
+import threading
+import time
+import typing
+
+# Defaults for enable_memo.
+MAXSIZE = 1024
+TTL = 300.0
+
+# Sentinel returned by MemoCache.get for absent or expired entries.
+MISSING = object()
+
+
+def _freeze(value: typing.Any) -> typing.Hashable:
+    """
+    Convert call arguments into a hashable form for use in a memo key.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, set) else items)
+    hash(value)
+    return typing.cast(typing.Hashable, value)
+
+
+def make_key(
+    endpoint: str, arguments: typing.Mapping[str, typing.Any]
+) -> typing.Optional[typing.Hashable]:
+    """
+    Build a memo key from an endpoint's bound arguments, excluding the API key.
+
+    :return: The key, or None when an argument cannot be hashed
+    """
+    try:
+        return (
+            endpoint,
+            _freeze({k: v for k, v in arguments.items() if k != "apikey"}),
+        )
+    except TypeError:
+        return None
+
+
+class MemoCache:
+    """
+    Thread-safe in-process LRU cache of validated endpoint results.
+
+    Entries expire ``ttl`` seconds after they are stored (per-endpoint TTLs
+    override the default) and the least recently used entry is evicted once
+    ``maxsize`` entries are held. Cached model instances are shared between
+    callers and should be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MAXSIZE,
+        ttl: float = TTL,
+        endpoints: typing.Optional[typing.Mapping[str, typing.Optional[float]]] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.endpoints = dict(endpoints or {})
+        self._lock = threading.Lock()
+        self._entries: typing.OrderedDict[
+            typing.Hashable, typing.Tuple[float, typing.Any]
+        ] = collections.OrderedDict()
+        self._stats: typing.Dict[str, typing.Dict[str, int]] = {}
+
+    def enabled_for(self, endpoint: str) -> bool:
+        """
+        Whether results of ``endpoint`` are memoized.
+        """
+        return endpoint in self.endpoints
+
+    def _count(self, endpoint: str, counter: str) -> None:
+        counts = self._stats.setdefault(
+            endpoint, {"hits": 0, "misses": 0, "evictions": 0}
+        )
+        counts[counter] += 1
+
+    def get(self, key: typing.Hashable) -> typing.Any:
+        """
+        Return the cached value for ``key``, or ``MISSING`` if absent or expired.
+        """
+        endpoint = key[0]  # type: ignore[index]
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._count(endpoint, "hits")
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._count(endpoint, "misses")
+            return MISSING
+
+    def set(self, key: typing.Hashable, value: typing.Any) -> None:
+        """
+        Store ``value``, evicting the least recently used entries if needed.
+        """
+        endpoint = key[0]  # type: ignore[index]
+        ttl = self.endpoints.get(endpoint) or self.ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._count(evicted[0], "evictions")  # type: ignore[index]
+
+    def clear(self, endpoint: typing.Optional[str] = None) -> None:
+        """
+        Remove every entry, or only the entries of one endpoint.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            else:
+                # Keys are (endpoint, arguments) tuples built by make_key
+                stale = [
+                    k
+                    for k in self._entries
+                    if typing.cast(typing.Tuple[str, typing.Any], k)[0] == endpoint
+                ]
+                for key in stale:
+                    del self._entries[key]
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return total and per-endpoint hit/miss/eviction counters.
+        """
+        with self._lock:
+            per_endpoint = {name: dict(c) for name, c in self._stats.items()}
+            size = len(self._entries)
+        totals = {
+            counter: sum(c[counter] for c in per_endpoint.values())
+            for counter in ("hits", "misses", "evictions")
+        }
+        return {**totals, "size": size, "endpoints": per_endpoint}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_memo: typing.Optional[MemoCache] = None
+
+
+def enable_memo(
+    endpoints: typing.Union[
+        typing.Mapping[str, typing.Optional[float]], typing.Iterable[str]
+    ],
+    maxsize: int = MAXSIZE,
+    ttl: float = TTL,
+) -> MemoCache:
+    """
+    Memoize validated results of the given endpoints in process memory.
+
+    Repeated calls with the same arguments (the API key is ignored) return the
+    same validated model instance without a request or re-validation.
+
+    :param endpoints: Endpoint function names to memoize, or a mapping of name
+        to TTL in seconds (None uses ``ttl``)
+    :param maxsize: Maximum number of results held across all endpoints
+    :param ttl: Default time-to-live in seconds
+    :return: The installed memo cache
+
+    Example:
+        enable_memo({"company_profile": 3600, "treasury_rates": 600})
+    """
+    global _memo
+    if not isinstance(endpoints, typing.Mapping):
+        endpoints = {name: None for name in endpoints}
+    _memo = MemoCache(maxsize=maxsize, ttl=ttl, endpoints=endpoints)
+    return _memo
+
+
+def disable_memo() -> None:
+    """
+    Turn memoization off and drop all memoized results.
+    """
+    global _memo
+    _memo = None
+
+
+def get_memo() -> typing.Optional[MemoCache]:
+    """
+    Return the active memo cache, or None when memoization is off.
+    """
+    return _memo
+
+
+def get_memo_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Return memo counters, or zeros when memoization is off.
+    """
+    if _memo is None:
+        return {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "endpoints": {}}
+    return _memo.stats()
+
+
+def clear_memo(endpoint: typing.Optional[str] = None) -> None:
+    """
+    Drop memoized results, for every endpoint or only one.
+    """
+    if _memo is not None:
+        _memo.clear(endpoint)
@@ -1,6 +1,7 @@
-from typing import Any, List
+import threading
+from typing import Any, Dict, List
 
-from pydantic import RootModel
+from pydantic import RootModel, TypeAdapter
 
 from .models import (
     FMPAcquisitionOwnership,
@@ -423,3 +424,71 @@ ENDPOINT_MODEL_MAP = {
     "cash_flow_statement_growth_bulk": RootModel[List[FMPCashFlowGrowth]],
     "eod_bulk": RootModel[List[FMPBulkEOD]],
 }
+
+# Time-to-live in seconds for responses kept by the optional disk cache
+# (fmpsdk.cache). Only slowly changing endpoints are listed; anything not in
+# this table is always fetched from the API.
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+ENDPOINT_CACHE_TTL = {
+    # Directory
+    "stock_list": DAY,
+    "financial_statement_symbol_list": DAY,
+    "cik_list": DAY,
+    "symbol_change": DAY,
+    "etf_list": DAY,
+    "actively_trading_list": DAY,
+    "available_exchanges": WEEK,
+    "available_sectors": WEEK,
+    "available_industries": WEEK,
+    "available_countries": WEEK,
+    "available_indexes": WEEK,
+    "commodity_list": DAY,
+    "cryptocurrency_list": DAY,
+    "forex_list": DAY,
+    # Company
+    "company_profile": DAY,
+    "company_profile_cik": DAY,
+    "key_executives": DAY,
+    "stock_peers": DAY,
+    # Statements
+    "financial_reports_dates": DAY,
+    # Indexes
+    "index_list": WEEK,
+    "index_constituents": DAY,
+    "index_constituents_historical": DAY,
+    # Market hours
+    "holidays_by_exchange": WEEK,
+    # SEC filings
+    "sec_profile": DAY,
+    "industry_classification_list": WEEK,
+}
+
+
+# Validators compiled on first use of each endpoint and reused afterwards.
+_VALIDATORS: Dict[str, TypeAdapter] = {}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_validator(endpoint: str) -> TypeAdapter:
+    """
+    Return the cached ``TypeAdapter`` for an endpoint's registered model.
+
+    The adapter is built the first time an endpoint is used, so responses can
+    be validated straight from JSON bytes with ``validate_json``.
+
+    :param endpoint: Endpoint function name as registered in ENDPOINT_MODEL_MAP
+    :return: The endpoint's validator
+    :raises KeyError: If no model is registered for the endpoint
+    """
+    validator = _VALIDATORS.get(endpoint)
+    if validator is None:
+        model = ENDPOINT_MODEL_MAP[endpoint]
+        with _VALIDATORS_LOCK:
+            validator = _VALIDATORS.get(endpoint)
+            if validator is None:
+                validator = _VALIDATORS[endpoint] = TypeAdapter(model)
+    return validator
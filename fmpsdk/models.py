@@ -2,18 +2,40 @@ import os
 import sys
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, RootModel, model_validator
+from pydantic import BaseModel, Field, RootModel, ValidationInfo, model_validator
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+# Validation context key set when normalize_none_strings has already run.
+NONE_NORMALIZED = "none_normalized"
+
+
+def normalize_none_strings(records: List[Any]) -> List[Any]:
+    """Convert 'None' strings to None across a whole list response at once.
+
+    Only records that contain a 'None' string are copied; the rest are reused
+    as-is. Validate the result with ``context={NONE_NORMALIZED: True}`` so
+    FMPBaseModel skips its per-record conversion.
+    """
+    return [
+        (
+            {k: None if v == "None" else v for k, v in record.items()}
+            if isinstance(record, dict) and "None" in record.values()
+            else record
+        )
+        for record in records
+    ]
+
 
 class FMPBaseModel(BaseModel):
     """Base model for all FMP models that handles 'None' string conversion."""
 
     @model_validator(mode="before")
     @classmethod
-    def convert_none_strings(cls, values: Any) -> Any:
+    def convert_none_strings(cls, values: Any, info: ValidationInfo) -> Any:
         """Convert 'None' strings to actual None values."""
+        if info.context and info.context.get(NONE_NORMALIZED):
+            return values
         if isinstance(values, dict):
             return {k: None if v == "None" else v for k, v in values.items()}
         return values
@@ -0,0 +1,217 @@
+import json
+import os
+import threading
+import time
+import typing
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Published per-minute request quotas for FMP subscription plans.
+PLAN_CALLS_PER_MINUTE: typing.Dict[str, int] = {
+    "starter": 300,
+    "premium": 750,
+    "ultimate": 3000,
+}
+
+# Environment variables read the first time a request is throttled, so worker
+# processes (pytest-xdist, multiprocessing) pick up the limit without any code.
+CALLS_PER_MINUTE_ENV = "FMP_CALLS_PER_MINUTE"
+RATE_LIMIT_FILE_ENV = "FMP_RATE_LIMIT_FILE"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every thread in the process.
+
+    Each request reserves a token up front. When the bucket is empty the
+    reservation drives the balance negative and the caller waits until its
+    token has been refilled, so waiting callers are served in arrival order.
+    """
+
+    def __init__(self, calls_per_minute: float, burst: int = 1):
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self.calls_per_minute = calls_per_minute
+        self.rate = calls_per_minute / 60.0
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take ``tokens`` from the bucket.
+
+        :param tokens: Number of requests to account for
+        :return: Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Block until ``tokens`` requests may be sent.
+
+        :return: Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a file guarded by an exclusive lock.
+
+    Every process configured with the same path draws from one shared quota.
+    Wall-clock time is used for refills because monotonic clocks are not
+    comparable across processes.
+    """
+
+    def __init__(self, calls_per_minute: float, path: str, burst: int = 1):
+        if fcntl is None:
+            raise RuntimeError(
+                "The file-backed rate limiter requires fcntl (POSIX systems)."
+            )
+        super().__init__(calls_per_minute, burst)
+        self.path = path
+
+    def reserve(self, tokens: int = 1) -> float:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = time.time()
+                available, updated = self._read_state(fd, now)
+                available = min(
+                    self.capacity, available + max(0.0, now - updated) * self.rate
+                )
+                available -= tokens
+                self._write_state(fd, available, now)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+            return max(0.0, -available / self.rate)
+
+    def _read_state(self, fd: int, now: float) -> typing.Tuple[float, float]:
+        os.lseek(fd, 0, os.SEEK_SET)
+        raw = os.read(fd, 4096)
+        try:
+            state = json.loads(raw)
+            return float(state["tokens"]), float(state["updated"])
+        except (ValueError, KeyError, TypeError):
+            # New or corrupt state file: start with a full bucket.
+            return self.capacity, now
+
+    def _write_state(self, fd: int, available: float, now: float) -> None:
+        payload = json.dumps({"tokens": available, "updated": now}).encode()
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, payload)
+
+
+_lock = threading.Lock()
+_limiter: typing.Optional[TokenBucket] = None
+_env_checked = False
+
+
+def configure_rate_limit(
+    calls_per_minute: typing.Optional[float] = None,
+    plan: typing.Optional[str] = None,
+    burst: int = 1,
+    path: typing.Optional[str] = None,
+) -> typing.Optional[TokenBucket]:
+    """
+    Throttle every request sent through the shared transport.
+
+    :param calls_per_minute: Requests allowed per minute
+    :param plan: FMP plan name used instead of calls_per_minute
+        (one of PLAN_CALLS_PER_MINUTE)
+    :param burst: Requests that may be sent back-to-back before throttling
+    :param path: Optional state file shared by several processes
+    :return: The installed limiter, or None when limiting is disabled
+    """
+    global _limiter, _env_checked
+    if plan is not None:
+        try:
+            calls_per_minute = PLAN_CALLS_PER_MINUTE[plan.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown plan: {plan}. Must be one of {list(PLAN_CALLS_PER_MINUTE)}."
+            )
+
+    limiter: typing.Optional[TokenBucket] = None
+    if calls_per_minute:
+        if path:
+            limiter = FileTokenBucket(calls_per_minute, path, burst)
+        else:
+            limiter = TokenBucket(calls_per_minute, burst)
+
+    with _lock:
+        _limiter = limiter
+        _env_checked = True
+    return limiter
+
+
+def disable_rate_limit() -> None:
+    """
+    Stop throttling requests.
+    """
+    configure_rate_limit(None)
+
+
+def get_rate_limiter() -> typing.Optional[TokenBucket]:
+    """
+    Return the active limiter, configuring it from the environment on first use.
+    """
+    global _limiter, _env_checked
+    if not _env_checked:
+        with _lock:
+            if not _env_checked:
+                _limiter = _limiter_from_environment()
+                # Only once a valid setting is in place, so a bad value keeps
+                # raising instead of silently disabling the limit
+                _env_checked = True
+    return _limiter
+
+
+def _limiter_from_environment() -> typing.Optional[TokenBucket]:
+    calls = os.getenv(CALLS_PER_MINUTE_ENV)
+    if not calls:
+        return None
+    try:
+        calls_per_minute = float(calls)
+        if not calls_per_minute > 0:
+            raise ValueError
+    except ValueError:
+        raise ValueError(
+            f"{CALLS_PER_MINUTE_ENV} must be a positive number, not {calls!r}."
+        ) from None
+    path = os.getenv(RATE_LIMIT_FILE_ENV)
+    if path:
+        return FileTokenBucket(calls_per_minute, path)
+    return TokenBucket(calls_per_minute)
+
+
+def acquire() -> float:
+    """
+    Wait for permission to send one request.
+
+    :return: Seconds spent waiting (0 when limiting is disabled)
+    """
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return 0.0
+    return limiter.acquire()
@@ -0,0 +1,267 @@
+import re
+import typing
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, RootModel
+
+from . import columnar
+from .model_registry import ENDPOINT_MODEL_MAP, get_validator
+from .series import PriceSeries
+
+# Bar length in minutes of every named timeframe; "1day" is one bar per session.
+TIMEFRAMES = {
+    "1min": 1,
+    "5min": 5,
+    "15min": 15,
+    "30min": 30,
+    "1hour": 60,
+    "4hour": 240,
+    "1day": 1440,
+}
+
+PRICE_COLUMNS = ("open", "low", "high", "close", "volume")
+
+MINUTES_PER_DAY = 1440
+
+_TIMEFRAME = re.compile(r"^(\d+)\s*(min|hour|day)$")
+_CLOCK = re.compile(r"(\d{1,2}):(\d{2})\s*([AaPp][Mm])?")
+
+
+class Session(typing.NamedTuple):
+    """
+    Regular trading hours of an exchange, in minutes after local midnight.
+    """
+
+    opening: int
+    closing: int
+
+
+def _minutes(clock: str) -> int:
+    match = _CLOCK.search(clock)
+    if match is None:
+        raise ValueError(f"Cannot read a time of day from {clock!r}")
+    hour, minute, meridiem = int(match[1]), int(match[2]), match[3]
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem.upper() == "PM" else 0)
+    return hour * 60 + minute
+
+
+def session(hours: typing.Any) -> Session:
+    """
+    Read an exchange's session from ``exchange_market_hours`` data.
+
+    :param hours: ``exchange_market_hours`` result (model, record or list
+        with ``openingHour``/``closingHour`` such as "09:30 AM -04:00"), or
+        an ``(opening, closing)`` pair such as ("09:30", "16:00")
+    :return: Session with opening and closing minutes
+    """
+    if isinstance(hours, Session):
+        return hours
+    if isinstance(hours, RootModel):
+        hours = hours.root
+    if (
+        isinstance(hours, (list, tuple))
+        and len(hours) == 2
+        and isinstance(hours[0], str)
+    ):
+        opening, closing = _minutes(hours[0]), _minutes(hours[1])
+    else:
+        if isinstance(hours, list):
+            if not hours:
+                raise ValueError("No market hours given")
+            hours = hours[0]
+        if isinstance(hours, BaseModel):
+            hours = hours.model_dump()
+        opening = _minutes(hours["openingHour"])
+        closing = _minutes(hours["closingHour"])
+    if closing <= opening:
+        raise ValueError("Sessions crossing midnight are not supported")
+    return Session(opening, closing)
+
+
+def _bar_minutes(timeframe: typing.Union[str, int]) -> int:
+    if isinstance(timeframe, int):
+        minutes = timeframe
+    elif timeframe in TIMEFRAMES:
+        minutes = TIMEFRAMES[timeframe]
+    else:
+        match = _TIMEFRAME.match(str(timeframe).strip())
+        if match is None:
+            raise ValueError(
+                f"Invalid timeframe {timeframe!r}. Use one of "
+                f"{', '.join(TIMEFRAMES)} or e.g. '10min', '2hour', or minutes"
+            )
+        minutes = (
+            int(match[1]) * {"min": 1, "hour": 60, "day": MINUTES_PER_DAY}[match[2]]
+        )
+    if not 1 <= minutes <= MINUTES_PER_DAY:
+        raise ValueError("Bars must be at least a minute and at most one day long")
+    return minutes
+
+
+def _columns(bars: typing.Any) -> typing.Dict[str, np.ndarray]:
+    """Return date (datetime64[m]) and price columns of any chart output."""
+    if isinstance(bars, RootModel):
+        bars = bars.root
+    if isinstance(bars, pd.DataFrame):
+        columns = {key: bars[key].to_numpy() for key in ("date", *PRICE_COLUMNS)}
+    elif isinstance(bars, PriceSeries):
+        columns = {key: bars[key] for key in ("date", *PRICE_COLUMNS)}
+    elif isinstance(bars, typing.Mapping):
+        columns = {key: np.asarray(bars[key]) for key in ("date", *PRICE_COLUMNS)}
+    elif bars and isinstance(bars[0], BaseModel):
+        columns = {
+            key: np.array([getattr(bar, key) for bar in bars])
+            for key in ("date", *PRICE_COLUMNS)
+        }
+    else:
+        columns = columnar.to_columns(bars, ENDPOINT_MODEL_MAP["historical_chart"])
+    result = {"date": np.asarray(columns["date"], dtype="M8[m]")}
+    for key in PRICE_COLUMNS:
+        result[key] = np.asarray(columns[key], dtype=float)
+    return result
+
+
+def resample_columns(
+    columns: typing.Mapping[str, np.ndarray],
+    timeframe: typing.Union[str, int],
+    hours: typing.Any = None,
+) -> typing.Dict[str, np.ndarray]:
+    """
+    Aggregate bar columns into longer bars.
+
+    Bars are grouped into buckets counted from the session opening (or from
+    midnight without a session), so "1hour" bars of a 09:30 session start at
+    09:30, 10:30, ...; the last bucket of a session may be shorter. Bars
+    outside the session are dropped. Each bucket is labelled with its start
+    and takes the first open, highest high, lowest low, last close and total
+    volume of its bars. Runs in linear time for bars in either date order.
+
+    :param columns: ``date`` (datetime64) and price column arrays
+    :param timeframe: Named timeframe, e.g. "15min" or "1day", a custom one
+        such as "10min" or "2hour", or a number of minutes
+    :param hours: Optional session; anything ``session`` accepts
+    :return: Columns of the resampled bars in ascending date order, with
+        ``date`` as datetime64[m]
+    """
+    minutes = _bar_minutes(timeframe)
+    dates = np.asarray(columns["date"], dtype="M8[m]")
+    values = {key: np.asarray(columns[key], dtype=float) for key in PRICE_COLUMNS}
+    # Chart endpoints return newest first; only unsorted input needs a sort
+    if len(dates) > 1 and dates[0] > dates[-1]:
+        dates = dates[::-1]
+        values = {key: column[::-1] for key, column in values.items()}
+    if len(dates) > 1 and (dates[1:] < dates[:-1]).any():
+        order = np.argsort(dates, kind="stable")
+        dates = dates[order]
+        values = {key: column[order] for key, column in values.items()}
+
+    stamps = dates.astype(np.int64)
+    days = stamps // MINUTES_PER_DAY * MINUTES_PER_DAY
+    of_day = stamps - days
+    if hours is not None:
+        hours = session(hours)
+        inside = (of_day >= hours.opening) & (of_day < hours.closing)
+        days, of_day = days[inside], of_day[inside]
+        values = {key: column[inside] for key, column in values.items()}
+        origin = hours.opening
+    else:
+        origin = 0
+
+    if minutes == MINUTES_PER_DAY:
+        buckets = days
+    else:
+        buckets = days + origin + (of_day - origin) // minutes * minutes
+
+    if len(buckets) == 0:
+        return {
+            "date": np.empty(0, "M8[m]"),
+            **{key: np.empty(0) for key in PRICE_COLUMNS},
+        }
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    return {
+        "date": buckets[starts].astype("M8[m]"),
+        "open": values["open"][starts],
+        "low": np.minimum.reduceat(values["low"], starts),
+        "high": np.maximum.reduceat(values["high"], starts),
+        "close": values["close"][ends],
+        "volume": np.add.reduceat(values["volume"], starts),
+    }
+
+
+def _output(
+    columns: typing.Dict[str, np.ndarray], daily: bool, output: str
+) -> typing.Any:
+    """Format ascending resampled columns like a ``historical_chart`` result."""
+    unit = "D" if daily else "s"
+    if output == "series":
+        return PriceSeries(
+            columns["date"].astype(f"M8[{unit}]"),
+            {key: columns[key] for key in PRICE_COLUMNS},
+        )
+    dates = np.datetime_as_string(
+        columns["date"].astype(f"M8[{unit}]"), unit="D" if daily else "s"
+    )
+    if not daily and len(dates):
+        dates = np.char.replace(dates, "T", " ")
+    newest_first = {"date": dates[::-1].astype(object)}
+    newest_first.update({key: columns[key][::-1] for key in PRICE_COLUMNS})
+    if output == "columns":
+        return newest_first
+    frame = pd.DataFrame(newest_first)
+    if output == "pandas":
+        return frame
+    raw = frame.to_dict(orient="records")
+    if output == "raw":
+        return raw
+    if output == "models":
+        return get_validator("historical_chart").validate_python(raw)
+    raise ValueError(f"output must be one of {columnar.OUTPUT_MODES}, not {output!r}.")
+
+
+def resample(
+    bars: typing.Any,
+    timeframe: typing.Union[str, int, typing.Sequence[typing.Union[str, int]]],
+    hours: typing.Any = None,
+    output: str = "models",
+) -> typing.Any:
+    """
+    Build longer bars locally from one ``historical_chart`` download.
+
+    Fetch "1min" bars once and derive every other timeframe from them
+    instead of requesting each interval separately. Results look like
+    ``historical_chart`` output: newest first, ``date`` as
+    "YYYY-MM-DD HH:MM:SS" (or "YYYY-MM-DD" for daily bars) in the exchange's
+    local time, as FMP reports it.
+
+    Example:
+        bars = fmpsdk.historical_chart("AAPL", "1min", apikey)
+        hours = fmpsdk.exchange_market_hours(apikey, "NASDAQ")
+        frames = resample(bars, ["5min", "1hour", "1day"], hours, output="pandas")
+
+    :param bars: ``historical_chart`` result in any output mode (models,
+        raw records, DataFrame, column mapping or PriceSeries)
+    :param timeframe: Timeframe, or a list of them, as for
+        ``resample_columns``
+    :param hours: Optional ``exchange_market_hours`` result or
+        ``(opening, closing)`` pair; bars outside the session are dropped
+        and buckets start at the opening
+    :param output: "models", "raw", "pandas", "columns" or "series" (a
+        PriceSeries, which is always oldest first)
+    :return: Resampled bars, or a dict of them keyed by timeframe when a
+        list of timeframes is given
+    """
+    if output not in columnar.OUTPUT_MODES:
+        raise ValueError(
+            f"output must be one of {columnar.OUTPUT_MODES}, not {output!r}."
+        )
+    columns = _columns(bars)
+    timeframes = [timeframe] if isinstance(timeframe, (str, int)) else timeframe
+    results = {}
+    for frame in timeframes:
+        resampled = resample_columns(columns, frame, hours)
+        daily = _bar_minutes(frame) == MINUTES_PER_DAY
+        results[frame] = _output(resampled, daily, output)
+    return results[timeframe] if isinstance(timeframe, (str, int)) else results
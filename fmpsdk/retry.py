@@ -0,0 +1,253 @@
+import contextlib
+import contextvars
+import random
+import threading
+import typing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Defaults for the global policy. The deadline keeps the worst case of the
+# previous fixed policy (10 retries x 20 seconds).
+MAX_RETRIES = 10
+BASE_DELAY = 1.0
+MAX_DELAY = 60.0
+MULTIPLIER = 2.0
+DEADLINE = 200.0
+
+
+class RetryPolicy:
+    """
+    Iterative retry policy with exponential backoff, full jitter and a deadline.
+
+    The delay before retry ``n`` (0-based) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * multiplier ** n)]`` when ``jitter`` is on,
+    so a fleet of workers that hit a limit together spreads its retries out.
+    A server ``Retry-After`` value replaces the computed delay when
+    ``respect_retry_after`` is set. No retry is attempted once ``max_retries``
+    is used up or the next sleep would overrun ``deadline`` seconds measured
+    from the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        multiplier: float = MULTIPLIER,
+        jitter: bool = True,
+        deadline: typing.Optional[float] = DEADLINE,
+        respect_retry_after: bool = True,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+        if base_delay < 0 or max_delay < 0 or multiplier < 1:
+            raise ValueError(
+                "base_delay and max_delay must not be negative and multiplier "
+                "must be at least 1."
+            )
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.respect_retry_after = respect_retry_after
+
+    @classmethod
+    def constant(cls, retries: int, delay: float) -> "RetryPolicy":
+        """
+        Fixed-delay policy matching the legacy ``retries``/``retry_delay`` arguments.
+        """
+        return cls(
+            max_retries=retries,
+            base_delay=delay,
+            max_delay=delay,
+            multiplier=1.0,
+            jitter=False,
+            deadline=None,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before retry ``attempt`` (0-based), before any Retry-After override.
+        """
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier**attempt)
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: typing.Optional[float] = None,
+    ) -> typing.Optional[float]:
+        """
+        Decide whether to retry and for how long to wait.
+
+        :param attempt: Number of retries already made
+        :param elapsed: Seconds since the first attempt started
+        :param retry_after: Server-provided Retry-After delay in seconds, if any
+        :return: Seconds to sleep before retrying, or None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+        if retry_after is not None and self.respect_retry_after:
+            delay = retry_after
+        else:
+            delay = self.backoff(attempt)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"base_delay={self.base_delay}, max_delay={self.max_delay}, "
+            f"multiplier={self.multiplier}, jitter={self.jitter}, "
+            f"deadline={self.deadline}, "
+            f"respect_retry_after={self.respect_retry_after})"
+        )
+
+
+class RetryStats:
+    """
+    Thread-safe counters describing retries made by the transport.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts: typing.Dict[str, typing.Any] = {
+                "retries": 0,
+                "rate_limit_retries": 0,
+                "timeout_retries": 0,
+                "retry_after_honored": 0,
+                "gave_up": 0,
+                "total_delay": 0.0,
+            }
+
+    def record_retry(self, reason: str, delay: float, retry_after: bool) -> None:
+        with self._lock:
+            self._counts["retries"] += 1
+            self._counts[f"{reason}_retries"] += 1
+            self._counts["total_delay"] += delay
+            if retry_after:
+                self._counts["retry_after_honored"] += 1
+
+    def record_give_up(self) -> None:
+        with self._lock:
+            self._counts["gave_up"] += 1
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        with self._lock:
+            return dict(self._counts)
+
+
+_policy = RetryPolicy()
+_policy_override: contextvars.ContextVar[typing.Optional[RetryPolicy]] = (
+    contextvars.ContextVar("fmpsdk_retry_policy", default=None)
+)
+_stats = RetryStats()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Return the policy in effect for the current context.
+    """
+    return _policy_override.get() or _policy
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """
+    Replace the global retry policy.
+    """
+    global _policy
+    if not isinstance(policy, RetryPolicy):
+        raise TypeError("policy must be a RetryPolicy instance.")
+    _policy = policy
+
+
+@contextlib.contextmanager
+def use_retry_policy(policy: RetryPolicy) -> typing.Iterator[RetryPolicy]:
+    """
+    Apply a retry policy to every request made inside the ``with`` block.
+
+    Example:
+        with use_retry_policy(RetryPolicy(max_retries=2, deadline=10)):
+            fmpsdk.quote(apikey=apikey, symbol="AAPL")
+    """
+    token = _policy_override.set(policy)
+    try:
+        yield policy
+    finally:
+        _policy_override.reset(token)
+
+
+def resolve_policy(
+    retries: typing.Optional[int] = None,
+    retry_delay: typing.Optional[float] = None,
+    policy: typing.Optional[RetryPolicy] = None,
+) -> RetryPolicy:
+    """
+    Pick the policy for one request: explicit policy, then legacy fixed-delay
+    arguments, then the contextual/global policy.
+    """
+    if policy is not None:
+        return policy
+    if retries is not None or retry_delay is not None:
+        current = get_retry_policy()
+        return RetryPolicy.constant(
+            current.max_retries if retries is None else retries,
+            current.base_delay if retry_delay is None else retry_delay,
+        )
+    return get_retry_policy()
+
+
+def parse_retry_after(response: typing.Any) -> typing.Optional[float]:
+    """
+    Read a Retry-After header (delta-seconds or HTTP-date) from a response.
+
+    :return: Seconds to wait, or None when absent or unparseable
+    """
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, typing.Mapping):
+        return None
+    value = headers.get("Retry-After")
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_retry_stats() -> typing.Dict[str, typing.Any]:
+    """
+    Return a snapshot of retry counters accumulated since the last reset.
+    """
+    return _stats.snapshot()
+
+
+def reset_retry_stats() -> None:
+    """
+    Reset all retry counters to zero.
+    """
+    _stats.reset()
+
+
+def record_retry(reason: str, delay: float, retry_after: bool = False) -> None:
+    _stats.record_retry(reason, delay, retry_after)
+
+
+def record_give_up() -> None:
+    _stats.record_give_up()
@@ -0,0 +1,219 @@
+import datetime
+import typing
+
+import numpy as np
+import pandas as pd
+
+from . import columnar
+
+# Keys accepted as date bounds when slicing a PriceSeries.
+_DATE_TYPES = (str, datetime.date, np.datetime64)
+
+
+def _to_datetime64(value: typing.Any) -> np.datetime64:
+    if isinstance(value, datetime.datetime):
+        return np.datetime64(value, "s")
+    return np.datetime64(value)
+
+
+class PriceSeries:
+    """
+    Price history held as contiguous NumPy arrays instead of model objects.
+
+    Dates are a ``datetime64`` array (day resolution for daily endpoints,
+    seconds for intraday ones) in ascending order, and every numeric field
+    of the response (``open``, ``high``, ``low``, ``close``, ``volume``,
+    ``vwap``, ...) is one typed array of the same length, read as an
+    attribute or by name. The symbol is kept once for the whole series.
+
+    Slicing never copies: ``series["2020-01-01":"2020-12-31"]`` selects
+    dates (both ends inclusive, like ``between``), integer slices select
+    positions, and both return a PriceSeries of views onto the same arrays.
+
+    Example:
+        prices = fmpsdk.historical_price_eod(apikey, "AAPL", output="series")
+        prices.close[-1], prices["2024-01-01":].high.max()
+    """
+
+    __slots__ = ("symbol", "dates", "_columns")
+
+    def __init__(
+        self,
+        dates: typing.Any,
+        columns: typing.Mapping[str, typing.Any],
+        symbol: typing.Optional[str] = None,
+    ):
+        """
+        :param dates: Ascending ``datetime64`` dates (or date strings)
+        :param columns: Mapping of field name to a value array per date
+        :param symbol: Ticker symbol of the series
+        """
+        self.dates = np.asarray(dates)
+        if self.dates.dtype.kind != "M":
+            self.dates = np.asarray(self.dates.tolist(), dtype="datetime64")
+        self._columns = {name: np.asarray(values) for name, values in columns.items()}
+        for name, values in self._columns.items():
+            if values.shape != self.dates.shape:
+                raise ValueError(f"Column {name!r} does not have one value per date")
+        self.symbol = symbol
+
+    @classmethod
+    def from_records(cls, raw: typing.Any, model: typing.Any = None) -> "PriceSeries":
+        """
+        Build a series from decoded records of a price endpoint.
+
+        Records may come in any date order (the API sends newest first).
+        Numeric fields become columns; other text fields are dropped.
+
+        :param raw: List of records with a ``date`` key
+        :param model: Model registered for the endpoint, used for column types
+        :return: PriceSeries in ascending date order
+        :raises ValueError: If the records have no dates or hold more than
+            one symbol
+        """
+        item_model = columnar.record_model(model)
+        if model is not None and (
+            item_model is None or "date" not in item_model.model_fields
+        ):
+            raise ValueError(
+                'output="series" is only available for price endpoints with '
+                "dated records."
+            )
+        if raw is None:
+            raw = []
+        if isinstance(raw, dict):
+            raw = [raw]
+        if item_model is not None:
+            columns = columnar.to_columns(raw, model)
+        else:
+            frame = pd.DataFrame.from_records(raw)
+            if len(frame) and "date" not in frame:
+                raise ValueError("Price records need a date")
+            columns = {name: frame[name].to_numpy() for name in frame}
+            for name, values in columns.items():
+                if name not in ("date", "symbol") and values.dtype == object:
+                    converted = pd.to_numeric(frame[name], errors="coerce")
+                    if converted.notna().any() or frame[name].isna().all():
+                        columns[name] = converted.to_numpy(dtype=float)
+
+        symbols = columns.pop("symbol", None)
+        symbol = None
+        if symbols is not None and len(symbols):
+            unique = set(symbols.tolist())
+            if len(unique) > 1:
+                raise ValueError("A PriceSeries holds a single symbol")
+            symbol = unique.pop()
+        dates = columns.pop("date", np.empty(0, dtype=object))
+        dates = np.asarray(np.asarray(dates).tolist(), dtype="datetime64")
+        if dates.dtype == np.dtype("M8"):
+            dates = dates.astype("M8[D]")
+        numeric = {
+            name: values
+            for name, values in columns.items()
+            if values.dtype.kind in "fiub"
+        }
+
+        # Reverse newest-first input; sort only when the order is mixed
+        order: typing.Any = slice(None)
+        if len(dates) > 1 and dates[0] > dates[-1]:
+            order = slice(None, None, -1)
+        if len(dates) > 1 and (np.diff(dates[order]) < np.timedelta64(0)).any():
+            order = np.argsort(dates, kind="stable")
+        return cls(
+            np.ascontiguousarray(dates[order]),
+            {name: np.ascontiguousarray(v[order]) for name, v in numeric.items()},
+            symbol,
+        )
+
+    @property
+    def fields(self) -> typing.Tuple[str, ...]:
+        """
+        Names of the value columns.
+        """
+        return tuple(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes held by the dates and value arrays.
+        """
+        return self.dates.nbytes + sum(v.nbytes for v in self._columns.values())
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Private names are never columns; copy and pickle probe dunders on
+        # instances whose slots are not set yet
+        if name.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return type(self), (self.dates, self._columns, self.symbol)
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        if isinstance(key, str):
+            if key == "date":
+                return self.dates
+            return self._columns[key]
+        if isinstance(key, slice):
+            if isinstance(key.start, _DATE_TYPES) or isinstance(key.stop, _DATE_TYPES):
+                if key.step is not None:
+                    raise ValueError("Date slices do not take a step")
+                return self.between(key.start, key.stop)
+            return self._view(key)
+        raise TypeError("Index a PriceSeries with a field name or a slice")
+
+    def _view(self, index: slice) -> "PriceSeries":
+        return PriceSeries(
+            self.dates[index],
+            {name: values[index] for name, values in self._columns.items()},
+            self.symbol,
+        )
+
+    def between(
+        self, from_date: typing.Any = None, to_date: typing.Any = None
+    ) -> "PriceSeries":
+        """
+        Select dates from ``from_date`` through ``to_date``, without copying.
+
+        Both bounds are inclusive at their own resolution, so
+        ``to_date="2024-01-05"`` keeps every intraday bar of that day.
+
+        :param from_date: First date (string, date or datetime64), or None
+        :param to_date: Last date, or None
+        :return: PriceSeries of views onto this series' arrays
+        """
+        start, stop = 0, len(self)
+        if from_date is not None:
+            start = int(np.searchsorted(self.dates, _to_datetime64(from_date)))
+        if to_date is not None:
+            bound = _to_datetime64(to_date)
+            stop = int(
+                # Adding 1 steps one unit of the bound's own resolution
+                np.searchsorted(self.dates, bound + 1)
+            )
+        return self._view(slice(start, max(start, stop)))
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Return the series as a DataFrame with a ``date`` column, oldest first.
+        """
+        return pd.DataFrame({"date": self.dates, **self._columns})
+
+    def __repr__(self) -> str:
+        span = ""
+        if len(self):
+            span = f", {self.dates[0]}..{self.dates[-1]}"
+        return (
+            f"PriceSeries(symbol={self.symbol!r}, bars={len(self)}{span}, "
+            f"fields={list(self._columns)})"
+        )
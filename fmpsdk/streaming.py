@@ -0,0 +1,434 @@
+import codecs
+import csv
+import io
+import itertools
+import json
+import logging
+import re
+import time
+import types
+import typing
+
+import pandas as pd
+import requests
+
+from . import columnar, decoding, retry, transport, url_methods
+from .exceptions import RATE_LIMIT_STATUS_CODE
+from .model_registry import ENDPOINT_MODEL_MAP
+from .utils import CALL_OPTIONS, raise_for_exception, validate_response
+
+# Bytes read from the socket at a time, and records validated together when
+# records are yielded one by one.
+READ_SIZE = 64 * 1024
+DEFAULT_BATCH_SIZE = 1000
+
+_WHITESPACE = " \t\r\n"
+_DELIMITERS = _WHITESPACE + ",]"
+_SEPARATOR = re.compile(r"[ \t\r\n]*,[ \t\r\n]*")
+_JSON_FETCHER = "__return_json"
+
+
+class NotAJSONArray(ValueError):
+    """Raised when a streamed response body is not a JSON array."""
+
+    def __init__(self, document: typing.Any):
+        super().__init__("Response body is not a JSON array.")
+        self.document = document
+
+
+def iter_json_array(chunks: typing.Iterable[bytes]) -> typing.Iterator[typing.Any]:
+    """
+    Decode the elements of a JSON array incrementally from chunks of bytes.
+
+    Only the unparsed tail of the input is kept in memory, so memory use is
+    bounded by the size of the largest element plus one chunk.
+
+    :param chunks: UTF-8 encoded JSON, split at arbitrary byte boundaries
+    :return: Iterator over the decoded array elements
+    :raises json.JSONDecodeError: If the input is not valid JSON
+    :raises NotAJSONArray: If the input is valid JSON but not an array; the
+        decoded document is available as ``document``
+    """
+    text = codecs.getincrementaldecoder("utf-8")()
+    raw_decode = json.JSONDecoder().raw_decode
+    source = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+    bulk = True
+    # "start": before "[", "first": after "[", "item": after ",", "sep": after a value
+    state = "start"
+
+    def read() -> bool:
+        nonlocal buffer, pos, exhausted, bulk
+        if exhausted:
+            return False
+        bulk = True
+        chunk = next(source, None)
+        exhausted = chunk is None
+        # Drop everything already parsed
+        buffer = buffer[pos:] + text.decode(chunk or b"", final=exhausted)
+        pos = 0
+        return True
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(buffer):
+            if not read():
+                raise json.JSONDecodeError("Unexpected end of data", buffer, pos)
+            continue
+
+        char = buffer[pos]
+        if state == "start":
+            if char != "[":
+                while read():
+                    pass
+                raise NotAJSONArray(json.loads(buffer))
+            pos += 1
+            state = "first"
+        elif state == "sep" or (state == "first" and char == "]"):
+            if char == "]":
+                return
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            state = "item"
+        else:
+            if bulk:
+                # Decode every complete object in the buffer in one call. A cut
+                # at a "}" that does not end an element gives invalid JSON, in
+                # which case elements are decoded one by one until the next read.
+                bulk = False
+                cut = buffer.rfind("}", pos)
+                if cut > pos:
+                    try:
+                        values = decoding.loads("[" + buffer[pos : cut + 1] + "]")
+                    except ValueError:
+                        values = None
+                    if values is not None:
+                        yield from values
+                        pos = cut + 1
+                        state = "sep"
+                        continue
+            try:
+                value, end = raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The value may be cut off at the end of the buffer
+                if read():
+                    continue
+                raise
+            # A number cut off by the chunk boundary (e.g. "1.5e" of "1.5e3")
+            # decodes to a prefix; only accept values followed by a delimiter
+            if (end == len(buffer) or buffer[end] not in _DELIMITERS) and read():
+                continue
+            yield value
+            # Fast path: step over the separator to the next value directly
+            match = _SEPARATOR.match(buffer, end)
+            if match is not None and match.end() < len(buffer):
+                pos = match.end()
+                state = "item"
+            else:
+                pos = end
+                state = "sep"
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only binary file over an iterator of byte chunks."""
+
+    def __init__(self, chunks: typing.Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _text(chunks: typing.Iterable[bytes]) -> io.TextIOWrapper:
+    return io.TextIOWrapper(
+        io.BufferedReader(_ChunkReader(chunks), READ_SIZE),
+        encoding="utf-8",
+        newline="",
+    )
+
+
+def iter_csv_records(
+    chunks: typing.Iterable[bytes],
+) -> typing.Iterator[typing.Dict[str, str]]:
+    """
+    Parse CSV rows lazily from chunks of bytes.
+
+    :param chunks: UTF-8 encoded CSV with a header row, split at arbitrary
+        byte boundaries
+    :return: Iterator over one dictionary of strings per row, as
+        ``csv.DictReader`` produces them
+    """
+    return iter(csv.DictReader(_text(chunks)))
+
+
+def iter_csv_frames(
+    chunks: typing.Iterable[bytes], model: typing.Any, chunk_size: int
+) -> typing.Iterator[pd.DataFrame]:
+    """
+    Parse CSV into typed DataFrames of up to ``chunk_size`` rows.
+
+    Rows are read with pandas' C parser and each column is converted once
+    per chunk (see ``columnar.convert_frame``), not cell by cell.
+
+    :param chunks: UTF-8 encoded CSV with a header row
+    :param model: Model registered for the endpoint
+    :param chunk_size: Maximum rows per DataFrame
+    :return: Iterator over DataFrames with the columns of ``to_pandas``
+    """
+    try:
+        reader = pd.read_csv(
+            _text(chunks), chunksize=chunk_size, dtype=str, keep_default_na=False
+        )
+    except pd.errors.EmptyDataError:
+        return
+    with reader:
+        for frame in reader:
+            yield columnar.convert_frame(frame, model)
+
+
+class _Request(typing.NamedTuple):
+    path: str
+    query_vars: typing.Dict[str, typing.Any]
+    version: str
+
+
+def _capture_json(
+    path: str, query_vars: typing.Dict, version: str = "stable", **_: typing.Any
+) -> _Request:
+    return _Request(path, query_vars, version)
+
+
+def _build_request(
+    func: typing.Callable[..., typing.Any], args: typing.Tuple, kwargs: typing.Dict
+) -> _Request:
+    """
+    Run an endpoint's body with ``__return_json`` captured to get its request.
+    """
+    raw = getattr(func, "__wrapped__", func)
+    if not (
+        isinstance(raw, types.FunctionType) and _JSON_FETCHER in raw.__code__.co_names
+    ):
+        raise ValueError(f"{raw.__name__} is not a JSON endpoint function.")
+    builder = types.FunctionType(
+        raw.__code__,
+        {**raw.__globals__, _JSON_FETCHER: _capture_json},
+        raw.__name__,
+        raw.__defaults__,
+        raw.__closure__,
+    )
+    builder.__kwdefaults__ = raw.__kwdefaults__
+    request = builder(*args, **kwargs)
+    if not isinstance(request, _Request):
+        raise ValueError(f"{raw.__name__} did not issue a JSON request.")
+    return request
+
+
+def _open(
+    url: str,
+    query_vars: typing.Dict,
+    retry_policy: typing.Optional[retry.RetryPolicy] = None,
+) -> requests.Response:
+    """
+    Send a streaming GET, retrying rate limiting and read timeouts before any
+    of the body has been read.
+    """
+    policy = retry.resolve_policy(policy=retry_policy)
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            response = transport.get(
+                url,
+                params=query_vars,
+                timeout=(url_methods.CONNECT_TIMEOUT, url_methods.READ_TIMEOUT),
+                stream=True,
+            )
+        except requests.exceptions.ReadTimeout:
+            logging.error(f"Read timeout occurred while connecting to {url}.")
+            delay = policy.next_delay(attempt, time.monotonic() - started)
+            if delay is None:
+                retry.record_give_up()
+                raise
+            retry.record_retry("timeout", delay, False)
+        else:
+            if response.status_code != RATE_LIMIT_STATUS_CODE:
+                return response
+            retry_after = retry.parse_retry_after(response)
+            delay = policy.next_delay(attempt, time.monotonic() - started, retry_after)
+            if delay is None:
+                retry.record_give_up()
+                return response
+            response.close()
+            retry.record_retry(
+                "rate_limit",
+                delay,
+                retry_after is not None and policy.respect_retry_after,
+            )
+        logging.info(
+            f"Retrying in {delay} seconds... "
+            f"({policy.max_retries - attempt} retries left)"
+        )
+        time.sleep(delay)
+        attempt += 1
+
+
+def _batches(
+    items: typing.Iterator[typing.Any], size: int
+) -> typing.Iterator[typing.List[typing.Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream(
+    func: typing.Callable[..., typing.Any],
+    *args: typing.Any,
+    chunk_size: typing.Optional[int] = None,
+    **kwargs: typing.Any,
+) -> typing.Iterator[typing.Any]:
+    """
+    Stream the records of an endpoint that returns one large JSON array or CSV
+    file (e.g. the bulk endpoints).
+
+    The response body is read from the socket and parsed incrementally, and
+    records are validated in batches, so memory use stays constant however
+    large the response is. CSV bodies are recognized from the ``datatype``
+    query value, the Content-Type header or their first byte; with
+    ``output="pandas"``/``"columns"`` they are parsed by pandas and converted
+    a column at a time per chunk. The disk cache, memoization and request
+    coalescing are not used.
+
+    Example:
+        for record in stream(fmpsdk.stock_list, apikey=apikey):
+            print(record.symbol)
+
+        for chunk in stream(fmpsdk.cik_list, apikey=apikey, chunk_size=5000):
+            frame = to_dataframe(chunk)
+
+        for frame in stream(
+            fmpsdk.eod_bulk, apikey=apikey, date=day, chunk_size=50_000,
+            output="pandas",
+        ):
+            frames.append(frame)
+
+    :param func: Endpoint function, e.g. ``fmpsdk.stock_list``
+    :param args: Positional arguments for the endpoint
+    :param chunk_size: Yield lists of up to this many records instead of single
+        records. Required for ``output="pandas"``, ``"columns"`` and
+        ``"series"``, which then yield one DataFrame, column mapping or
+        PriceSeries per chunk.
+    :param kwargs: Keyword arguments for the endpoint, including the per-call
+        options ``trusted``, ``validate_sample``, ``output`` and ``retry_policy``
+    :return: Iterator over validated records, or over chunks of them
+    :raises ValueError: If ``func`` is not an endpoint function, or ``chunk_size`` is
+        missing for a tabular output
+    :raises Exception: If the API responds with an error message
+    """
+    options = {k: kwargs.pop(k) for k in CALL_OPTIONS if k in kwargs}
+    policy = options.pop("retry_policy", None)
+    if policy is not None and not isinstance(policy, retry.RetryPolicy):
+        raise TypeError("retry_policy must be a RetryPolicy instance.")
+    output = options.get("output", "models")
+    if chunk_size is None and output in ("pandas", "columns", "series"):
+        raise ValueError(f'output="{output}" requires a chunk_size.')
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    endpoint = getattr(func, "__wrapped__", func).__name__
+    request = _build_request(func, args, kwargs)
+    # Check the arguments before any request is made
+    validate_response(endpoint, [], **options)
+    return _stream(endpoint, request, chunk_size, options, policy)
+
+
+def _is_csv(request: _Request, response: requests.Response, first: bytes) -> bool:
+    if request.query_vars.get("datatype") == "csv":
+        return True
+    if "csv" in str(response.headers.get("Content-Type", "")):
+        return True
+    return first.lstrip()[:1] not in (b"[", b"{", b"")
+
+
+def _stream(
+    endpoint: str,
+    request: _Request,
+    chunk_size: typing.Optional[int],
+    options: typing.Dict[str, typing.Any],
+    policy: typing.Optional[retry.RetryPolicy] = None,
+) -> typing.Iterator[typing.Any]:
+    base_url = url_methods.__get_base_url(request.version)
+    response = _open(f"{base_url}{request.path}", request.query_vars, policy)
+    with response:
+        raise_for_exception(response)
+        chunks = response.iter_content(READ_SIZE)
+        first = next((chunk for chunk in chunks if chunk), b"")
+        if not first:
+            # Empty bodies are how the API reports no data
+            return
+        chunks = itertools.chain([first], chunks)
+        if not _is_csv(request, response, first):
+            yield from _stream_json(endpoint, chunks, chunk_size, options)
+        elif options.get("output") in ("pandas", "columns"):
+            model = ENDPOINT_MODEL_MAP.get(endpoint)
+            for frame in iter_csv_frames(chunks, model, chunk_size):
+                if options["output"] == "columns":
+                    yield columnar.frame_columns(frame)
+                else:
+                    yield frame
+        else:
+            records = iter_csv_records(chunks)
+            yield from _validated(endpoint, records, chunk_size, options)
+
+
+def _stream_json(
+    endpoint: str,
+    chunks: typing.Iterable[bytes],
+    chunk_size: typing.Optional[int],
+    options: typing.Dict[str, typing.Any],
+) -> typing.Iterator[typing.Any]:
+    try:
+        yield from _validated(endpoint, iter_json_array(chunks), chunk_size, options)
+    except NotAJSONArray as e:
+        document = e.document
+        if isinstance(document, dict) and "Error Message" in document:
+            raise Exception(
+                f"API request failed with error: {document['Error Message']}",
+                document,
+            ) from None
+        # Empty objects are how the API reports no data
+        if document != {}:
+            raise
+
+
+def _validated(
+    endpoint: str,
+    records: typing.Iterator[typing.Any],
+    chunk_size: typing.Optional[int],
+    options: typing.Dict[str, typing.Any],
+) -> typing.Iterator[typing.Any]:
+    for batch in _batches(records, chunk_size or DEFAULT_BATCH_SIZE):
+        result = validate_response(endpoint, batch, **options)
+        if chunk_size is not None:
+            yield getattr(result, "root", result)
+        else:
+            yield from getattr(result, "root", result)
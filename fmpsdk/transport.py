@@ -0,0 +1,237 @@
+import threading
+import typing
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import rate_limit
+
+# Number of distinct host pools urllib3 keeps alive per session.
+POOL_CONNECTIONS = 10
+# Maximum number of keep-alive connections held open for a single host.
+POOL_MAXSIZE = 32
+# When True, callers wait for a free connection instead of opening extra ones.
+POOL_BLOCK = False
+
+_lock = threading.RLock()
+_session: typing.Optional[requests.Session] = None
+_pool_config: typing.Dict[str, typing.Any] = {
+    "pool_connections": POOL_CONNECTIONS,
+    "pool_maxsize": POOL_MAXSIZE,
+    "pool_block": POOL_BLOCK,
+    "host_limits": {},
+}
+
+
+def _host_prefix(host: str) -> str:
+    """
+    Normalise a host (or URL) to the prefix used when mounting an adapter.
+    """
+    if "://" not in host:
+        host = f"https://{host}"
+    parts = urlsplit(host)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a new session with sized connection pools for the current config.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_pool_config["pool_connections"],
+        pool_maxsize=_pool_config["pool_maxsize"],
+        pool_block=_pool_config["pool_block"],
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    for host, limit in _pool_config["host_limits"].items():
+        # Blocking pools turn the per-host maxsize into a hard connection cap.
+        session.mount(
+            _host_prefix(host),
+            HTTPAdapter(pool_connections=1, pool_maxsize=limit, pool_block=True),
+        )
+    return session
+
+
+def configure_transport(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    pool_block: bool = POOL_BLOCK,
+    host_limits: typing.Optional[typing.Dict[str, int]] = None,
+) -> requests.Session:
+    """
+    Rebuild the shared session with a new connection pool configuration.
+
+    :param pool_connections: Number of host pools to keep cached
+    :param pool_maxsize: Maximum keep-alive connections per host
+    :param pool_block: Block for a free connection when a pool is exhausted
+    :param host_limits: Optional hard connection limits keyed by host,
+        e.g. ``{"financialmodelingprep.com": 8}``
+    :return: The newly installed session
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError("pool_connections and pool_maxsize must be at least 1.")
+    for host, limit in (host_limits or {}).items():
+        if limit < 1:
+            raise ValueError(f"Connection limit for {host} must be at least 1.")
+
+    with _lock:
+        _pool_config.update(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            host_limits=dict(host_limits or {}),
+        )
+        return set_session(_build_session())
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared keep-alive session, creating it on first use.
+    """
+    global _session
+    session = _session
+    if session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+            session = _session
+    return session
+
+
+def set_session(session: typing.Optional[requests.Session]) -> requests.Session:
+    """
+    Atomically replace the shared session.
+
+    Requests already in flight finish on the session they started with; the
+    previous session is closed once it has been swapped out. Passing ``None``
+    resets the transport so the next request builds a fresh default session.
+
+    :param session: A configured ``requests.Session`` or None
+    :return: The session now in use
+    """
+    global _session
+    with _lock:
+        previous, _session = _session, session
+    if previous is not None and previous is not session:
+        previous.close()
+    return get_session()
+
+
+def close_session() -> None:
+    """
+    Close the shared session and release all pooled connections.
+    """
+    global _session
+    with _lock:
+        previous, _session = _session, None
+    if previous is not None:
+        previous.close()
+
+
+def get(url: str, **kwargs: typing.Any) -> requests.Response:
+    """
+    Issue a GET request through the shared session.
+
+    Waits for the client-side rate limiter first when one is configured.
+    """
+    rate_limit.acquire()
+    return get_session().get(url, **kwargs)
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls that share a key.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait for and receive the same result (or exception). Nothing is
+    kept once the call completes, so later callers start a fresh call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Hashable, Future] = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(
+        self, key: typing.Hashable, func: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """
+        Return the result of ``func``, sharing it with concurrent callers of ``key``.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats["calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Return the number of calls made and callers served by another's call.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = {"calls": 0, "coalesced": 0}
+
+
+_flight = SingleFlight()
+# When True, identical concurrent requests share one in-flight call.
+_coalesce = True
+
+
+def request_key(url: str, params: typing.Mapping[str, typing.Any]) -> typing.Hashable:
+    """
+    Key identifying a GET request by URL and query, in any parameter order.
+    """
+    return url, tuple(sorted((str(k), repr(v)) for k, v in params.items()))
+
+
+def coalesce(key: typing.Hashable, func: typing.Callable[[], typing.Any]) -> typing.Any:
+    """
+    Run ``func`` through the shared single-flight group unless coalescing is off.
+
+    Callers that coalesce receive the same decoded response object, which must
+    therefore not be mutated; ``url_methods.__return_json`` only coalesces
+    calls whose output mode never hands that object to the user.
+    """
+    if not _coalesce:
+        return func()
+    return _flight.do(key, func)
+
+
+def set_coalescing(enabled: bool) -> None:
+    """
+    Turn deduplication of identical concurrent requests on or off.
+    """
+    global _coalesce
+    _coalesce = enabled
+
+
+def get_coalescing_stats() -> typing.Dict[str, int]:
+    """
+    Return counters of issued and coalesced requests.
+    """
+    return _flight.stats()
@@ -0,0 +1,330 @@
+import contextlib
+import contextvars
+import random
+import threading
+import typing
+
+from pydantic import BaseModel
+
+from .columnar import record_model
+
+_MISSING = object()
+_new = object.__new__
+_setattr = object.__setattr__
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+class _Fallback(Exception):
+    """Raised by a field converter when a value needs full validation."""
+
+
+def _to_float(value: typing.Any) -> float:
+    if type(value) is float:
+        return value
+    if type(value) is bool:
+        raise _Fallback
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise _Fallback
+
+
+def _to_int(value: typing.Any) -> int:
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            raise _Fallback
+    if type(value) is float and value.is_integer():
+        return int(value)
+    raise _Fallback
+
+
+def _exact(kind: type) -> typing.Callable[[typing.Any], typing.Any]:
+    def convert(value: typing.Any) -> typing.Any:
+        if type(value) is kind:
+            return value
+        raise _Fallback
+
+    return convert
+
+
+def _passthrough(value: typing.Any) -> typing.Any:
+    return value
+
+
+_CONVERTERS: typing.Dict[type, typing.Callable[[typing.Any], typing.Any]] = {
+    float: _to_float,
+    int: _to_int,
+    str: _exact(str),
+    bool: _exact(bool),
+}
+
+
+class _Field(typing.NamedTuple):
+    name: str
+    key: str
+    kind: typing.Optional[type]
+    convert: typing.Callable[[typing.Any], typing.Any]
+    optional: bool
+    required: bool
+    default: typing.Any
+
+
+def _compile_field(name: str, info: typing.Any) -> typing.Optional[_Field]:
+    """
+    Describe one model field, or return None if it is not a plain type.
+    """
+    annotation = info.annotation
+    optional = False
+    kind: typing.Optional[type]
+    convert: typing.Callable[[typing.Any], typing.Any]
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        optional = len(args) < len(typing.get_args(annotation))
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if annotation is typing.Any:
+        kind, convert, optional = None, _passthrough, True
+    elif annotation in _SCALAR_TYPES:
+        kind, convert = annotation, _CONVERTERS[annotation]
+    elif typing.get_origin(annotation) is dict and all(
+        a is typing.Any or a in _SCALAR_TYPES for a in typing.get_args(annotation)
+    ):
+        kind, convert = dict, _exact(dict)
+    else:
+        return None
+    default = None
+    if not info.is_required():
+        default = info.get_default(call_default_factory=True)
+        # Shared mutable defaults would leak between records
+        if default is not None and not isinstance(default, _SCALAR_TYPES):
+            return None
+    key = info.alias or name
+    return _Field(name, key, kind, convert, optional, info.is_required(), default)
+
+
+def _slow_path(field: _Field) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Handle a value whose type is not already the declared one.
+    """
+
+    def convert(value: typing.Any) -> typing.Any:
+        if value is None or value == "None":
+            if not field.optional:
+                raise _Fallback
+            return None
+        return field.convert(value)
+
+    return convert
+
+
+def _compile_builder(
+    model: typing.Type[BaseModel], fields: typing.List[_Field]
+) -> typing.Callable[[typing.Dict[str, typing.Any]], BaseModel]:
+    """
+    Generate a straight-line constructor for ``model``.
+
+    For each field the common case - the value already has the declared type -
+    costs one ``type()`` check; everything else goes through a per-field slow
+    path. The instance is assembled the way ``model_construct`` does it, minus
+    its per-call field introspection.
+    """
+    namespace: typing.Dict[str, typing.Any] = {
+        "MISSING": _MISSING,
+        "Fallback": _Fallback,
+        "new": _new,
+        "setattr": _setattr,
+        "model": model,
+        "names": frozenset(f.name for f in fields),
+    }
+    lines = ["def build(record):", "    get = record.get", "    unset = None"]
+    for i, field in enumerate(fields):
+        namespace[f"kind{i}"] = field.kind
+        namespace[f"slow{i}"] = _slow_path(field)
+        namespace[f"default{i}"] = field.default
+        lines.append(f"    v{i} = get({field.key!r}, MISSING)")
+        if field.kind is None:
+            fast = f"v{i} is not MISSING"
+        elif field.kind is str:
+            fast = f'type(v{i}) is str and v{i} != "None"'
+        else:
+            fast = f"type(v{i}) is kind{i}"
+        lines.append(f"    if not ({fast}):")
+        lines.append(f"        if v{i} is MISSING:")
+        if field.required:
+            lines.append("            raise Fallback")
+        else:
+            lines.append(f"            unset = (unset or []) + [{field.name!r}]")
+            lines.append(f"            v{i} = default{i}")
+        lines.append("        else:")
+        lines.append(f"            v{i} = slow{i}(v{i})")
+    values = ", ".join(f"{f.name!r}: v{i}" for i, f in enumerate(fields))
+    lines += [
+        "    instance = new(model)",
+        f"    setattr(instance, '__dict__', {{{values}}})",
+        "    fields_set = set(names)",
+        "    if unset:",
+        "        fields_set.difference_update(unset)",
+        "    setattr(instance, '__pydantic_fields_set__', fields_set)",
+        "    setattr(instance, '__pydantic_extra__', None)",
+        "    setattr(instance, '__pydantic_private__', None)",
+        "    return instance",
+    ]
+    exec("\n".join(lines), namespace)
+    return typing.cast(
+        typing.Callable[[typing.Dict[str, typing.Any]], BaseModel], namespace["build"]
+    )
+
+
+class _Constructor:
+    """
+    Precompiled constructor that builds a record model without validation.
+
+    String values coming from CSV responses are converted to the declared
+    scalar type and ``"None"`` becomes None (as ``FMPBaseModel`` does),
+    mirroring what validation would do for well-formed data. Any value it
+    cannot handle cheaply raises ``_Fallback`` so the record is validated
+    normally instead.
+    """
+
+    def __init__(self, model: typing.Type[BaseModel]):
+        self.model = model
+        fields = [_compile_field(n, i) for n, i in model.model_fields.items()]
+        self.fields = fields
+        self._build: typing.Optional[
+            typing.Callable[[typing.Dict[str, typing.Any]], BaseModel]
+        ] = None
+        # Models with extra fields allowed or private attributes need the full
+        # validation machinery.
+        if (
+            all(f is not None for f in fields)
+            and model.model_config.get("extra") != "allow"
+            and not model.__private_attributes__
+        ):
+            self._build = _compile_builder(model, fields)  # type: ignore[arg-type]
+
+    def fits(self, record: typing.Any) -> bool:
+        """
+        Whether ``record`` already has the declared type for every field, so the
+        fast path pays off for records shaped like it.
+        """
+        if self._build is None or not isinstance(record, dict):
+            return False
+        for field in self.fields:
+            value = record.get(field.key)
+            if value is not None and field.kind is not None:
+                if type(value) is not field.kind:
+                    return False
+        return True
+
+    def build(self, record: typing.Any) -> BaseModel:
+        if self._build is None or not isinstance(record, dict):
+            return self.model.model_validate(record)
+        try:
+            return self._build(record)
+        except _Fallback:
+            return self.model.model_validate(record)
+
+
+_constructors: typing.Dict[type, _Constructor] = {}
+_constructors_lock = threading.Lock()
+
+
+def _constructor(model: typing.Type[BaseModel]) -> _Constructor:
+    constructor = _constructors.get(model)
+    if constructor is None:
+        with _constructors_lock:
+            constructor = _constructors.setdefault(model, _Constructor(model))
+    return constructor
+
+
+def construct(model: typing.Any, raw: typing.Any, sample: float = 0.0) -> typing.Any:
+    """
+    Build ``model`` from trusted data without running full validation.
+
+    Records of ``RootModel[List[X]]`` models are created with a precompiled
+    constructor and ``model_construct``; any other model is validated normally.
+
+    :param model: Model registered for the endpoint
+    :param raw: Decoded response
+    :param sample: Fraction (0-1) of records to validate fully anyway, so schema
+        drift still raises ``ValidationError``. At least one record is checked
+        when the fraction is positive.
+    :return: The model instance
+    """
+    item_model = record_model(model)
+    if item_model is None or not isinstance(raw, list):
+        return model.model_validate(raw)
+
+    sampled: typing.Set[int] = set()
+    if sample > 0 and raw:
+        count = min(len(raw), max(1, round(len(raw) * sample)))
+        sampled = set(random.sample(range(len(raw)), count))
+
+    constructor = _constructor(item_model)
+    if not constructor.fits(raw[0] if raw else None):
+        # Values need coercion (e.g. CSV strings); pydantic-core does that
+        # faster than Python, so validate the whole batch instead.
+        return model.model_validate(raw)
+    build = constructor.build
+    records = [
+        item_model.model_validate(record) if i in sampled else build(record)
+        for i, record in enumerate(raw)
+    ]
+    return model.model_construct(root=records)
+
+
+class TrustedMode(typing.NamedTuple):
+    enabled: bool = False
+    sample: float = 0.0
+
+
+_mode = TrustedMode()
+_mode_override: contextvars.ContextVar[typing.Optional[TrustedMode]] = (
+    contextvars.ContextVar("fmpsdk_trusted_mode", default=None)
+)
+
+
+def _check_sample(sample: float) -> None:
+    if not 0 <= sample <= 1:
+        raise ValueError("sample must be between 0 and 1.")
+
+
+def set_trusted_mode(enabled: bool = True, sample: float = 0.0) -> None:
+    """
+    Turn the trusted fast path on or off for every endpoint.
+
+    :param enabled: Build models without full validation
+    :param sample: Fraction of records still validated to detect schema drift
+    """
+    global _mode
+    _check_sample(sample)
+    _mode = TrustedMode(enabled, sample)
+
+
+def get_trusted_mode() -> TrustedMode:
+    """
+    Return the trusted-mode setting in effect for the current context.
+    """
+    return _mode_override.get() or _mode
+
+
+@contextlib.contextmanager
+def trusted_mode(enabled: bool = True, sample: float = 0.0) -> typing.Iterator[None]:
+    """
+    Apply a trusted-mode setting to endpoint calls inside the ``with`` block.
+
+    Example:
+        with trusted_mode(sample=0.01):
+            prices = fmpsdk.eod_bulk(apikey=apikey, date="2024-01-02")
+    """
+    _check_sample(sample)
+    token = _mode_override.set(TrustedMode(enabled, sample))
+    try:
+        yield
+    finally:
+        _mode_override.reset(token)
@@ -7,12 +7,20 @@ import typing
 
 import requests
 
+from . import cache, decoding, retry, transport
 from .exceptions import (
     RATE_LIMIT_STATUS_CODE,
     PremiumEndpointException,
     RateLimitExceededException,
 )
-from .utils import raise_for_exception
+from .retry import RetryPolicy
+from .utils import (
+    JSONBody,
+    current_endpoint,
+    json_body_accepted,
+    raise_for_exception,
+    response_exposed,
+)
 
 BASE_URL_STABLE: str = "https://financialmodelingprep.com/stable/"
 BASE_URL_V4: str = "https://financialmodelingprep.com/api/v4/"
@@ -41,103 +49,185 @@ def __return_json(
     path: str,
     query_vars: typing.Dict,
     version: str = "stable",
-    retries: int = RETRIES,
-    retry_delay: int = RETRY_DELAY,
-) -> typing.Optional[typing.List[typing.Any]]:
+    retries: typing.Optional[int] = None,
+    retry_delay: typing.Optional[float] = None,
+    retry_policy: typing.Optional[RetryPolicy] = None,
+    use_cache: bool = True,
+) -> typing.Union[typing.List[typing.Any], JSONBody, None]:
     """
     Query URL for JSON response for stable version of FMP API.
 
+    When the disk cache is configured (``cache.configure_cache``) and the
+    calling endpoint has a TTL in ``ENDPOINT_CACHE_TTL``, successful non-empty
+    responses are served from and stored in the cache (``cache.is_cacheable``).
+    Concurrent calls for the same URL and query share one in-flight request
+    (see ``transport.coalesce``), unless the calling endpoint returns the
+    decoded response itself (``utils.response_exposed``).
+
+    JSON arrays are returned undecoded as ``JSONBody`` when the calling
+    endpoint only validates them (``utils.json_body_accepted``) and the
+    response is not cached, so pydantic parses the bytes directly.
+
+    Rate limit (429) responses and read timeouts are retried in a loop according
+    to the retry policy: ``retry_policy`` if given, else a fixed-delay policy
+    built from ``retries``/``retry_delay`` if either is given, else the policy
+    from ``retry.use_retry_policy``/``retry.set_retry_policy``.
+
     :param path: Path after TLD of URL
     :param query_vars: Dictionary of query values (after "?" of URL)
     :param version: API version to use ("stable" or "v4")
-    :param retries: Number of retries for rate limiting
-    :param retry_delay: Delay in seconds between retries
+    :param retries: Number of retries with a fixed delay (legacy)
+    :param retry_delay: Fixed delay in seconds between retries (legacy)
+    :param retry_policy: Retry policy for this call
+    :param use_cache: Set to False to skip the disk cache for this call
     :return: JSON response
     """
 
+    response_cache = cache.get_cache() if use_cache else None
+    endpoint = current_endpoint()
+    ttl = cache.ttl_for(endpoint) if response_cache is not None else None
+    if ttl:
+        cache_key = cache.make_key(version, path, query_vars)
+        cached: typing.Optional[typing.List[typing.Any]] = response_cache.get(cache_key)
+        if cache.is_cacheable(cached):
+            return cached
+
     base_url = __get_base_url(version)
     url = f"{base_url}{path}"
-    return_var = None
-    try:
-        response = requests.get(
-            url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+    policy = retry.resolve_policy(retries, retry_delay, retry_policy)
+    json_body = json_body_accepted() and not ttl
+    return_var: typing.Union[typing.List[typing.Any], JSONBody, None]
+    if response_exposed():
+        # The caller gets the decoded object itself, so it must not be shared
+        return_var = __request_json(url, query_vars, policy, json_body)
+    else:
+        return_var = transport.coalesce(
+            (transport.request_key(url, query_vars), json_body),
+            lambda: __request_json(url, query_vars, policy, json_body),
         )
+    if ttl and cache.is_cacheable(return_var):
+        response_cache.set(cache_key, return_var, ttl, endpoint)
+    return return_var
+
+
+def __request_json(
+    url: str, query_vars: typing.Dict, policy: RetryPolicy, json_body: bool = False
+) -> typing.Union[typing.List[typing.Any], JSONBody, None]:
+    """
+    Issue the request for ``__return_json``, retrying under ``policy``.
 
-        if response.status_code == RATE_LIMIT_STATUS_CODE:
-            processed_query_vars = {
-                i: j for i, j in query_vars.items() if i != "apikey"
-            }
-            logging.warning(
-                f"{'Rate limit' if response.status_code == RATE_LIMIT_STATUS_CODE else 'HTTPS read timeout'} occurred: {response.status_code}. "
-                f"Query variables: {processed_query_vars}"
+    :param url: Full request URL
+    :param query_vars: Dictionary of query values (after "?" of URL)
+    :param policy: Retry policy for 429 responses and read timeouts
+    :param json_body: Return JSON arrays undecoded as ``JSONBody``
+    :return: JSON response
+    """
+    started = time.monotonic()
+    attempt = 0
+    return_var: typing.Union[typing.List[typing.Any], JSONBody, None] = None
+    while True:
+        try:
+            response = transport.get(
+                url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
             )
-            # Once retries are exhausted, raise_for_exception will handle it
-            if retries > 0:
-                logging.info(
-                    f"Retrying in {retry_delay} seconds... ({retries} retries left)"
+
+            if response.status_code == RATE_LIMIT_STATUS_CODE:
+                processed_query_vars = {
+                    i: j for i, j in query_vars.items() if i != "apikey"
+                }
+                logging.warning(
+                    f"Rate limit occurred: {response.status_code}. "
+                    f"Query variables: {processed_query_vars}"
                 )
-                time.sleep(retry_delay)
-                return __return_json(
-                    path, query_vars, version, retries - 1, retry_delay
+                retry_after = retry.parse_retry_after(response)
+                delay = policy.next_delay(
+                    attempt, time.monotonic() - started, retry_after
                 )
+                # Once retries are exhausted, raise_for_exception will handle it
+                if delay is not None:
+                    logging.info(
+                        f"Retrying in {delay} seconds... "
+                        f"({policy.max_retries - attempt} retries left)"
+                    )
+                    retry.record_retry(
+                        "rate_limit",
+                        delay,
+                        retry_after is not None and policy.respect_retry_after,
+                    )
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                retry.record_give_up()
 
-        raise_for_exception(response)
+            raise_for_exception(response)
 
-        if len(response.content) > 0:
-            if query_vars.get("datatype") == "csv":
-                # Handle CSV response
-                content = response.content.decode("utf-8")
-                try:
-                    reader = csv.DictReader(io.StringIO(content))
-                    return_var = [row for row in reader]
-                except csv.Error as e:
-                    logging.error(f"Failed to parse CSV response: {e}")
-                    raise e
-            else:
-                # Handle JSON response
-                return_var = response.json()
-
-        if len(response.content) == 0 or (
-            isinstance(return_var, dict) and len(return_var.keys()) == 0
-        ):
-            logging.warning("Response appears to have no data.  Returning empty List.")
-            return_var = []
-
-    except requests.exceptions.ReadTimeout:
-        logging.error(f"Read timeout occurred while connecting to {url}.")
-        if retries <= 0:
-            raise
+            if len(response.content) > 0:
+                if query_vars.get("datatype") == "csv":
+                    # Handle CSV response
+                    content = response.content.decode("utf-8")
+                    try:
+                        reader = csv.DictReader(io.StringIO(content))
+                        return_var = [row for row in reader]
+                    except csv.Error as e:
+                        logging.error(f"Failed to parse CSV response: {e}")
+                        raise e
+                elif json_body and response.content[:64].lstrip()[:1] == b"[":
+                    # Left for the endpoint's validator to parse
+                    return_var = JSONBody(response.content)
+                else:
+                    # Handle JSON response
+                    return_var = decoding.loads(response.content)
 
-        logging.info(f"Retrying in {retry_delay} seconds... ({retries} retries left)")
-        time.sleep(retry_delay)
-        return __return_json(path, query_vars, version, retries - 1, retry_delay)
-    except requests.Timeout:
-        logging.error(f"Connection to {url} timed out.")
-        raise
-    except requests.ConnectionError:
-        logging.error(
-            f"Connection to {url} failed:  DNS failure, refused connection or some other connection related issues."
-        )
-        raise
-    except requests.TooManyRedirects:
-        logging.error(
-            f"Request to {url} exceeds the maximum number of predefined redirections."
-        )
-        raise
-    except requests.HTTPError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except (PremiumEndpointException, RateLimitExceededException):
-        # Allow our custom exceptions to bubble up
-        raise
-    except json.JSONDecodeError:
-        # Allow JSON decode errors to be handled by the caller
-        raise
-    except (UnicodeDecodeError, csv.Error) as e:
-        # Handle specific parsing errors
-        logging.error(f"Data parsing error: {e}")
-        raise
-    return return_var
+            if len(response.content) == 0 or (
+                isinstance(return_var, dict) and len(return_var.keys()) == 0
+            ):
+                logging.warning(
+                    "Response appears to have no data.  Returning empty List."
+                )
+                return_var = []
+
+        except requests.exceptions.ReadTimeout:
+            logging.error(f"Read timeout occurred while connecting to {url}.")
+            delay = policy.next_delay(attempt, time.monotonic() - started)
+            if delay is None:
+                retry.record_give_up()
+                raise
+
+            logging.info(
+                f"Retrying in {delay} seconds... "
+                f"({policy.max_retries - attempt} retries left)"
+            )
+            retry.record_retry("timeout", delay, False)
+            time.sleep(delay)
+            attempt += 1
+            continue
+        except requests.Timeout:
+            logging.error(f"Connection to {url} timed out.")
+            raise
+        except requests.ConnectionError:
+            logging.error(
+                f"Connection to {url} failed:  DNS failure, refused connection or some other connection related issues."
+            )
+            raise
+        except requests.TooManyRedirects:
+            logging.error(
+                f"Request to {url} exceeds the maximum number of predefined redirections."
+            )
+            raise
+        except requests.HTTPError as e:
+            logging.error(f"HTTP error occurred: {e}")
+            raise
+        except (PremiumEndpointException, RateLimitExceededException):
+            # Allow our custom exceptions to bubble up
+            raise
+        except json.JSONDecodeError:
+            # Allow JSON decode errors to be handled by the caller
+            raise
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Handle specific parsing errors
+            logging.error(f"Data parsing error: {e}")
+            raise
+        return return_var
 
 
 def __return_binary_stable(
@@ -154,7 +244,7 @@ def __return_binary_stable(
     url = f"{BASE_URL_STABLE}{path}"
     return_var = None
     try:
-        response = requests.get(
+        response = transport.get(
             url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
         )
         response.raise_for_status()  # Raise an exception for bad status codes
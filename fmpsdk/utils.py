@@ -1,3 +1,7 @@
+import contextlib
+import contextvars
+import functools
+import itertools
 import json
 import time
 import typing
@@ -5,6 +9,7 @@ from typing import Any, Callable, TypeVar
 
 import pandas as pd
 
+from . import decoding
 from .exceptions import (
     INVALID_API_KEY_STATUS_CODE,
     POSSIBLE_INVALID_EXCHANGE_CODE,
@@ -21,6 +26,56 @@ from .exceptions import (
 
 T = TypeVar("T")
 
+# Name of the endpoint function whose request is being made, so transport-level
+# layers (e.g. the disk cache) can apply per-endpoint policies.
+_current_endpoint: contextvars.ContextVar[typing.Optional[str]] = (
+    contextvars.ContextVar("fmpsdk_current_endpoint", default=None)
+)
+
+
+def current_endpoint() -> typing.Optional[str]:
+    """
+    Return the name of the endpoint function currently being called, if any.
+    """
+    return _current_endpoint.get()
+
+
+# Set while a call will validate its response into models, so the transport
+# may hand back the undecoded body for ``validate_json``.
+_json_body_accepted: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "fmpsdk_json_body_accepted", default=False
+)
+
+
+def json_body_accepted() -> bool:
+    """
+    Whether the current endpoint call accepts an undecoded ``JSONBody``.
+    """
+    return _json_body_accepted.get()
+
+
+# Set while a call hands the decoded response to the user unchanged
+# (``output="raw"``), so the transport must not share it between callers.
+_response_exposed: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "fmpsdk_response_exposed", default=False
+)
+
+
+def response_exposed() -> bool:
+    """
+    Whether the current endpoint call returns the decoded response object itself.
+    """
+    return _response_exposed.get()
+
+
+class JSONBody(bytes):
+    """
+    Undecoded JSON response body.
+
+    Returned by the transport instead of decoded objects when the response is
+    only going to be validated, so pydantic can parse the bytes directly.
+    """
+
 
 def raise_for_exception(response):
     if response.status_code == PREMIUM_STATUS_CODE:
@@ -86,8 +141,144 @@ def raise_for_exception(response):
         )
 
 
+def _fetch_page(func, args, page, max_retries, retry_delay):
+    """
+    Call ``func`` for one page, retrying rate limiting and network errors.
+
+    Args:
+        func: The function to call for the page
+        args: Arguments to pass to the function (``page`` is added)
+        page: Page number to fetch
+        max_retries: Maximum number of retries for rate limiting
+        retry_delay: Delay in seconds between retries
+
+    Returns:
+        The page data, unwrapped from RootModel objects
+
+    Raises:
+        RateLimitExceededException: If rate limiting persists after max_retries
+    """
+    page_args = {**args, "page": page}
+
+    # Streamlined retry logic
+    response = None
+    for attempt in range(max_retries + 1):
+        try:
+            response = func(**page_args)
+
+            # Check for rate limiting in different response types
+            is_rate_limited = False
+
+            # Check HTTP response objects with status codes
+            if (
+                hasattr(response, "status_code")
+                and response.status_code == RATE_LIMIT_STATUS_CODE
+            ):
+                is_rate_limited = True
+
+            # Check dictionary responses for rate limit error messages
+            elif isinstance(response, dict) and "Error Message" in response:
+                error_msg = str(response["Error Message"]).lower()
+                rate_limit_patterns = [
+                    "limit reach",
+                    "rate limit",
+                    "too many requests",
+                    "upgrade your plan",
+                ]
+                if any(pattern in error_msg for pattern in rate_limit_patterns):
+                    is_rate_limited = True
+
+            if is_rate_limited:
+                if attempt < max_retries:
+                    print(
+                        f"Rate limiting detected on page {page}, attempt {attempt + 1}. "
+                        f"Waiting {retry_delay}s..."
+                    )
+                    time.sleep(retry_delay)
+                    continue
+                raise RateLimitExceededException(
+                    f"Rate limiting persisted after {max_retries} retries on page {page}"
+                )
+
+            break  # Successful response
+
+        except Exception as e:
+            # Simplified network error detection
+            if attempt < max_retries and "requests" in str(type(e)):
+                print(
+                    f"Network error on page {page}, attempt {attempt + 1}. "
+                    f"Retrying in {retry_delay // 2}s..."
+                )
+                time.sleep(retry_delay // 2)
+                continue
+            raise e
+
+    # Extract actual data, handling RootModel objects
+    return response.root if hasattr(response, "root") else response
+
+
+def _is_empty_page(data) -> bool:
+    """Check if page data indicates end of pagination."""
+    if data is None:
+        return True
+    if hasattr(data, "__len__"):
+        return len(data) == 0
+    return False
+
+
+def _iter_page_data(
+    func, args, page_limit, max_retries, retry_delay, prefetch=0
+) -> typing.Iterator[typing.Any]:
+    """
+    Yield the data of pages 0..page_limit in order, stopping at the first empty page.
+
+    With ``prefetch`` > 0, up to that many pages are requested concurrently ahead
+    of the page being consumed. Pages fetched speculatively past the first empty
+    page are discarded, and errors surface when their page is reached.
+    """
+    pages = range(page_limit + 1)
+    if prefetch <= 0:
+        for page in pages:
+            data = _fetch_page(func, args, page, max_retries, retry_delay)
+            if _is_empty_page(data):
+                return
+            yield data
+        return
+
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    page_iter = iter(pages)
+    in_flight: typing.Deque[Any] = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+
+    def submit(page: int) -> None:
+        # Prefetched pages see the caller's retry policy, cache bypass, etc.
+        context = contextvars.copy_context()
+        in_flight.append(
+            executor.submit(
+                context.run, _fetch_page, func, args, page, max_retries, retry_delay
+            )
+        )
+
+    try:
+        for page in itertools.islice(page_iter, prefetch):
+            submit(page)
+        while in_flight:
+            data = in_flight.popleft().result()
+            if _is_empty_page(data):
+                return
+            for page in itertools.islice(page_iter, 1):
+                submit(page)
+            yield data
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
 def iterate_over_pages(
-    func, args, page_limit=100, max_retries=3, retry_delay=10
+    func, args, page_limit=100, max_retries=3, retry_delay=10, prefetch=0
 ) -> typing.Union[typing.List, typing.Dict]:
     """
     Iterate over paginated API responses with rate limiting retry logic.
@@ -98,6 +289,9 @@ def iterate_over_pages(
         page_limit: Maximum number of pages to fetch (default: 100)
         max_retries: Maximum number of retries for rate limiting (default: 3)
         retry_delay: Delay in seconds between retries (default: 10)
+        prefetch: Number of pages to keep in flight concurrently (default: 0,
+            fetch strictly one page after another). Results are still combined
+            in page order and fetching stops at the first empty page.
 
     Returns:
         Union[List, Dict]: Combined data from all pages
@@ -110,19 +304,6 @@ def iterate_over_pages(
     data_list = []
     data_dict = {}
 
-    # Pre-determine response type handling functions to avoid repeated checks
-    def _extract_data(response):
-        """Extract actual data from response, handling RootModel objects."""
-        return response.root if hasattr(response, "root") else response
-
-    def _is_empty_response(data):
-        """Check if response indicates end of pagination."""
-        if data is None:
-            return True
-        if hasattr(data, "__len__"):
-            return len(data) == 0
-        return False
-
     def _handle_response_data(data, is_list_response):
         """Process response data efficiently based on type."""
         if isinstance(data, list):
@@ -139,69 +320,9 @@ def iterate_over_pages(
     response_type_determined = False
     is_list_response = True
 
-    for page in range(page_limit + 1):
-        args["page"] = page
-
-        # Streamlined retry logic
-        response = None
-        for attempt in range(max_retries + 1):
-            try:
-                response = func(**args)
-
-                # Check for rate limiting in different response types
-                is_rate_limited = False
-
-                # Check HTTP response objects with status codes
-                if (
-                    hasattr(response, "status_code")
-                    and response.status_code == RATE_LIMIT_STATUS_CODE
-                ):
-                    is_rate_limited = True
-
-                # Check dictionary responses for rate limit error messages
-                elif isinstance(response, dict) and "Error Message" in response:
-                    error_msg = str(response["Error Message"]).lower()
-                    rate_limit_patterns = [
-                        "limit reach",
-                        "rate limit",
-                        "too many requests",
-                        "upgrade your plan",
-                    ]
-                    if any(pattern in error_msg for pattern in rate_limit_patterns):
-                        is_rate_limited = True
-
-                if is_rate_limited:
-                    if attempt < max_retries:
-                        print(
-                            f"Rate limiting detected on page {page}, attempt {attempt + 1}. "
-                            f"Waiting {retry_delay}s..."
-                        )
-                        time.sleep(retry_delay)
-                        continue
-                    raise RateLimitExceededException(
-                        f"Rate limiting persisted after {max_retries} retries on page {page}"
-                    )
-
-                break  # Successful response
-
-            except Exception as e:
-                # Simplified network error detection
-                if attempt < max_retries and "requests" in str(type(e)):
-                    print(
-                        f"Network error on page {page}, attempt {attempt + 1}. "
-                        f"Retrying in {retry_delay // 2}s..."
-                    )
-                    time.sleep(retry_delay // 2)
-                    continue
-                raise e
-
-        # Extract actual data
-        actual_data = _extract_data(response)
-
-        # Check for end of pagination
-        if _is_empty_response(actual_data):
-            break
-
+    for actual_data in _iter_page_data(
+        func, args, page_limit, max_retries, retry_delay, prefetch
+    ):
         # Determine response type on first successful response
         if not response_type_determined:
             is_list_response = isinstance(actual_data, list)
@@ -218,53 +339,278 @@ def iterate_over_pages(
     return data_list if data_list else data_dict
 
 
+def iter_pages(
+    func, args, page_limit=100, max_retries=3, retry_delay=10, prefetch=0, batch=False
+) -> typing.Iterator[typing.Any]:
+    """
+    Lazily iterate over paginated API responses with rate limiting retry logic.
+
+    Unlike ``iterate_over_pages`` nothing is accumulated: each page is yielded as
+    soon as it arrives and can be released by the caller before the next one is
+    fetched. Stopping iteration early (``break`` or closing the generator) stops
+    further requests.
+
+    Args:
+        func: The function to call for each page
+        args: Arguments to pass to the function
+        page_limit: Maximum number of pages to fetch (default: 100)
+        max_retries: Maximum number of retries for rate limiting (default: 3)
+        retry_delay: Delay in seconds between retries (default: 10)
+        prefetch: Number of pages to keep in flight concurrently (default: 0)
+        batch: Yield each page's list of records instead of individual records
+
+    Yields:
+        Records from each page in page order, or whole pages when ``batch`` is True
+
+    Raises:
+        RateLimitExceededException: If rate limiting persists after max_retries
+
+    Examples:
+        >>> for trade in iter_pages(insider_trading_latest, {"apikey": key}):
+        ...     if trade.transactionDate < cutoff:
+        ...         break
+    """
+    for data in _iter_page_data(
+        func, args, page_limit, max_retries, retry_delay, prefetch
+    ):
+        if batch or not isinstance(data, list):
+            yield data
+        else:
+            yield from data
+
+
+# Keyword arguments accepted by every endpoint and handled by parse_response:
+# ``trusted`` and ``validate_sample`` override the trusted mode for one call,
+# ``output`` selects the return type (see ``fmpsdk.columnar.OUTPUT_MODES``) and
+# ``retry_policy`` replaces the retry policy (see ``fmpsdk.retry``) for one call.
+CALL_OPTIONS = ("trusted", "validate_sample", "output", "retry_policy")
+
+
 def parse_response(func: Callable[..., Any]) -> Callable[..., Any]:
+    import inspect
     from functools import wraps
 
-    from pydantic import ValidationError
-
-    from .model_registry import ENDPOINT_MODEL_MAP
+    from . import memo, retry, trusted
+
+    endpoint = func.__name__
+    signature = inspect.signature(func)
+
+    def call(args: Any, kwargs: Any, options: typing.Dict[str, Any]) -> Any:
+        options = dict(options)
+        policy = options.pop("retry_policy", None)
+        if policy is not None and not isinstance(policy, retry.RetryPolicy):
+            raise TypeError("retry_policy must be a RetryPolicy instance.")
+        is_trusted = options.get("trusted")
+        if is_trusted is None:
+            is_trusted = trusted.get_trusted_mode().enabled
+        accept_body = options.get("output", "models") == "models" and not is_trusted
+        token = _current_endpoint.set(endpoint)
+        body_token = _json_body_accepted.set(accept_body)
+        exposed_token = _response_exposed.set(options.get("output") == "raw")
+        # The transport picks the policy up in retry.resolve_policy
+        policy_scope = (
+            retry.use_retry_policy(policy)
+            if policy is not None
+            else contextlib.nullcontext()
+        )
+        try:
+            with policy_scope:
+                raw = func(*args, **kwargs)
+        finally:
+            _response_exposed.reset(exposed_token)
+            _json_body_accepted.reset(body_token)
+            _current_endpoint.reset(token)
+        return validate_response(endpoint, raw, **options)
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        raw = func(*args, **kwargs)
+        # Per-call options are consumed here, not passed to the endpoint
+        options = {k: kwargs.pop(k) for k in CALL_OPTIONS if k in kwargs}
+        cache = memo.get_memo()
+        # Only model results are memoized; DataFrames and arrays are mutable
+        if (
+            cache is None
+            or not cache.enabled_for(endpoint)
+            or options.get("output", "models") != "models"
+        ):
+            return call(args, kwargs, options)
+        try:
+            bound = signature.bind(*args, **kwargs)
+        except TypeError:
+            return call(args, kwargs, options)
+        bound.apply_defaults()
+        key = memo.make_key(endpoint, bound.arguments)
+        if key is None:
+            return call(args, kwargs, options)
+        result = cache.get(key)
+        if result is memo.MISSING:
+            result = call(args, kwargs, options)
+            # Premium (HTTP response) and API error results are not memoized
+            if not hasattr(result, "status_code") and not isinstance(result, dict):
+                cache.set(key, result)
+        return result
+
+    return wrapper
 
-        # Check for HTTP Response objects (e.g., 402 for premium endpoints)
-        if hasattr(raw, "status_code"):
-            return raw  # Return response object as-is for premium endpoint detection
 
-        # Check for API error responses and return them as-is
-        if isinstance(raw, dict) and "Error Message" in raw:
-            return raw
+def validate_response(
+    endpoint: str,
+    raw: Any,
+    trusted: typing.Optional[bool] = None,
+    validate_sample: typing.Optional[float] = None,
+    output: str = "models",
+) -> Any:
+    """
+    Validate a raw API response against the model registered for an endpoint.
 
-        model = ENDPOINT_MODEL_MAP.get(func.__name__)
-        if model:
-            # Defensive: If API returns None, convert to empty list for list models
-            if raw is None:
-                raw = []
+    This is the validation step of ``parse_response``, shared with callers that
+    fetch the raw response themselves (e.g. the asyncio client).
 
-            try:
-                # Try BaseModel.model_validate first
-                if hasattr(model, "model_validate"):
-                    result = model.model_validate(raw)
-                else:
-                    # Fallback to constructor for RootModel
-                    result = model(raw)
-            except ValidationError as ve:
-                _report_validation_error(func.__name__, raw, ve)
-                raise
-            except (AttributeError, TypeError):
-                # Final fallback to constructor
+    In trusted mode list models are built with ``model_construct`` and only a
+    sample of records is validated (see ``fmpsdk.trusted``). A ``JSONBody`` is
+    validated from its bytes with the endpoint's cached validator.
+
+    Args:
+        endpoint: Endpoint function name as registered in ENDPOINT_MODEL_MAP
+        raw: Decoded JSON/CSV response returned by the transport, or an
+            undecoded ``JSONBody``
+        trusted: Override the global/contextual trusted mode for this response
+        validate_sample: Fraction of records to validate in trusted mode
+        output: "models" (default) for the validated model, or "raw",
+            "columns" or "pandas" to skip model construction entirely
+            (see ``fmpsdk.columnar``)
+
+    Returns:
+        The validated model instance (or the requested output), or ``raw``
+        unchanged for HTTP response objects and API error dictionaries
+
+    Raises:
+        ValueError: If no model is registered for the endpoint
+        ValidationError: If the response does not match the registered model
+    """
+    from pydantic import ValidationError
+
+    from . import columnar
+    from . import trusted as trusted_settings
+    from .model_registry import ENDPOINT_MODEL_MAP
+    from .models import NONE_NORMALIZED, FMPBaseModel, normalize_none_strings
+
+    if output not in columnar.OUTPUT_MODES:
+        raise ValueError(
+            f"output must be one of {columnar.OUTPUT_MODES}, not {output!r}."
+        )
+
+    if isinstance(raw, JSONBody):
+        mode = trusted_settings.get_trusted_mode()
+        if (
+            output == "models"
+            and not (mode.enabled if trusted is None else trusted)
+            and endpoint in ENDPOINT_MODEL_MAP
+        ):
+            return _validate_json(endpoint, raw)
+        raw = decoding.loads(raw)
+
+    # Check for HTTP Response objects (e.g., 402 for premium endpoints)
+    if hasattr(raw, "status_code"):
+        return raw  # Return response object as-is for premium endpoint detection
+
+    # Check for API error responses and return them as-is
+    if isinstance(raw, dict) and "Error Message" in raw:
+        return raw
+
+    model = ENDPOINT_MODEL_MAP.get(endpoint)
+    if output != "models":
+        return columnar.convert_output(raw, model, output)
+    if model:
+        # Defensive: If API returns None, convert to empty list for list models
+        if raw is None:
+            raw = []
+
+        mode = trusted_settings.get_trusted_mode()
+        if trusted is None:
+            trusted = mode.enabled
+        if validate_sample is None:
+            validate_sample = mode.sample
+
+        # Normalize "None" strings once for the whole batch so record models
+        # skip their per-record conversion
+        item_model = columnar.record_model(model)
+        context = None
+        if (
+            isinstance(raw, list)
+            and item_model is not None
+            and issubclass(item_model, FMPBaseModel)
+            and not _has_nested_models(item_model)
+        ):
+            raw = normalize_none_strings(raw)
+            context = {NONE_NORMALIZED: True}
+
+        try:
+            if trusted:
+                result = trusted_settings.construct(model, raw, validate_sample)
+            # Try BaseModel.model_validate first
+            elif hasattr(model, "model_validate"):
+                result = model.model_validate(raw, context=context)
+            else:
+                # Fallback to constructor for RootModel
                 result = model(raw)
-            # Do NOT unwrap __root__ or root; always return the model instance
-            return result
-        else:
-            raise ValueError(
-                f"No model found for endpoint: {func.__name__}. "
-                "Ensure the endpoint is registered in ENDPOINT_MODEL_MAP."
-            )
+        except ValidationError as ve:
+            _report_validation_error(endpoint, raw, ve)
+            raise
+        except (AttributeError, TypeError):
+            # Final fallback to constructor
+            result = model(raw)
+        # Do NOT unwrap __root__ or root; always return the model instance
+        return result
+    else:
+        raise ValueError(
+            f"No model found for endpoint: {endpoint}. "
+            "Ensure the endpoint is registered in ENDPOINT_MODEL_MAP."
+        )
 
-    return wrapper
+
+def _validate_json(endpoint: str, body: bytes) -> Any:
+    """
+    Validate an undecoded JSON body with the endpoint's cached validator.
+    """
+    from pydantic import ValidationError
+
+    from . import columnar
+    from .model_registry import ENDPOINT_MODEL_MAP, get_validator
+    from .models import NONE_NORMALIZED, FMPBaseModel
+
+    # Without any "None" strings in the body, flat record models can skip
+    # their per-record conversion
+    item_model = columnar.record_model(ENDPOINT_MODEL_MAP[endpoint])
+    context = None
+    if (
+        item_model is not None
+        and issubclass(item_model, FMPBaseModel)
+        and not _has_nested_models(item_model)
+        and b'"None"' not in body
+    ):
+        context = {NONE_NORMALIZED: True}
+    try:
+        return get_validator(endpoint).validate_json(body, context=context)
+    except ValidationError as ve:
+        _report_validation_error(endpoint, decoding.loads(body), ve)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _has_nested_models(model: Any) -> bool:
+    """
+    Whether any field of ``model`` holds other models, which would still need
+    their own "None"-string conversion after a top-level batch normalization.
+    """
+    from pydantic import BaseModel
+
+    def contains_model(annotation: Any) -> bool:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return True
+        return any(contains_model(arg) for arg in typing.get_args(annotation))
+
+    return any(contains_model(info.annotation) for info in model.model_fields.values())
 
 
 def _report_validation_error(endpoint: str, raw: Any, err: Any) -> None:
@@ -1,7 +1,10 @@
+import json
 import os
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -36,6 +39,39 @@ def test_config():
     }
 
 
+def make_response(
+    content: Any = b"[]",
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 7,
+) -> MagicMock:
+    """
+    Build a mocked ``requests`` response for transport tests.
+
+    Args:
+        content: Body bytes, or any other value to send as its JSON encoding
+        status_code: HTTP status code
+        headers: Response headers
+        chunk_size: Bytes per chunk yielded by ``iter_content`` when streamed
+
+    Returns:
+        Mock usable as a plain or streamed (context manager) response
+    """
+    body = content if isinstance(content, bytes) else json.dumps(content).encode()
+    response = MagicMock()
+    response.status_code = status_code
+    response.reason = "Too Many Requests" if status_code == 429 else "OK"
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.content = body
+    response.text = body.decode(errors="replace")
+    response.json.side_effect = lambda: json.loads(body)
+    response.iter_content.side_effect = lambda n: iter(
+        [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    )
+    response.__enter__.return_value = response
+    return response
+
+
 def get_response_models(data: Union[List, Dict, Any], model_class: type) -> List[Any]:
     """
     Convert response data to list of Pydantic models.
@@ -0,0 +1,284 @@
+import asyncio
+import gc
+import inspect
+import json
+import threading
+import warnings
+from unittest.mock import AsyncMock, call, patch
+
+import pytest
+from pydantic import ValidationError
+
+import fmpsdk
+from fmpsdk import aio, rate_limit
+from fmpsdk.aio import transport as aio_transport
+from fmpsdk.exceptions import PremiumEndpointException
+from fmpsdk.models import FMPQuoteFull
+from fmpsdk.retry import RetryPolicy
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, status=200, body=b"[]", reason="OK", url="https://x/"):
+        self.status = status
+        self.reason = reason
+        self.url = url
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class FakeSession:
+    """Records requests and replays queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, params=None):
+        self.calls.append((url, params))
+        response = self.responses.pop(0) if self.responses else FakeResponse()
+        session = self
+
+        class _Tracked(FakeResponse):
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, *exc):
+                session.in_flight -= 1
+                return False
+
+        return _Tracked(response.status, response._body, response.reason, url)
+
+
+QUOTE = {
+    "symbol": "AAPL",
+    "name": "Apple Inc.",
+    "price": 150.0,
+    "changePercentage": 1.0,
+    "change": 1.5,
+    "volume": 1000,
+    "dayLow": 148.0,
+    "dayHigh": 151.0,
+    "yearHigh": 200.0,
+    "yearLow": 120.0,
+    "marketCap": 2.5e12,
+    "priceAvg50": 145.0,
+    "priceAvg200": 140.0,
+    "exchange": "NASDAQ",
+    "open": 149.0,
+    "previousClose": 148.5,
+    "timestamp": 1700000000,
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_aio_transport():
+    """Reset the asyncio transport around every test."""
+    aio.configure_transport()
+    yield
+    aio.set_session(None)
+    aio.configure_transport()
+
+
+class TestAsyncEndpoints:
+    """Test the awaitable endpoint twins."""
+
+    def test_every_endpoint_has_async_twin(self):
+        """Test every exported sync endpoint has an async counterpart."""
+        endpoints = [
+            name
+            for name in fmpsdk.__all__
+            if hasattr(getattr(fmpsdk, name, None), "__wrapped__")
+        ]
+        assert len(endpoints) > 200
+        for name in endpoints:
+            assert inspect.iscoroutinefunction(getattr(aio, name)), name
+
+    def test_signature_matches_sync_endpoint(self):
+        """Test async twins keep the sync signature."""
+        assert inspect.signature(aio.quote) == inspect.signature(fmpsdk.quote)
+        assert inspect.signature(aio.historical_chart) == inspect.signature(
+            fmpsdk.historical_chart
+        )
+
+    def test_quote_is_validated(self):
+        """Test an async call returns the same validated model."""
+        session = FakeSession(FakeResponse(body=json.dumps([QUOTE]).encode()))
+        aio.set_session(session)
+
+        result = asyncio.run(aio.quote(apikey="k", symbol="AAPL"))
+
+        assert isinstance(result.root[0], FMPQuoteFull)
+        assert result.root[0].symbol == "AAPL"
+        url, params = session.calls[0]
+        assert url.endswith("stable/quote")
+        assert ("symbol", "AAPL") in params
+
+    def test_validation_error_propagates(self):
+        """Test schema violations raise like the sync client."""
+        aio.set_session(FakeSession(FakeResponse(body=b'[{"symbol": "AAPL"}]')))
+
+        with pytest.raises(ValidationError):
+            asyncio.run(aio.quote(apikey="k", symbol="AAPL"))
+
+    def test_argument_validation_runs_before_request(self):
+        """Test endpoint argument checks still raise without any request."""
+        session = FakeSession()
+        aio.set_session(session)
+
+        with pytest.raises(ValueError, match="Invalid interval"):
+            asyncio.run(aio.historical_chart("AAPL", "2min", "k"))
+        assert session.calls == []
+
+    def test_binary_endpoint(self):
+        """Test binary endpoints return raw bytes."""
+        aio.set_session(FakeSession(FakeResponse(body=b"PK\x03\x04")))
+
+        result = asyncio.run(
+            aio.financial_reports_xlsx(
+                apikey="k", symbol="AAPL", year=2024, period="FY"
+            )
+        )
+
+        assert result == b"PK\x03\x04"
+
+    def test_premium_endpoint_raises(self):
+        """Test 402 premium responses raise PremiumEndpointException."""
+        aio.set_session(FakeSession(FakeResponse(status=402, body=b"Premium Endpoint")))
+
+        with pytest.raises(PremiumEndpointException):
+            asyncio.run(aio.quote(apikey="k", symbol="AAPL"))
+
+
+class TestAsyncTransport:
+    """Test the asyncio transport."""
+
+    def test_empty_dict_returns_empty_list(self):
+        """Test empty responses become empty lists."""
+        aio.set_session(FakeSession(FakeResponse(body=b"{}")))
+        assert asyncio.run(aio.return_json("quote", {"apikey": "k"})) == []
+
+    def test_csv_response(self):
+        """Test CSV responses are parsed into dictionaries."""
+        aio.set_session(FakeSession(FakeResponse(body=b"symbol,price\nAAPL,1\n")))
+
+        result = asyncio.run(
+            aio.return_json("eod-bulk", {"apikey": "k", "datatype": "csv"})
+        )
+
+        assert result == [{"symbol": "AAPL", "price": "1"}]
+
+    def test_params_encoded_like_requests(self):
+        """Test None values are dropped and lists repeated."""
+        params = aio_transport._encode_params(
+            {"a": None, "b": True, "c": [1, 2], "d": "x"}
+        )
+        assert params == [("b", "True"), ("c", "1"), ("c", "2"), ("d", "x")]
+
+    def test_rate_limit_retry(self):
+        """Test 429 responses are retried."""
+        session = FakeSession(
+            FakeResponse(status=429, body=b"Limit Reach"),
+            FakeResponse(body=b'[{"a": 1}]'),
+        )
+        aio.set_session(session)
+
+        with patch(
+            "fmpsdk.aio.transport.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            result = asyncio.run(
+                aio.return_json("quote", {"apikey": "k"}, retries=1, retry_delay=3)
+            )
+
+        assert result == [{"a": 1}]
+        assert mock_sleep.await_args_list.count(call(3)) == 1
+        assert len(session.calls) == 2
+
+    def test_endpoint_retry_policy(self):
+        """Test an endpoint's retry_policy keyword reaches the async transport."""
+        session = FakeSession(
+            FakeResponse(status=429, body=b"Limit Reach"),
+            FakeResponse(body=json.dumps([QUOTE]).encode()),
+        )
+        aio.set_session(session)
+        policy = RetryPolicy(max_retries=1, base_delay=4, jitter=False)
+
+        with patch(
+            "fmpsdk.aio.transport.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            result = asyncio.run(
+                aio.quote(apikey="k", symbol="AAPL", retry_policy=policy)
+            )
+
+        assert result.root[0].symbol == "AAPL"
+        assert mock_sleep.await_args_list.count(call(4)) == 1
+
+    def test_concurrency_limit(self):
+        """Test no more than max_concurrency requests are in flight."""
+        session = FakeSession(*[FakeResponse(body=b'[{"a": 1}]') for _ in range(20)])
+        aio.set_session(session)
+        aio.configure_transport(max_concurrency=3)
+
+        async def run():
+            return await asyncio.gather(
+                *(aio.return_json("quote", {"apikey": "k"}) for _ in range(20))
+            )
+
+        results = asyncio.run(run())
+
+        assert len(results) == 20
+        assert session.max_in_flight <= 3
+
+    def test_session_replaced_per_event_loop(self):
+        """Test a new event loop closes the session left by the previous one."""
+        pytest.importorskip("aiohttp")
+
+        async def session():
+            return aio.get_session()
+
+        first = asyncio.run(session())
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+            second = asyncio.run(session())
+            assert second is not first
+            assert first.closed
+            del first
+            gc.collect()
+        asyncio.run(aio.close_session())
+        assert second.closed
+
+    def test_file_limiter_reserved_off_loop(self, tmp_path):
+        """Test a file-backed limiter is not called on the event loop thread."""
+        aio.set_session(FakeSession())
+        limiter = rate_limit.FileTokenBucket(600, str(tmp_path / "bucket"))
+        threads = []
+        reserve = limiter.reserve
+
+        def record_thread():
+            threads.append(threading.get_ident())
+            return reserve()
+
+        limiter.reserve = record_thread
+        with patch("fmpsdk.rate_limit.get_rate_limiter", return_value=limiter):
+            asyncio.run(aio.return_json("quote", {"apikey": "k"}))
+
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_configure_rejects_invalid_limits(self):
+        """Test invalid pool limits raise ValueError."""
+        with pytest.raises(ValueError):
+            aio.configure_transport(max_concurrency=0)
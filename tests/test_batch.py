@@ -0,0 +1,149 @@
+import contextvars
+import threading
+import time
+
+import pytest
+
+from fmpsdk import retry
+from fmpsdk.batch import BatchResult, expand_param_grid, map_endpoint
+from fmpsdk.exceptions import PremiumEndpointException
+from fmpsdk.retry import RetryPolicy
+
+
+def fake_endpoint(apikey, symbol, period="annual"):
+    """Stand-in endpoint returning its arguments."""
+    if symbol == "PREMIUM":
+        raise PremiumEndpointException("Premium Endpoint")
+    return {"apikey": apikey, "symbol": symbol, "period": period}
+
+
+class TestExpandParamGrid:
+    """Test parameter grid expansion."""
+
+    def test_mapping_is_cartesian_product(self):
+        """Test a mapping expands to every combination."""
+        grid = {"symbol": ["AAPL", "MSFT"], "period": ["annual", "quarter"]}
+        assert list(expand_param_grid(grid)) == [
+            {"symbol": "AAPL", "period": "annual"},
+            {"symbol": "AAPL", "period": "quarter"},
+            {"symbol": "MSFT", "period": "annual"},
+            {"symbol": "MSFT", "period": "quarter"},
+        ]
+
+    def test_scalar_string_not_split(self):
+        """Test string values are treated as a single value."""
+        assert list(expand_param_grid({"symbol": "AAPL"})) == [{"symbol": "AAPL"}]
+
+    def test_iterable_of_dicts(self):
+        """Test an iterable of dictionaries is used as-is."""
+        grid = ({"symbol": s} for s in ["AAPL", "MSFT"])
+        assert list(expand_param_grid(grid)) == [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
+
+
+class TestMapEndpoint:
+    """Test the concurrent batch executor."""
+
+    def test_all_results_returned_with_common_kwargs(self):
+        """Test every parameter set is called with shared keyword arguments."""
+        symbols = [f"S{i}" for i in range(50)]
+        results = list(
+            map_endpoint(fake_endpoint, {"symbol": symbols}, max_workers=4, apikey="k")
+        )
+
+        assert len(results) == 50
+        assert all(isinstance(r, BatchResult) and r.ok for r in results)
+        assert {r.result["symbol"] for r in results} == set(symbols)
+        assert all(r.result["apikey"] == "k" for r in results)
+
+    def test_errors_are_isolated(self):
+        """Test a failing item does not abort the batch."""
+        grid = [{"symbol": "AAPL"}, {"symbol": "PREMIUM"}, {"symbol": "MSFT"}]
+        results = list(map_endpoint(fake_endpoint, grid, ordered=True, apikey="k"))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, PremiumEndpointException)
+        assert results[1].params == {"symbol": "PREMIUM"}
+        assert results[1].result is None
+
+    def test_ordered_mode_preserves_input_order(self):
+        """Test ordered mode yields in parameter order despite uneven latency."""
+
+        def slow_first(symbol):
+            time.sleep(0.05 if symbol == "S0" else 0)
+            return symbol
+
+        symbols = [f"S{i}" for i in range(10)]
+        results = list(
+            map_endpoint(slow_first, {"symbol": symbols}, max_workers=4, ordered=True)
+        )
+
+        assert [r.result for r in results] == symbols
+        assert [r.position for r in results] == list(range(10))
+
+    def test_unordered_mode_yields_as_completed(self):
+        """Test unordered mode yields fast results before slow ones."""
+
+        def slow_first(symbol):
+            time.sleep(0.2 if symbol == "S0" else 0)
+            return symbol
+
+        results = list(
+            map_endpoint(slow_first, {"symbol": ["S0", "S1", "S2"]}, max_workers=3)
+        )
+
+        assert results[-1].result == "S0"
+
+    def test_runs_concurrently_up_to_max_workers(self):
+        """Test no more than max_workers calls run at once."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def tracked(symbol):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return symbol
+
+        list(map_endpoint(tracked, {"symbol": list(range(30))}, max_workers=5))
+
+        assert 1 < state["peak"] <= 5
+
+    def test_param_grid_consumed_lazily(self):
+        """Test the grid is not materialised up front."""
+        consumed = []
+
+        def grid():
+            for i in range(100):
+                consumed.append(i)
+                yield {"symbol": i}
+
+        results = map_endpoint(lambda symbol: symbol, grid(), max_workers=2)
+        next(results)
+        assert len(consumed) < 100
+        results.close()
+
+    def test_caller_context_reaches_workers(self):
+        """Test context-scoped settings apply inside worker threads."""
+        flag = contextvars.ContextVar("flag", default="default")
+
+        def read_settings(symbol):
+            return flag.get(), retry.get_retry_policy().max_retries
+
+        token = flag.set("caller")
+        try:
+            with retry.use_retry_policy(RetryPolicy(max_retries=1)):
+                results = list(
+                    map_endpoint(read_settings, {"symbol": range(20)}, max_workers=4)
+                )
+        finally:
+            flag.reset(token)
+
+        assert {r.result for r in results} == {("caller", 1)}
+
+    def test_invalid_max_workers(self):
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError):
+            list(map_endpoint(fake_endpoint, [], max_workers=0))
@@ -1,10 +1,16 @@
+import os
+import threading
 from datetime import datetime, timedelta
 from typing import List, Union
+from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
+import requests
+from pydantic import RootModel
 
 from fmpsdk import bulk
-from fmpsdk.exceptions import InvalidAPIKeyException
+from fmpsdk.exceptions import InvalidAPIKeyException, PremiumEndpointException
 from fmpsdk.models import (
     FMPBalanceSheetGrowth,
     FMPBalanceSheetStatement,
@@ -151,14 +157,16 @@ def validate_bulk_financial_data(
         ), f"Only {valid_dates}/{total_statements} statements have valid dates"
 
         if statement_type == "income" and valid_revenue > 0:
-            assert (
-                valid_revenue / total_statements >= 0.70
-            ), f"Only {valid_revenue}/{total_statements} income statements have valid revenue"
+            assert valid_revenue / total_statements >= 0.70, (
+                f"Only {valid_revenue}/{total_statements} income statements have "
+                "valid revenue"
+            )
 
         if statement_type == "balance_sheet" and valid_assets > 0:
-            assert (
-                valid_assets / total_statements >= 0.70
-            ), f"Only {valid_assets}/{total_statements} balance sheets have valid assets"
+            assert valid_assets / total_statements >= 0.70, (
+                f"Only {valid_assets}/{total_statements} balance sheets have "
+                "valid assets"
+            )
 
 
 def validate_bulk_ratings_data(data: List[FMPBulkRating]) -> None:
@@ -857,3 +865,280 @@ class TestBulkErrorHandling:
         validate_model_list(statements, FMPIncomeStatement)
         # Should return empty list for invalid year
         assert len(statements) == 0
+
+
+EOD_MODEL = RootModel[List[FMPBulkEOD]]
+
+ETF_HOLDER_HEADER = (
+    "symbol,sharesNumber,asset,weightPercentage,cusip,isin,name,marketValue,updatedAt"
+)
+
+
+def etf_holder_part(part, rows=3):
+    lines = [ETF_HOLDER_HEADER] + [
+        f"ETF{part},{i},A{i},1.5,C{i},I{i},Name {i},{i * 10},2024-01-02"
+        for i in range(rows)
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def part_response(body, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.iter_content.side_effect = lambda n: iter([body])
+    response.content = body
+    response.text = body.decode()
+    response.__enter__.return_value = response
+    return response
+
+
+class TestDownloadParts:
+    """Test the concurrent multi-part bulk downloader."""
+
+    def fake_get(self, parts, fail_once=(), calls=None):
+        failed = set()
+        lock = threading.Lock()
+
+        def get(url, params, **kwargs):
+            part = int(params["part"])
+            with lock:
+                if calls is not None:
+                    calls.append(part)
+                if part in fail_once and part not in failed:
+                    failed.add(part)
+                    raise requests.ConnectionError("reset")
+            return part_response(etf_holder_part(part) if part < parts else b"")
+
+        return get
+
+    def test_writes_parts_until_empty(self, tmp_path):
+        """Test parts are written to files and requests stop after the end."""
+        calls = []
+        with patch("fmpsdk.transport.get", side_effect=self.fake_get(5, calls=calls)):
+            results = bulk.download_parts(
+                bulk.etf_holder_bulk, "k", directory=str(tmp_path), max_workers=2
+            )
+
+        assert [r.part for r in results] == [0, 1, 2, 3, 4]
+        assert all(r.ok and r.rows == 3 for r in results)
+        assert max(calls) <= 5 + 2 * 2
+        frame = pd.read_csv(results[4].path)
+        assert frame["symbol"].tolist() == ["ETF4"] * 3
+        assert sorted(os.listdir(tmp_path)) == [
+            f"etf_holder_bulk_part{i}.csv" for i in range(5)
+        ]
+
+    def test_sink_receives_each_part_once(self):
+        """Test the sink gets one typed DataFrame per part, even after retries."""
+        received = {}
+
+        def sink(part, frame):
+            received.setdefault(part, []).append(frame)
+
+        with patch(
+            "fmpsdk.transport.get", side_effect=self.fake_get(3, fail_once={1})
+        ), patch("fmpsdk.bulk.time.sleep"):
+            results = bulk.download_parts(bulk.etf_holder_bulk, "k", sink=sink)
+
+        assert sorted(received) == [0, 1, 2]
+        assert all(len(frames) == 1 for frames in received.values())
+        assert list(received[1][0].columns)[:2] == ["symbol", "sharesNumber"]
+        assert [r.attempts for r in results] == [1, 2, 1]
+
+    def test_failing_part_reported(self):
+        """Test a part that keeps failing is reported and ends the download."""
+
+        def get(url, params, **kwargs):
+            if params["part"] == "1":
+                raise requests.ConnectionError("reset")
+            return part_response(etf_holder_part(int(params["part"])))
+
+        with patch("fmpsdk.transport.get", side_effect=get), patch(
+            "fmpsdk.bulk.time.sleep"
+        ):
+            results = bulk.download_parts(
+                bulk.etf_holder_bulk, "k", sink=lambda *a: None, max_workers=1
+            )
+
+        # Part 2 was already queued when part 1 gave up; nothing later is
+        assert [(r.part, r.ok) for r in results] == [(0, True), (1, False), (2, True)]
+        assert results[1].attempts == 4
+        assert isinstance(results[1].error, requests.ConnectionError)
+
+    def test_fatal_errors_raise(self):
+        """Test errors that retries cannot fix abort the download."""
+        premium = part_response(b"Premium Endpoint", status_code=402)
+        with patch("fmpsdk.transport.get", return_value=premium):
+            with pytest.raises(PremiumEndpointException):
+                bulk.download_parts(bulk.bulk_profiles, "k", sink=lambda *a: None)
+
+    def test_requires_destination(self):
+        """Test a directory or sink is required."""
+        with pytest.raises(ValueError):
+            bulk.download_parts(bulk.bulk_profiles, "k")
+
+
+EOD_HEADER = "symbol,date,open,low,high,close,adjClose,volume"
+
+
+def eod_csv(days=("2024-01-02", "2024-01-03"), symbols=("AAPL", "MSFT")):
+    lines = [EOD_HEADER] + [
+        f"{symbol},{day},1.5,1.0,2.0,1.75,1.75,100"
+        for day in days
+        for symbol in symbols
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+class TestDatasetSinkArguments:
+    """Test DatasetSink argument checks, which need no pyarrow."""
+
+    def test_invalid_arguments(self, tmp_path):
+        """Test unknown formats, partition columns and endpoints."""
+        with pytest.raises(ValueError):
+            bulk.DatasetSink(str(tmp_path), "eod_bulk", format="csv")
+        with pytest.raises(ValueError):
+            bulk.DatasetSink(str(tmp_path), "eod_bulk", partition_by="period")
+        with pytest.raises(ValueError):
+            bulk.DatasetSink(str(tmp_path), "no_such_endpoint")
+
+    def test_missing_pyarrow(self, tmp_path):
+        """Test a helpful ImportError without pyarrow."""
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ImportError, match="pip install pyarrow"):
+                bulk.DatasetSink(str(tmp_path), "eod_bulk")
+
+
+class TestDatasetSink:
+    """Test writing partitioned Parquet/Arrow datasets."""
+
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        """Skip when pyarrow is not installed."""
+        return pytest.importorskip("pyarrow")
+
+    def test_schema_from_model(self, pyarrow):
+        """Test Arrow types follow the model fields."""
+        schema = bulk.arrow_schema(FMPBulkEOD)
+        assert schema.field("close").type == pyarrow.float64()
+        assert schema.field("volume").type == pyarrow.int64()
+        assert schema.field("symbol").type == pyarrow.string()
+
+    @patch("fmpsdk.transport.get")
+    def test_write_dataset_partitioned_by_date(self, mock_get, tmp_path, pyarrow):
+        """Test rows are streamed into one file per date partition."""
+        import pyarrow.dataset
+
+        mock_get.return_value = part_response(eod_csv())
+        paths = bulk.write_dataset(
+            bulk.eod_bulk,
+            str(tmp_path),
+            apikey="k",
+            date="2024-01-02",
+            partition_by="date",
+            chunk_size=3,
+        )
+
+        assert [os.path.dirname(os.path.relpath(p, tmp_path)) for p in paths] == [
+            "date=2024-01-02",
+            "date=2024-01-03",
+        ]
+        assert len({os.path.basename(p) for p in paths}) == 1
+        assert os.path.basename(paths[0]).startswith("part-")
+        assert paths[0].endswith(".parquet")
+        table = pyarrow.parquet.read_table(paths[0])
+        assert "date" not in table.column_names
+        assert table.schema.field("volume").type == pyarrow.int64()
+        assert table.column("symbol").to_pylist() == ["AAPL", "MSFT"]
+
+        dataset = pyarrow.dataset.dataset(
+            str(tmp_path), format="parquet", partitioning="hive"
+        )
+        assert dataset.to_table().num_rows == 4
+
+    def test_arrow_year_and_fixed_partitions(self, tmp_path, pyarrow):
+        """Test derived year partitions, fixed partitions and Arrow IPC files."""
+        import pyarrow.ipc
+
+        frame = pd.DataFrame(
+            {
+                "symbol": ["A", "B"],
+                "date": ["2023-12-29", "2024-01-02"],
+                "open": [1.0, 2.0],
+                "low": [1.0, 2.0],
+                "high": [1.0, 2.0],
+                "close": [1.0, 2.0],
+                "adjClose": [1.0, 2.0],
+                "volume": pd.array([1, None], dtype="Int64"),
+            }
+        )
+        with bulk.DatasetSink(
+            str(tmp_path),
+            bulk.eod_bulk,
+            partition_by="year",
+            partition_values={"snapshot": "2024-01-03"},
+            format="arrow",
+            basename="part",
+        ) as sink:
+            sink(0, frame)
+
+        assert [os.path.relpath(p, tmp_path) for p in sink.paths] == [
+            os.path.join("snapshot=2024-01-03", "year=2023", "part.arrow"),
+            os.path.join("snapshot=2024-01-03", "year=2024", "part.arrow"),
+        ]
+        table = pyarrow.ipc.open_file(sink.paths[1]).read_all()
+        assert table.column("date").to_pylist() == ["2024-01-02"]
+        assert table.column("volume").to_pylist() == [None]
+
+    @patch("fmpsdk.transport.get")
+    def test_runs_into_same_partition_keep_data(self, mock_get, tmp_path, pyarrow):
+        """Test a second run into an existing partition adds a file."""
+        import pyarrow.dataset
+
+        for day in ("2024-01-02", "2024-01-03"):
+            mock_get.return_value = part_response(eod_csv(days=(day,)))
+            bulk.write_dataset(
+                bulk.eod_bulk, str(tmp_path), apikey="k", date=day, partition_by="year"
+            )
+
+        assert len(os.listdir(tmp_path / "year=2024")) == 2
+        dataset = pyarrow.dataset.dataset(
+            str(tmp_path), format="parquet", partitioning="hive"
+        )
+        assert sorted(set(dataset.to_table().column("date").to_pylist())) == [
+            "2024-01-02",
+            "2024-01-03",
+        ]
+
+    @patch("fmpsdk.transport.get")
+    def test_fixed_basename_not_overwritten(self, mock_get, tmp_path, pyarrow):
+        """Test a fixed basename refuses to replace a file unless asked to."""
+        mock_get.return_value = part_response(eod_csv(days=("2024-01-02",)))
+        args = (bulk.eod_bulk, str(tmp_path))
+        options = {
+            "apikey": "k",
+            "date": "2024-01-02",
+            "partition_by": "date",
+            "basename": "snap",
+        }
+        (path,) = bulk.write_dataset(*args, **options)
+
+        mock_get.return_value = part_response(
+            eod_csv(days=("2024-01-02",), symbols=("AAPL",))
+        )
+        with pytest.raises(FileExistsError):
+            bulk.write_dataset(*args, **options)
+        assert pyarrow.parquet.read_table(path).num_rows == 2
+
+        bulk.write_dataset(*args, overwrite=True, **options)
+        assert pyarrow.parquet.read_table(path).num_rows == 1
+        assert os.listdir(tmp_path / "date=2024-01-02") == ["snap.parquet"]
+
+    def test_failed_snapshot_discarded(self, tmp_path):
+        """Test nothing is left behind when writing fails."""
+        frame = pd.DataFrame({"symbol": ["A"], "date": ["2024-01-02"]})
+        with pytest.raises(RuntimeError):
+            with bulk.DatasetSink(str(tmp_path), "eod_bulk", "date") as sink:
+                sink.write(bulk.columnar.convert_frame(frame, EOD_MODEL))
+                raise RuntimeError("interrupted")
+        assert os.listdir(tmp_path / "date=2024-01-02") == []
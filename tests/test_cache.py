@@ -0,0 +1,224 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import fmpsdk
+from fmpsdk import cache
+from fmpsdk.cache import DiskCache, make_key
+from fmpsdk.model_registry import ENDPOINT_CACHE_TTL, ENDPOINT_MODEL_MAP
+from tests.conftest import make_response
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Enable the global cache in a temporary directory."""
+    installed = cache.configure_cache(path=str(tmp_path / "cache.sqlite3"))
+    yield installed
+    cache.disable_cache()
+
+
+class TestMakeKey:
+    """Test cache key construction."""
+
+    def test_apikey_excluded(self):
+        """Test requests differing only by API key share a key."""
+        assert make_key("stable", "profile", {"apikey": "a", "symbol": "X"}) == (
+            make_key("stable", "profile", {"apikey": "b", "symbol": "X"})
+        )
+        assert "apikey" not in make_key("stable", "profile", {"apikey": "secret"})
+
+    def test_query_order_and_none_ignored(self):
+        """Test query order and None values do not change the key."""
+        assert make_key("stable", "p", {"a": 1, "b": 2, "c": None}) == make_key(
+            "stable", "p", {"b": 2, "a": 1}
+        )
+
+    def test_version_and_path_distinguish(self):
+        """Test different versions or paths produce different keys."""
+        assert make_key("v3", "p", {}) != make_key("stable", "p", {})
+        assert make_key("stable", "p", {}) != make_key("stable", "q", {})
+
+
+class TestDiskCache:
+    """Test the SQLite-backed store."""
+
+    def test_round_trip(self, tmp_path):
+        """Test stored values are returned until they expire."""
+        store = DiskCache(str(tmp_path / "c.sqlite3"))
+        store.set("k", [{"a": 1}], ttl=60, endpoint="e")
+        assert store.get("k") == [{"a": 1}]
+        assert store.get("missing") is None
+
+    def test_expired_entries_removed(self, tmp_path):
+        """Test expired entries are not served."""
+        store = DiskCache(str(tmp_path / "c.sqlite3"))
+        with patch("fmpsdk.cache.time.time", return_value=1000.0):
+            store.set("k", [1], ttl=10)
+        with patch("fmpsdk.cache.time.time", return_value=1011.0):
+            assert store.get("k") is None
+        assert len(store) == 0
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        """Test least recently used entries are evicted beyond max_bytes."""
+        store = DiskCache(str(tmp_path / "c.sqlite3"), max_bytes=100)
+        clock = iter(range(1000, 2000))
+        with patch("fmpsdk.cache.time.time", side_effect=lambda: float(next(clock))):
+            store.set("a", "x" * 40, ttl=3600)
+            store.set("b", "x" * 40, ttl=3600)
+            store.get("a")
+            store.set("c", "x" * 40, ttl=3600)
+
+            assert store.get("b") is None
+            assert store.get("a") is not None
+            assert store.get("c") is not None
+        assert store.size() <= 100
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the database."""
+        path = str(tmp_path / "c.sqlite3")
+        DiskCache(path).set("k", {"v": 1}, ttl=60)
+        assert DiskCache(path).get("k") == {"v": 1}
+
+    def test_clear_by_endpoint(self, tmp_path):
+        """Test entries can be cleared per endpoint."""
+        store = DiskCache(str(tmp_path / "c.sqlite3"))
+        store.set("a", [1], ttl=60, endpoint="stock_list")
+        store.set("b", [2], ttl=60, endpoint="company_profile")
+        store.clear("stock_list")
+        assert store.get("a") is None
+        assert store.get("b") == [2]
+
+    def test_thread_safe(self, tmp_path):
+        """Test concurrent writers and readers do not fail."""
+        store = DiskCache(str(tmp_path / "c.sqlite3"))
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    store.set(f"{n}-{i}", [i], ttl=60)
+                    assert store.get(f"{n}-{i}") == [i]
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(store) == 160
+
+
+class TestEndpointCaching:
+    """Test the cache is applied to registered endpoints."""
+
+    def test_ttl_endpoints_are_registered(self):
+        """Test every cached endpoint exists in ENDPOINT_MODEL_MAP."""
+        assert set(ENDPOINT_CACHE_TTL) <= set(ENDPOINT_MODEL_MAP)
+
+    @patch("fmpsdk.transport.get")
+    def test_cached_endpoint_served_from_disk(self, mock_get, disk_cache):
+        """Test a second call with another API key does not hit the network."""
+        mock_get.return_value = make_response([{"sector": "Technology"}])
+
+        first = fmpsdk.available_sectors(apikey="one")
+        second = fmpsdk.available_sectors(apikey="two")
+
+        assert mock_get.call_count == 1
+        assert second.root[0].sector == first.root[0].sector == "Technology"
+
+    @patch("fmpsdk.transport.get")
+    def test_uncached_endpoint_always_requests(self, mock_get, disk_cache):
+        """Test endpoints without a TTL bypass the cache."""
+        mock_get.return_value = make_response([])
+
+        fmpsdk.quote(apikey="k", symbol="AAPL")
+        fmpsdk.quote(apikey="k", symbol="AAPL")
+
+        assert mock_get.call_count == 2
+        assert len(disk_cache) == 0
+
+    @patch("fmpsdk.transport.get")
+    def test_bypass_cache(self, mock_get, disk_cache):
+        """Test bypass_cache neither reads nor writes the cache."""
+        mock_get.return_value = make_response([{"sector": "Energy"}])
+
+        with cache.bypass_cache():
+            fmpsdk.available_sectors(apikey="k")
+        assert len(disk_cache) == 0
+
+        fmpsdk.available_sectors(apikey="k")
+        with cache.bypass_cache():
+            fmpsdk.available_sectors(apikey="k")
+        assert mock_get.call_count == 3
+
+    @patch("fmpsdk.transport.get")
+    def test_ttl_override_disables_endpoint(self, mock_get, tmp_path):
+        """Test a zero TTL override turns caching off for an endpoint."""
+        mock_get.return_value = make_response([{"sector": "Energy"}])
+        cache.configure_cache(
+            path=str(tmp_path / "c.sqlite3"), ttl_overrides={"available_sectors": 0}
+        )
+        try:
+            fmpsdk.available_sectors(apikey="k")
+            fmpsdk.available_sectors(apikey="k")
+        finally:
+            cache.disable_cache()
+
+        assert mock_get.call_count == 2
+
+    @patch("fmpsdk.transport.get")
+    def test_empty_responses_not_cached(self, mock_get, disk_cache):
+        """Test empty results are not stored."""
+        mock_get.return_value = make_response([])
+
+        fmpsdk.available_sectors(apikey="k")
+        fmpsdk.available_sectors(apikey="k")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            {"Error Message": "Limit Reach . Please upgrade your plan."},
+            {"Error": "Invalid API KEY."},
+        ],
+    )
+    @patch("fmpsdk.transport.get")
+    def test_error_replies_not_cached(self, mock_get, disk_cache, error):
+        """Test an HTTP 200 error object is neither stored nor served."""
+        data = [{"sector": "Energy"}]
+        mock_get.side_effect = [make_response(error), make_response(data)]
+
+        assert fmpsdk.available_sectors(apikey="k", output="raw") == error
+        assert len(disk_cache) == 0
+        result = fmpsdk.available_sectors(apikey="k", output="raw")
+
+        assert mock_get.call_count == 2
+        assert result == data
+
+    def test_stored_errors_never_served(self, disk_cache):
+        """Test an error object already in the cache is treated as a miss."""
+        key = make_key("stable", "available-sectors", {})
+        disk_cache.set(key, {"Error Message": "Limit Reach"}, ttl=3600)
+
+        with patch("fmpsdk.transport.get") as mock_get:
+            mock_get.return_value = make_response([{"sector": "Energy"}])
+            result = fmpsdk.available_sectors(apikey="k")
+
+        assert mock_get.call_count == 1
+        assert result.root[0].sector == "Energy"
+
+    @patch("fmpsdk.transport.get")
+    def test_disabled_by_default(self, mock_get):
+        """Test no cache is used unless configured."""
+        mock_get.return_value = make_response([{"sector": "Energy"}])
+
+        fmpsdk.available_sectors(apikey="k")
+        fmpsdk.available_sectors(apikey="k")
+
+        assert cache.get_cache() is None
+        assert mock_get.call_count == 2
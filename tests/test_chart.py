@@ -1,9 +1,13 @@
+import json
+import threading
 from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
 
 import pytest
 
 from fmpsdk.chart import (
     historical_chart,
+    historical_chart_range,
     historical_price_eod,
     historical_price_eod_dividend_adjusted,
     historical_price_eod_light,
@@ -780,3 +784,146 @@ class TestChartParameterCoverage:
         except Exception:
             # Premium endpoint or other errors are expected
             pass
+
+
+class TestHistoricalChartRange:
+    """Test fetching long intraday ranges in concurrent windows."""
+
+    def fake_get(self, calls, fail=None, limit=None):
+        lock = threading.Lock()
+
+        def get(url, params, **kwargs):
+            with lock:
+                calls.append((params["from"], params["to"]))
+            if params["from"] == fail:
+                return Mock(status_code=200, content=b'{"Error Message": "Limit"}')
+            day = datetime.fromisoformat(params["from"])
+            end = datetime.fromisoformat(params["to"]) + timedelta(days=1)
+            bars = []
+            # The API also returns the first bar after the window
+            while day <= end:
+                if day.weekday() < 5:
+                    for clock in ("09:30", "12:00", "15:59"):
+                        bars.append(
+                            {
+                                "date": f"{day:%Y-%m-%d} {clock}:00",
+                                "open": 1.0,
+                                "low": 1.0,
+                                "high": 1.0,
+                                "close": day.day + 0.5,
+                                "volume": 10,
+                            }
+                        )
+                day += timedelta(days=1)
+            if limit is not None:
+                # Like the API, keep the newest bars of a full window
+                bars = bars[-limit:]
+            return Mock(status_code=200, content=json.dumps(bars[::-1]).encode())
+
+        return get
+
+    def test_chunks_deduplicates_and_sorts(self):
+        """Test windows cover the range once and bars come back newest first."""
+        calls = []
+        with patch("fmpsdk.transport.get", side_effect=self.fake_get(calls)):
+            result = historical_chart_range(
+                "AAPL", "1min", "k", "2024-01-01", "2024-01-10", max_workers=3
+            )
+
+        assert sorted(calls) == [
+            ("2024-01-01", "2024-01-03"),
+            ("2024-01-04", "2024-01-06"),
+            ("2024-01-07", "2024-01-09"),
+            ("2024-01-10", "2024-01-10"),
+        ]
+        dates = [bar.date for bar in result.root]
+        assert all(isinstance(bar, FMPIntradayDataPoint) for bar in result.root)
+        assert dates == sorted(set(dates), reverse=True)
+        assert len(dates) == 3 * 9  # 8 weekdays in range plus the extra bar day
+        assert dates[-1] == "2024-01-01 09:30:00"
+
+    def test_output_and_chunk_days(self):
+        """Test custom window sizes and output modes."""
+        calls = []
+        with patch("fmpsdk.transport.get", side_effect=self.fake_get(calls)):
+            frame = historical_chart_range(
+                "AAPL",
+                "1hour",
+                "k",
+                "2024-01-01",
+                "2024-01-05",
+                chunk_days=2,
+                output="pandas",
+            )
+
+        assert len(calls) == 3
+        assert frame["date"].is_monotonic_decreasing
+        assert frame["date"].is_unique
+
+    def test_truncated_windows_refetched_in_halves(self):
+        """Test a window at the row cap is split until no bar is missing."""
+        calls = []
+        get = self.fake_get(calls, limit=10)
+        with patch("fmpsdk.chart.CHART_ROW_LIMIT", 10):
+            with patch("fmpsdk.transport.get", side_effect=get):
+                result = historical_chart_range(
+                    "AAPL", "1min", "k", "2024-01-01", "2024-01-06", output="raw"
+                )
+
+        assert sorted(calls) == [
+            ("2024-01-01", "2024-01-02"),
+            ("2024-01-01", "2024-01-03"),
+            ("2024-01-03", "2024-01-03"),
+            ("2024-01-04", "2024-01-06"),
+        ]
+        dates = [bar["date"] for bar in result]
+        assert len(dates) == 3 * 5  # every weekday in the range
+        assert dates[-1] == "2024-01-01 09:30:00"
+
+    @pytest.mark.parametrize("scope", ["context", "keyword"])
+    def test_retry_policy_reaches_every_window(self, scope):
+        """Test a retry policy override governs the call for every window."""
+        from fmpsdk import retry
+
+        policy = retry.RetryPolicy(max_retries=0)
+        seen = []
+        get = self.fake_get([])
+
+        def record_policy(*args, **kwargs):
+            seen.append(retry.get_retry_policy())
+            return get(*args, **kwargs)
+
+        with patch("fmpsdk.transport.get", side_effect=record_policy):
+            if scope == "context":
+                with retry.use_retry_policy(policy):
+                    historical_chart_range(
+                        "AAPL", "1min", "k", "2024-01-01", "2024-01-10"
+                    )
+            else:
+                historical_chart_range(
+                    "AAPL", "1min", "k", "2024-01-01", "2024-01-10", retry_policy=policy
+                )
+
+        assert len(seen) == 4
+        assert all(p is policy for p in seen)
+
+    def test_window_error_raises(self):
+        """Test a failing window raises instead of returning a gap."""
+        calls = []
+        get = self.fake_get(calls, fail="2024-01-04")
+        with patch("fmpsdk.transport.get", side_effect=get):
+            with pytest.raises(Exception, match="Limit"):
+                historical_chart_range("AAPL", "1min", "k", "2024-01-01", "2024-01-09")
+
+    def test_invalid_arguments(self):
+        """Test bad arguments fail before any request is sent."""
+        with patch("fmpsdk.transport.get") as mock_get:
+            with pytest.raises(ValueError):
+                historical_chart_range("AAPL", "2min", "k", "2024-01-01")
+            with pytest.raises(ValueError):
+                historical_chart_range("AAPL", "1min", "k", "2024-02-01", "2024-01-01")
+            with pytest.raises(ValueError):
+                historical_chart_range("AAPL", "1min", "k", "2024-01-01", output="x")
+            with pytest.raises(TypeError):
+                historical_chart_range("AAPL", "1min", "k", "2024-01-01", page=1)
+        mock_get.assert_not_called()
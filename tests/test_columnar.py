@@ -0,0 +1,178 @@
+import json
+from typing import List
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import RootModel
+
+import fmpsdk
+from fmpsdk import columnar, memo
+from fmpsdk.models import FMPBulkEOD, FMPDcfValuation, FMPStockScreenerResult
+from fmpsdk.utils import to_dataframe, validate_response
+
+EOD = RootModel[List[FMPBulkEOD]]
+
+
+def eod_records():
+    return [
+        {
+            "symbol": "AAPL",
+            "date": "2024-01-02",
+            "open": 185.1,
+            "low": 183.4,
+            "high": 188.4,
+            "close": 185.6,
+            "adjClose": 185.6,
+            "volume": 82488700,
+        },
+        {
+            "symbol": "MSFT",
+            "date": "2024-01-02",
+            "open": "373.9",
+            "low": "None",
+            "high": 375.9,
+            "close": 370.9,
+            "adjClose": 370.9,
+            "volume": "25258600",
+        },
+    ]
+
+
+class TestFieldDtypes:
+    """Test dtype derivation from model fields."""
+
+    def test_dtypes(self):
+        """Test floats, nullable ints/bools and objects."""
+        assert columnar.field_dtypes(FMPBulkEOD) == {
+            "symbol": "object",
+            "date": "object",
+            "open": "float64",
+            "low": "float64",
+            "high": "float64",
+            "close": "float64",
+            "adjClose": "float64",
+            "volume": "Int64",
+        }
+        assert columnar.field_dtypes(FMPStockScreenerResult)["isEtf"] == "boolean"
+
+
+class TestToPandas:
+    """Test DataFrame construction without model objects."""
+
+    def test_matches_model_dataframe(self):
+        """Test values match the validated-model DataFrame."""
+        raw = eod_records()
+        raw[1]["low"] = "368.1"
+        frame = columnar.to_pandas(raw, EOD)
+        expected = to_dataframe(EOD.model_validate(raw))
+
+        assert list(frame.columns) == list(expected.columns)
+        assert frame["symbol"].tolist() == expected["symbol"].tolist()
+        np.testing.assert_array_equal(frame["open"], expected["open"])
+        np.testing.assert_array_equal(frame["low"], expected["low"])
+        assert frame["volume"].tolist() == expected["volume"].tolist()
+
+    def test_dtypes_applied(self):
+        """Test column dtypes come from the model, with "None" as missing."""
+        frame = columnar.to_pandas(eod_records(), EOD)
+        assert frame["open"].dtype == "float64"
+        assert frame["volume"].dtype == "Int64"
+        assert np.isnan(frame["low"][1])
+
+    def test_aliases_use_field_names(self):
+        """Test aliased keys produce columns named after the field."""
+        frame = columnar.to_pandas(
+            [{"symbol": "A", "date": "d", "Stock Price": "2.5"}],
+            RootModel[List[FMPDcfValuation]],
+        )
+        assert frame["Stock_Price"].tolist() == [2.5]
+
+    def test_missing_columns_and_empty(self):
+        """Test absent keys give empty columns and empty responses no rows."""
+        frame = columnar.to_pandas([{"symbol": "A"}], EOD)
+        assert frame["volume"].isna().all()
+        assert len(columnar.to_pandas([], EOD)) == 0
+        assert list(columnar.to_pandas(None, EOD).columns) == list(
+            FMPBulkEOD.model_fields
+        )
+
+    def test_booleans_from_csv(self):
+        """Test "true"/"false" strings become booleans."""
+        frame = columnar.to_pandas(
+            [{"isEtf": "true"}, {"isEtf": "false"}, {"isEtf": None}],
+            RootModel[List[FMPStockScreenerResult]],
+        )
+        assert frame["isEtf"].tolist()[:2] == [True, False]
+        assert frame["isEtf"].isna().tolist()[2]
+
+    def test_models_without_records(self):
+        """Test endpoints without a record model fall back to DataFrame(raw)."""
+        frame = columnar.to_pandas([{"a": 1}], RootModel[List[dict]])
+        assert frame.to_dict("records") == [{"a": 1}]
+
+
+class TestToColumns:
+    """Test NumPy column output."""
+
+    def test_column_arrays(self):
+        """Test numeric columns are typed NumPy arrays."""
+        columns = columnar.to_columns(eod_records(), EOD)
+        assert columns["close"].dtype == np.float64
+        assert columns["volume"].dtype == np.int64
+        assert columns["symbol"].tolist() == ["AAPL", "MSFT"]
+
+    def test_missing_ints_become_float(self):
+        """Test integer columns with gaps use NaN."""
+        raw = eod_records()
+        raw[1]["volume"] = None
+        columns = columnar.to_columns(raw, EOD)
+        assert columns["volume"].dtype == np.float64
+        assert np.isnan(columns["volume"][1])
+
+
+class TestOutputOption:
+    """Test the output= option on endpoints."""
+
+    @patch("fmpsdk.transport.get")
+    def test_endpoint_output_modes(self, mock_get):
+        """Test raw, columns and pandas modes skip model construction."""
+        response = Mock(status_code=200, content=json.dumps(eod_records()).encode())
+        mock_get.return_value = response
+
+        with patch.object(EOD, "model_validate") as validate:
+            raw = fmpsdk.eod_bulk(apikey="k", date="2024-01-02", output="raw")
+            frame = fmpsdk.eod_bulk(apikey="k", date="2024-01-02", output="pandas")
+            columns = fmpsdk.eod_bulk(apikey="k", date="2024-01-02", output="columns")
+            validate.assert_not_called()
+
+        assert raw == eod_records()
+        assert isinstance(frame, pd.DataFrame) and len(frame) == 2
+        assert columns["close"].tolist() == [185.6, 370.9]
+        assert "output" not in mock_get.call_args.kwargs["params"]
+
+    def test_invalid_output(self):
+        """Test unknown output modes raise ValueError."""
+        with pytest.raises(ValueError):
+            validate_response("eod_bulk", [], output="arrow")
+
+    def test_errors_returned_unchanged(self):
+        """Test API error dictionaries bypass conversion."""
+        error = {"Error Message": "Invalid API KEY."}
+        assert validate_response("eod_bulk", error, output="pandas") is error
+
+    @patch("fmpsdk.transport.get")
+    def test_non_model_output_not_memoized(self, mock_get):
+        """Test DataFrames are not shared through the memo cache."""
+        response = Mock(status_code=200, content=json.dumps(eod_records()).encode())
+        mock_get.return_value = response
+        memo.enable_memo(["eod_bulk"])
+        try:
+            first = fmpsdk.eod_bulk(apikey="k", date="d", output="pandas")
+            second = fmpsdk.eod_bulk(apikey="k", date="d", output="pandas")
+        finally:
+            memo.disable_memo()
+
+        assert first is not second
+        assert mock_get.call_count == 2
@@ -0,0 +1,84 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from fmpsdk import decoding, url_methods
+from fmpsdk.utils import JSONBody
+
+return_json_func = url_methods.__return_json
+
+
+@pytest.fixture(autouse=True)
+def reset_decoder():
+    """Restore automatic decoder selection around every test."""
+    decoding.set_json_decoder()
+    yield
+    decoding.set_json_decoder()
+
+
+class TestDecoderSelection:
+    """Test choosing the JSON decoder."""
+
+    def test_auto_prefers_installed_library(self):
+        """Test the first importable decoder is selected."""
+        available = []
+        for name in decoding.DECODERS:
+            try:
+                decoding._FACTORIES[name]()
+            except ImportError:
+                continue
+            available.append(name)
+        assert decoding.get_json_decoder() == available[0]
+
+    def test_stdlib_fallback(self):
+        """Test the stdlib decoder is used when no library is installed."""
+        with patch.dict(
+            decoding._FACTORIES,
+            {name: Mock(side_effect=ImportError) for name in decoding.DECODERS[:-1]},
+        ):
+            decoding.set_json_decoder()
+        assert decoding.get_json_decoder() == "json"
+        assert decoding.loads(b'[{"a": 1.5}]') == [{"a": 1.5}]
+
+    def test_named_and_custom_decoders(self):
+        """Test decoders can be chosen by name or given as a callable."""
+        decoding.set_json_decoder("json")
+        assert decoding.get_json_decoder() == "json"
+
+        custom = Mock(return_value=["decoded"])
+        decoding.set_json_decoder(custom)
+        assert decoding.loads(b"[]") == ["decoded"]
+        custom.assert_called_once_with(b"[]")
+
+    def test_unknown_decoder(self):
+        """Test unknown names raise ValueError."""
+        with pytest.raises(ValueError):
+            decoding.set_json_decoder("simplejson")
+
+
+class TestLoads:
+    """Test decoding with every installed decoder."""
+
+    @pytest.mark.parametrize("name", decoding.DECODERS)
+    def test_decoders_agree(self, name):
+        """Test each decoder returns what the stdlib does."""
+        try:
+            decoding.set_json_decoder(name)
+        except ImportError:
+            pytest.skip(f"{name} is not installed")
+        body = b'[{"symbol": "AAPL", "price": 1.5, "volume": 10, "isEtf": false}]'
+        assert decoding.loads(body) == json.loads(body)
+        assert decoding.loads(JSONBody(body)) == json.loads(body)
+        with pytest.raises(json.JSONDecodeError):
+            decoding.loads(b"not json")
+
+    @patch("fmpsdk.transport.get")
+    def test_return_json_uses_decoder(self, mock_get):
+        """Test __return_json decodes bodies with the configured decoder."""
+        mock_get.return_value = Mock(status_code=200, content=b'{"a": 1}')
+        custom = Mock(return_value={"a": 2})
+        decoding.set_json_decoder(custom)
+
+        assert return_json_func("quote", {"apikey": "k"}) == {"a": 2}
+        custom.assert_called_once_with(b'{"a": 1}')
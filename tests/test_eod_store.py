@@ -0,0 +1,227 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmpsdk import eod_store
+from fmpsdk.eod_store import EODStore
+from fmpsdk.models import FMPHistoricalDataPointFull
+
+
+def day(symbols, close):
+    return pd.DataFrame(
+        {
+            "symbol": symbols,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "adjClose": close,
+            "volume": [100] * len(symbols),
+        }
+    )
+
+
+def csv_response(date):
+    body = "symbol,date,open,low,high,close,adjClose,volume\n"
+    if date != "2024-01-01":
+        close = int(date[-2:])
+        body += f"AAPL,{date},{close},{close},{close},{close},{close},10\n"
+        body += f"MSFT,{date},{close * 2},{close},{close},{close * 2},{close},20\n"
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"Content-Type": "text/csv"}
+    response.iter_content.side_effect = lambda n: iter([body.encode()])
+    response.__enter__.return_value = response
+    return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EODStore(str(tmp_path))
+
+
+class TestEODStore:
+    """Test storing and querying end-of-day prices."""
+
+    def test_history(self, store):
+        """Test days added in any order are returned sorted and filtered."""
+        store.add_day("2024-01-03", day(["MSFT", "AAPL"], [2.0, 1.5]))
+        store.add_day("2024-01-02", day(["AAPL", "NVDA"], [1.0, 3.0]))
+
+        prices = store.history("AAPL")
+        assert prices["date"].astype(str).tolist() == ["2024-01-02", "2024-01-03"]
+        assert prices["close"].tolist() == [1.0, 1.5]
+        assert store.history("AAPL", from_date="2024-01-03")["close"].tolist() == [1.5]
+        assert store.history("AAPL", to_date="2024-01-02")["close"].tolist() == [1.0]
+        assert len(store.history("TSLA")) == 0
+
+    def test_compact_and_reopen(self, store, tmp_path):
+        """Test compaction and reopening keep results, later days winning."""
+        store.add_day("2024-01-02", day(["AAPL", "MSFT"], [1.0, 2.0]))
+        store.compact()
+        store.add_day("2024-01-03", day(["AAPL", "NVDA"], [1.5, 3.0]))
+        store.add_day("2024-01-02", day(["AAPL"], [1.25]))
+        expected = store.history("AAPL")
+        assert expected["close"].tolist() == [1.25, 1.5]
+
+        store.compact()
+        assert not list((tmp_path / "pending").iterdir())
+        reopened = EODStore(str(tmp_path))
+        for current in (store, reopened):
+            np.testing.assert_array_equal(current.history("AAPL"), expected)
+            assert current.history("NVDA")["close"].tolist() == [3.0]
+            assert current.history("MSFT")["close"].tolist() == [2.0]
+        assert reopened.days == ["2024-01-02", "2024-01-03"]
+        assert isinstance(reopened.history("AAPL").base, np.memmap)
+
+    @pytest.mark.parametrize("block_rows", [1, 7, 10_000])
+    def test_compact_in_blocks(self, store, tmp_path, block_rows):
+        """Test merging a few symbols at a time gives the same histories."""
+        rng = np.random.default_rng(3)
+        symbols = [f"S{i}" for i in range(30)]
+        dates = pd.bdate_range("2024-01-01", periods=12).strftime("%Y-%m-%d")
+        for i, date in enumerate(dates):
+            if i == 6:
+                store.compact()
+            chosen = list(rng.choice(symbols, size=20, replace=False))
+            store.add_day(date, day(chosen, rng.random(20).tolist()))
+        store.add_day(dates[2], day(symbols[:5], [9.0] * 5))
+        expected = {s: store.history(s) for s in symbols}
+
+        with patch.object(eod_store, "COMPACT_BLOCK_ROWS", block_rows):
+            store.compact()
+
+        reopened = EODStore(str(tmp_path))
+        for symbol in symbols:
+            np.testing.assert_array_equal(reopened.history(symbol), expected[symbol])
+        replaced = reopened.history("S0", from_date=dates[2], to_date=dates[2])
+        assert replaced["close"].tolist() == [9.0]
+
+    def test_duplicates_and_missing_values(self, store):
+        """Test the last row of a repeated symbol is kept and gaps are NaN."""
+        prices = day(["AAPL", "AAPL"], [1.0, 2.0])
+        prices.loc[1, "volume"] = None
+        assert store.add_day("2024-01-02", prices.drop(columns="adjClose")) == 1
+
+        row = store.history("AAPL")[0]
+        assert row["close"] == 2.0
+        assert np.isnan(row["volume"]) and np.isnan(row["adjClose"])
+
+    def test_historical_price_eod(self, store):
+        """Test queries return the endpoint's model, newest first."""
+        store.add_day("2024-01-02", day(["AAPL"], [1.0]))
+        store.add_day("2024-01-03", day(["AAPL"], [1.5]))
+
+        result = store.historical_price_eod("AAPL", from_date="2024-01-01")
+
+        assert all(isinstance(r, FMPHistoricalDataPointFull) for r in result.root)
+        assert [r.date for r in result.root] == ["2024-01-03", "2024-01-02"]
+        assert result.root[0].close == 1.5 and result.root[0].vwap is None
+
+
+class TestUpdate:
+    """Test filling the store from eod_bulk."""
+
+    @patch("fmpsdk.transport.get")
+    def test_backfills_missing_weekdays(self, mock_get, store):
+        """Test only missing weekdays are fetched and holidays remembered."""
+        mock_get.side_effect = lambda url, params, **kw: csv_response(params["date"])
+        store.add_day("2024-01-03", day(["AAPL"], [3.0]))
+
+        result = store.update("k", start="2023-12-30", end="2024-01-07", max_workers=3)
+
+        fetched = sorted(c.kwargs["params"]["date"] for c in mock_get.call_args_list)
+        assert fetched == ["2024-01-01", "2024-01-02", "2024-01-04", "2024-01-05"]
+        assert result.loaded == fetched and result.failed == {}
+        assert store.history("MSFT")["close"].tolist() == [4.0, 8.0, 10.0]
+        assert store.missing_days("2023-12-30", "2024-01-07") == []
+
+        mock_get.reset_mock()
+        store.update("k", start="2024-01-01", end="2024-01-05")
+        mock_get.assert_not_called()
+
+    @patch("fmpsdk.transport.get")
+    def test_failed_days(self, mock_get, store):
+        """Test failed days are reported and fetched again next time."""
+
+        def get(url, params, **kwargs):
+            if params["date"] == "2024-01-03":
+                raise ConnectionError("down")
+            return csv_response(params["date"])
+
+        mock_get.side_effect = get
+
+        result = store.update("k", start="2024-01-02", end="2024-01-04")
+
+        assert result.loaded == ["2024-01-02", "2024-01-04"]
+        assert isinstance(result.failed["2024-01-03"], ConnectionError)
+        assert store.missing_days("2024-01-02", "2024-01-04") == ["2024-01-03"]
+
+    @patch("fmpsdk.transport.get")
+    def test_unpublished_day_fetched_again(self, mock_get, store):
+        """Test an empty day from today on is not remembered as a holiday."""
+        empty = csv_response("2024-01-01")
+
+        def get(url, params, **kwargs):
+            if params["date"] == "2024-01-05":
+                return empty
+            return csv_response(params["date"])
+
+        mock_get.side_effect = get
+        with patch("fmpsdk.eod_store.datetime") as clock:
+            clock.date.today.return_value = datetime.date(2024, 1, 5)
+            result = store.update("k", start="2024-01-04")
+
+            assert result.loaded == ["2024-01-04"]
+            assert store.missing_days("2024-01-04") == ["2024-01-05"]
+            assert store.add_day("2024-01-08", day([], [])) == 0
+            assert store.days == ["2024-01-04"]
+
+            mock_get.side_effect = lambda url, params, **kw: csv_response(
+                params["date"]
+            )
+            result = store.update("k", start="2024-01-04")
+
+        assert result.loaded == ["2024-01-05"]
+        assert store.history("AAPL")["close"].tolist() == [4.0, 5.0]
+
+    @patch("fmpsdk.transport.get")
+    def test_empty_days_refetched_on_request(self, mock_get, store, tmp_path):
+        """Test an empty past day is skipped until empty days are refetched."""
+        empty = csv_response("2024-01-01")
+        mock_get.side_effect = lambda url, params, **kw: (
+            empty if params["date"] == "2024-01-03" else csv_response(params["date"])
+        )
+
+        result = store.update("k", start="2024-01-02", end="2024-01-04")
+        assert result.loaded == ["2024-01-02", "2024-01-03", "2024-01-04"]
+        assert store.empty_days == ["2024-01-03"]
+        assert store.missing_days("2024-01-02", "2024-01-04") == []
+
+        mock_get.reset_mock()
+        mock_get.side_effect = lambda url, params, **kw: csv_response(params["date"])
+        store.update("k", start="2024-01-02", end="2024-01-04")
+        mock_get.assert_not_called()
+
+        result = store.update(
+            "k", start="2024-01-02", end="2024-01-04", refetch_empty=True
+        )
+        assert result.loaded == ["2024-01-03"]
+        assert store.history("AAPL")["close"].tolist() == [2.0, 3.0, 4.0]
+        reopened = EODStore(str(tmp_path))
+        assert reopened.empty_days == []
+        assert reopened.days == ["2024-01-02", "2024-01-03", "2024-01-04"]
+
+    @patch("fmpsdk.transport.get")
+    def test_compacts_after_many_days(self, mock_get, store, tmp_path):
+        """Test update compacts once enough days are pending."""
+        mock_get.side_effect = lambda url, params, **kw: csv_response(params["date"])
+        with patch.object(eod_store, "COMPACT_AFTER", 2):
+            store.update("k", start="2024-01-02", end="2024-01-04")
+
+        assert (tmp_path / "base.npy").exists()
+        assert not list((tmp_path / "pending").iterdir())
+        assert store.history("AAPL")["close"].tolist() == [2.0, 3.0, 4.0]
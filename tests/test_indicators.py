@@ -0,0 +1,303 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmpsdk import indicators
+from fmpsdk.eod_store import EODStore
+from fmpsdk.indicators import compute, stack, technical_indicators
+from fmpsdk.models import FMPTechnicalIndicator
+
+RNG = np.random.default_rng(7)
+CLOSE = 100 + np.cumsum(RNG.normal(size=120))
+HIGH = CLOSE + RNG.uniform(0.1, 2, size=120)
+LOW = CLOSE - RNG.uniform(0.1, 2, size=120)
+
+
+def reference_ema(values, period, alpha=None):
+    alpha = alpha or 2 / (period + 1)
+    out = [math.nan] * len(values)
+    start = next(i for i, v in enumerate(values) if not math.isnan(v))
+    if start + period > len(values):
+        return out
+    out[start + period - 1] = sum(values[start : start + period]) / period
+    for i in range(start + period, len(values)):
+        out[i] = out[i - 1] + alpha * (values[i] - out[i - 1])
+    return out
+
+
+def reference(indicator, period):
+    """Straightforward loop implementations of every indicator."""
+    close, n = list(CLOSE), period
+    out = [math.nan] * len(close)
+    if indicator in ("sma", "wma", "standarddeviation", "williams"):
+        weights = range(1, n + 1) if indicator == "wma" else [1] * n
+        for i in range(n - 1, len(close)):
+            window = close[i - n + 1 : i + 1]
+            mean = sum(window) / n
+            if indicator == "sma":
+                out[i] = mean
+            elif indicator == "wma":
+                out[i] = sum(w * v for w, v in zip(weights, window)) / sum(weights)
+            elif indicator == "standarddeviation":
+                out[i] = math.sqrt(sum((v - mean) ** 2 for v in window) / n)
+            else:
+                hh, ll = max(HIGH[i - n + 1 : i + 1]), min(LOW[i - n + 1 : i + 1])
+                out[i] = -100 * (hh - close[i]) / (hh - ll)
+        return out
+    if indicator == "ema":
+        return reference_ema(close, n)
+    if indicator == "dema":
+        e1 = reference_ema(close, n)
+        e2 = reference_ema(e1, n)
+        return [2 * a - b for a, b in zip(e1, e2)]
+    if indicator == "tema":
+        e1 = reference_ema(close, n)
+        e2 = reference_ema(e1, n)
+        e3 = reference_ema(e2, n)
+        return [3 * a - 3 * b + c for a, b, c in zip(e1, e2, e3)]
+    if indicator == "rsi":
+        changes = [math.nan] + [b - a for a, b in zip(close, close[1:])]
+        gain = reference_ema([max(c, 0) if c == c else c for c in changes], n, 1 / n)
+        loss = reference_ema([max(-c, 0) if c == c else c for c in changes], n, 1 / n)
+        return [100 - 100 / (1 + g / l) if l == l else l for g, l in zip(gain, loss)]
+    # adx
+    tr, plus, minus = [math.nan], [math.nan], [math.nan]
+    for i in range(1, len(close)):
+        up, down = HIGH[i] - HIGH[i - 1], LOW[i - 1] - LOW[i]
+        tr.append(max(HIGH[i], close[i - 1]) - min(LOW[i], close[i - 1]))
+        plus.append(up if up > down and up > 0 else 0.0)
+        minus.append(down if down > up and down > 0 else 0.0)
+    atr = reference_ema(tr, n, 1 / n)
+    pdm = reference_ema(plus, n, 1 / n)
+    mdm = reference_ema(minus, n, 1 / n)
+    dx = []
+    for a, p, m in zip(atr, pdm, mdm):
+        pdi, mdi = p / a, m / a
+        dx.append(100 * abs(pdi - mdi) / (pdi + mdi) if a == a else math.nan)
+    return reference_ema(dx, n, 1 / n)
+
+
+class TestCompute:
+    """Test local indicator values."""
+
+    @pytest.mark.parametrize("indicator", indicators.INDICATORS)
+    @pytest.mark.parametrize("period", [2, 5, 14])
+    def test_matches_reference(self, indicator, period):
+        """Test every indicator matches a plain loop implementation."""
+        result = compute(indicator, CLOSE, period, high=HIGH, low=LOW)
+        # Running sums lose a few digits when a window barely moves
+        atol = 1e-10 if indicator == "standarddeviation" else 0
+        np.testing.assert_allclose(
+            result, reference(indicator, period), rtol=1e-9, atol=atol
+        )
+
+    @pytest.mark.parametrize("indicator", indicators.INDICATORS)
+    def test_many_symbols_and_periods(self, indicator):
+        """Test one 2-D call equals computing each row and period alone."""
+        close = np.vstack([CLOSE, CLOSE[::-1], CLOSE * 2])
+        close[1, :30] = np.nan  # a shorter history, padded on the left
+        high, low = close + 1, close - 1
+
+        result = compute(indicator, close, [5, 20], high=high, low=low)
+
+        assert result.shape == (2, 3, len(CLOSE))
+        for p, period in enumerate([5, 20]):
+            for row in range(3):
+                alone = compute(
+                    indicator, close[row], period, high=high[row], low=low[row]
+                )
+                np.testing.assert_allclose(result[p, row], alone)
+        assert np.isnan(result[:, 1, :30]).all()
+
+    def test_standard_deviation_on_wide_input(self):
+        """Test running-sum deviations match window deviations on many rows."""
+        rng = np.random.default_rng(7)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (200, 1000)), axis=-1))
+        close[:50, :120] = np.nan
+
+        result = compute("standarddeviation", close, [14, 50, 200])
+
+        for p, period in enumerate([14, 50, 200]):
+            windows = np.lib.stride_tricks.sliding_window_view(close, period, axis=-1)
+            expected = np.full(close.shape, np.nan)
+            expected[:, period - 1 :] = windows.std(axis=-1)
+            np.testing.assert_allclose(result[p], expected, rtol=1e-7, atol=1e-9)
+
+    def test_rsi_without_losses(self):
+        """Test RSI is 100 when prices only rise."""
+        assert compute("rsi", np.arange(1.0, 30.0), 14)[-1] == 100.0
+
+    def test_invalid_arguments(self):
+        """Test unknown indicators, bad periods and missing ranges fail."""
+        with pytest.raises(ValueError):
+            compute("macd", CLOSE, 14)
+        with pytest.raises(ValueError):
+            compute("sma", CLOSE, 0)
+        with pytest.raises(ValueError):
+            compute("adx", CLOSE, 14)
+
+    def test_short_history(self):
+        """Test histories shorter than the period are all NaN."""
+        for indicator in indicators.INDICATORS:
+            result = compute(indicator, CLOSE[:5], 10, high=HIGH[:5], low=LOW[:5])
+            assert np.isnan(result).all()
+
+
+class TestRecords:
+    """Test building inputs and API-shaped outputs."""
+
+    def prices(self, count=30):
+        dates = pd.bdate_range("2024-01-02", periods=count).strftime("%Y-%m-%d")
+        return [
+            {
+                "symbol": "AAPL",
+                "date": date,
+                "open": float(c),
+                "high": float(h),
+                "low": float(l),
+                "close": float(c),
+                "volume": 1000.0,
+            }
+            for date, c, h, l in zip(dates, CLOSE, HIGH, LOW)
+        ][::-1]
+
+    def test_technical_indicators(self):
+        """Test records mirror the API: newest first, None before warm-up."""
+        result = technical_indicators(self.prices(), "standarddeviation", 10)
+
+        assert all(isinstance(r, FMPTechnicalIndicator) for r in result.root)
+        assert result.root[0].date > result.root[-1].date
+        expected = compute("standarddeviation", CLOSE[:30], 10)
+        assert result.root[0].standardDeviation == pytest.approx(expected[-1])
+        assert result.root[-1].standardDeviation is None
+        assert result.root[0].sma is None
+
+    def test_stack(self):
+        """Test histories of different lengths are right-aligned by date."""
+        arrays = stack(
+            {
+                "AAPL": self.prices(30),
+                "NEW": pd.DataFrame(self.prices(10)),
+                "NONE": [],
+            }
+        )
+
+        assert arrays.symbols == ["AAPL", "NEW", "NONE"]
+        assert arrays.close.shape == (3, 30)
+        np.testing.assert_array_equal(arrays.close[0], CLOSE[:30])
+        np.testing.assert_array_equal(arrays.close[1, 20:], CLOSE[:10])
+        assert np.isnan(arrays.close[1, :20]).all() and np.isnan(arrays.close[2]).all()
+        assert arrays.dates[1, 20] == "2024-01-02" and arrays.dates[1, 0] is None
+
+    def test_store_history(self, tmp_path):
+        """Test EODStore.history arrays are accepted as prices."""
+        store = EODStore(str(tmp_path))
+        for record in self.prices(20):
+            store.add_day(record["date"], {k: [v] for k, v in record.items()})
+
+        result = technical_indicators(store.history("AAPL"), "sma", 5)
+
+        assert result.root[0].date == "2024-01-29"
+        assert result.root[0].sma == pytest.approx(CLOSE[15:20].mean())
+
+
+class TestStateful:
+    """Test indicators updated one bar at a time."""
+
+    def bars(self):
+        return [
+            {
+                "date": f"2024-01-02 09:{i // 60:02d}:{i % 60:02d}",
+                "open": c,
+                "close": c,
+                "high": h,
+                "low": l,
+                "volume": 100.0,
+            }
+            for i, (c, h, l) in enumerate(zip(CLOSE, HIGH, LOW))
+        ]
+
+    @pytest.mark.parametrize("name", sorted(indicators.STATEFUL))
+    def test_matches_compute(self, name):
+        """Test per-bar values equal the vectorized series."""
+        indicator = indicators.STATEFUL[name](14)
+        values = [indicator.update(bar) for bar in self.bars()]
+
+        expected = compute(name, CLOSE, 14, high=HIGH, low=LOW)
+        actual = np.array([np.nan if v is None else v for v in values])
+        np.testing.assert_allclose(actual, expected, rtol=1e-9)
+
+    @pytest.mark.parametrize("name", sorted(indicators.STATEFUL))
+    def test_state_round_trip(self, name):
+        """Test a worker restored from JSON state continues identically."""
+        bars = self.bars()
+        original = indicators.STATEFUL[name](10)
+        for bar in bars[:60]:
+            original.update(bar)
+
+        restored = indicators.from_state(json.loads(json.dumps(original.state())))
+
+        assert type(restored) is type(original)
+        assert restored.last_date == bars[59]["date"]
+        for bar in bars[60:]:
+            assert restored.update(bar) == original.update(bar)
+
+    def test_from_bars(self):
+        """Test seeding from raw bars in API (newest first) order."""
+        rsi = indicators.RSI.from_bars(self.bars()[::-1], 14)
+
+        assert rsi.value == pytest.approx(compute("rsi", CLOSE, 14)[-1])
+        assert rsi.last_date == self.bars()[-1]["date"]
+
+    def test_from_indicators(self):
+        """Test seeding from an API series aligns with its latest value."""
+        series = technical_indicators(self.bars(), "ema", 14).root
+        series[0].ema += 1.0  # the API smoothed over more history than it returned
+
+        ema = indicators.EMA.from_indicators(series, 14)
+
+        assert ema.value == series[0].ema
+        following = CLOSE[-1] + 2.0
+        assert ema.update(following) == pytest.approx(
+            series[0].ema + 2 / 15 * (following - series[0].ema)
+        )
+
+    def test_rsi_anchor_keeps_ratio(self):
+        """Test RSI seeding reproduces the API's RSI on the next bar's basis."""
+        series = technical_indicators(self.bars(), "rsi", 14).root
+        series[0].rsi = 55.0
+
+        rsi = indicators.RSI.from_indicators(series, 14)
+
+        assert rsi.value == 55.0
+        gain, loss = rsi._gain.value, rsi._loss.value
+        assert 100 - 100 / (1 + gain / loss) == pytest.approx(55.0)
+
+    def test_invalid_state(self):
+        """Test unknown states and periods are rejected."""
+        with pytest.raises(ValueError):
+            indicators.from_state({"indicator": "sma", "periodLength": 5})
+        with pytest.raises(ValueError):
+            indicators.EMA(0)
+
+    def test_incomplete_subclass_rejected(self):
+        """Test a subclass missing its state hooks cannot be instantiated."""
+
+        class Momentum(indicators.Indicator):
+            indicator = "momentum"
+
+            def _update(self, close, high, low):
+                return close
+
+        with pytest.raises(TypeError):
+            Momentum(5)
+        with pytest.raises(TypeError):
+            indicators.Indicator(5)
+
+    def test_plain_closes(self):
+        """Test close-only indicators accept numbers as bars."""
+        ema = indicators.EMA(3)
+        assert [ema.update(x) for x in (1, 2, 3, 4)] == [None, None, 2.0, 3.0]
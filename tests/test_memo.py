@@ -0,0 +1,169 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+import fmpsdk
+from fmpsdk import memo
+from fmpsdk.memo import MISSING, MemoCache, make_key
+from tests.conftest import make_response
+
+
+@pytest.fixture(autouse=True)
+def reset_memo():
+    """Turn memoization off around every test."""
+    memo.disable_memo()
+    yield
+    memo.disable_memo()
+
+
+class TestMakeKey:
+    """Test memo key construction."""
+
+    def test_apikey_ignored(self):
+        """Test calls differing only by API key share a key."""
+        assert make_key("e", {"apikey": "a", "symbol": "X"}) == make_key(
+            "e", {"apikey": "b", "symbol": "X"}
+        )
+
+    def test_lists_are_frozen(self):
+        """Test list arguments produce hashable keys."""
+        key = make_key("e", {"symbols": ["A", "B"]})
+        assert hash(key)
+        assert key != make_key("e", {"symbols": ["B", "A"]})
+
+    def test_unhashable_returns_none(self):
+        """Test arguments that cannot be hashed disable memoization."""
+        assert make_key("e", {"obj": Mock(__hash__=None)}) is None
+
+
+class TestMemoCache:
+    """Test the LRU/TTL store."""
+
+    def test_hits_and_misses_counted(self):
+        """Test counters are kept per endpoint."""
+        cache = MemoCache(endpoints={"e": None})
+        key = make_key("e", {"symbol": "X"})
+        assert cache.get(key) is MISSING
+        cache.set(key, "value")
+        assert cache.get(key) == "value"
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["endpoints"]["e"] == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at maxsize."""
+        cache = MemoCache(maxsize=2, endpoints={"e": None})
+        a, b, c = (make_key("e", {"n": n}) for n in range(3))
+        cache.set(a, 1)
+        cache.set(b, 2)
+        cache.get(a)
+        cache.set(c, 3)
+
+        assert cache.get(b) is MISSING
+        assert cache.get(a) == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_per_endpoint_ttl(self):
+        """Test entries expire after their endpoint's TTL."""
+        cache = MemoCache(ttl=100, endpoints={"short": 1, "long": None})
+        short, long = make_key("short", {}), make_key("long", {})
+        with patch("fmpsdk.memo.time.monotonic", return_value=0.0):
+            cache.set(short, 1)
+            cache.set(long, 2)
+        with patch("fmpsdk.memo.time.monotonic", return_value=50.0):
+            assert cache.get(short) is MISSING
+            assert cache.get(long) == 2
+
+    def test_thread_safe(self):
+        """Test concurrent use keeps the size bound."""
+        cache = MemoCache(maxsize=50, endpoints={"e": None})
+
+        def worker(n):
+            for i in range(200):
+                key = make_key("e", {"n": (n * 200 + i) % 120})
+                if cache.get(key) is MISSING:
+                    cache.set(key, i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) <= 50
+
+
+class TestParseResponseMemo:
+    """Test memoization through the parse_response decorator."""
+
+    @patch("fmpsdk.transport.get")
+    def test_memoized_endpoint_returns_same_model(self, mock_get):
+        """Test repeated calls return the cached validated instance."""
+        mock_get.return_value = make_response([{"symbol": "AAPL"}])
+        memo.enable_memo(["company_profile"])
+
+        first = fmpsdk.company_profile(apikey="k", symbol="AAPL")
+        second = fmpsdk.company_profile("other-key", "AAPL")
+
+        assert second is first
+        assert mock_get.call_count == 1
+        assert memo.get_memo_stats()["endpoints"]["company_profile"]["hits"] == 1
+
+    @patch("fmpsdk.transport.get")
+    def test_different_arguments_not_shared(self, mock_get):
+        """Test distinct arguments are memoized separately."""
+        mock_get.return_value = make_response([{"symbol": "X"}])
+        memo.enable_memo(["company_profile"])
+
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+        fmpsdk.company_profile(apikey="k", symbol="MSFT")
+
+        assert mock_get.call_count == 2
+
+    @patch("fmpsdk.transport.get")
+    def test_opt_in_per_endpoint(self, mock_get):
+        """Test endpoints not listed are not memoized."""
+        mock_get.return_value = make_response([{"sector": "Energy"}])
+        memo.enable_memo(["company_profile"])
+
+        fmpsdk.available_sectors(apikey="k")
+        fmpsdk.available_sectors(apikey="k")
+
+        assert mock_get.call_count == 2
+        assert "available_sectors" not in memo.get_memo_stats()["endpoints"]
+
+    @patch("fmpsdk.transport.get")
+    def test_disabled_by_default(self, mock_get):
+        """Test nothing is memoized unless enabled."""
+        mock_get.return_value = make_response([{"symbol": "AAPL"}])
+
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+
+        assert mock_get.call_count == 2
+        assert memo.get_memo_stats()["hits"] == 0
+
+    @patch("fmpsdk.transport.get")
+    def test_errors_not_memoized(self, mock_get):
+        """Test API error dictionaries are returned but not cached."""
+        mock_get.return_value = make_response({"Error Message": "Invalid"})
+        memo.enable_memo(["company_profile"])
+
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+
+        assert mock_get.call_count == 2
+
+    @patch("fmpsdk.transport.get")
+    def test_clear_memo(self, mock_get):
+        """Test clearing forces the next call to refetch."""
+        mock_get.return_value = make_response([{"symbol": "AAPL"}])
+        memo.enable_memo({"company_profile": 60})
+
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+        memo.clear_memo("company_profile")
+        fmpsdk.company_profile(apikey="k", symbol="AAPL")
+
+        assert mock_get.call_count == 2
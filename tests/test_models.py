@@ -0,0 +1,136 @@
+import json
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import RootModel, ValidationError
+
+import fmpsdk
+from fmpsdk.model_registry import get_validator
+from fmpsdk.models import (
+    NONE_NORMALIZED,
+    FMPDcfValuation,
+    FMPFundInfo,
+    normalize_none_strings,
+)
+from fmpsdk.utils import JSONBody, validate_response
+
+
+class TestNoneStringNormalization:
+    """Test batch-level "None"-string normalization."""
+
+    def test_normalize_converts_and_reuses_clean_records(self):
+        """Test only records containing "None" are copied."""
+        clean = {"symbol": "A", "dcf": 1.0}
+        dirty = {"symbol": "B", "dcf": "None"}
+        result = normalize_none_strings([clean, dirty, "x"])
+
+        assert result[0] is clean
+        assert result[1] == {"symbol": "B", "dcf": None}
+        assert dirty["dcf"] == "None"
+        assert result[2] == "x"
+
+    def test_per_record_validator_still_converts(self):
+        """Test models validated on their own still convert "None" strings."""
+        record = FMPDcfValuation.model_validate(
+            {"symbol": "A", "date": "d", "dcf": "None"}
+        )
+        assert record.dcf is None
+
+    def test_context_skips_per_record_conversion(self):
+        """Test the normalized context flag bypasses the record validator."""
+        record = FMPDcfValuation.model_validate(
+            {"symbol": "A", "date": "d", "dcf": None},
+            context={NONE_NORMALIZED: True},
+        )
+        assert record.dcf is None
+
+    def test_validate_response_normalizes_once(self):
+        """Test list responses are normalized at batch level."""
+        raw = [
+            {"symbol": "A", "date": "d", "dcf": "None"},
+            {"symbol": "B", "date": "d", "dcf": 2.0},
+        ]
+        with patch(
+            "fmpsdk.models.normalize_none_strings", wraps=normalize_none_strings
+        ) as normalize:
+            result = validate_response("discounted_cash_flow_valuation", raw)
+
+        normalize.assert_called_once()
+        assert [r.dcf for r in result.root] == [None, 2.0]
+
+    def test_nested_models_keep_per_record_conversion(self):
+        """Test models with nested models are validated without the flag."""
+        model = RootModel[List[FMPFundInfo]]
+        with patch.dict("fmpsdk.model_registry.ENDPOINT_MODEL_MAP", {"fund": model}):
+            with patch.object(
+                model, "model_validate", wraps=model.model_validate
+            ) as validate:
+                validate_response("fund", [])
+
+        assert validate.call_args.kwargs["context"] is None
+
+
+class TestJSONBodyValidation:
+    """Test validation of undecoded JSON bodies with cached validators."""
+
+    RECORDS = [
+        {"symbol": "A", "date": "d", "dcf": "None", "Stock Price": 2.5},
+        {"symbol": "B", "date": "d", "dcf": 2.0},
+    ]
+
+    def body(self, records=None):
+        return JSONBody(
+            json.dumps(self.RECORDS if records is None else records).encode()
+        )
+
+    def test_validator_is_cached(self):
+        """Test each endpoint's validator is built once."""
+        endpoint = "discounted_cash_flow_valuation"
+        assert get_validator(endpoint) is get_validator(endpoint)
+
+    def test_matches_decoded_validation(self):
+        """Test bytes validate to the same models, "None" strings included."""
+        endpoint = "discounted_cash_flow_valuation"
+        result = validate_response(endpoint, self.body())
+        assert result == validate_response(endpoint, self.RECORDS)
+        assert result.root[0].dcf is None
+
+    def test_non_model_outputs_decode(self):
+        """Test other output modes and trusted mode receive decoded data."""
+        endpoint = "discounted_cash_flow_valuation"
+        assert validate_response(endpoint, self.body(), output="raw") == self.RECORDS
+        result = validate_response(endpoint, self.body(), trusted=True)
+        assert result.root[1].dcf == 2.0
+
+    def test_invalid_body_raises(self):
+        """Test schema mismatches still raise ValidationError."""
+        with patch("fmpsdk.utils._report_validation_error") as report:
+            with pytest.raises(ValidationError):
+                validate_response(
+                    "discounted_cash_flow_valuation", self.body([{"symbol": 1}])
+                )
+        assert report.call_args.args[1] == [{"symbol": 1}]
+
+    @patch("fmpsdk.transport.get")
+    def test_endpoint_skips_json_decode(self, mock_get):
+        """Test endpoints validate the response bytes without response.json()."""
+        response = Mock(status_code=200, content=self.body())
+        response.json.side_effect = AssertionError("decoded")
+        mock_get.return_value = response
+
+        result = fmpsdk.discounted_cash_flow_valuation(apikey="k", symbol="A")
+
+        assert [r.symbol for r in result.root] == ["A", "B"]
+
+    @patch("fmpsdk.transport.get")
+    def test_raw_output_decodes_json(self, mock_get):
+        """Test output="raw" still gets decoded JSON from the transport."""
+        mock_get.return_value = Mock(status_code=200, content=self.body())
+
+        result = fmpsdk.discounted_cash_flow_valuation(
+            apikey="k", symbol="A", output="raw"
+        )
+
+        assert result == self.RECORDS
+        assert not isinstance(result, JSONBody)
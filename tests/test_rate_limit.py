@@ -0,0 +1,185 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from fmpsdk import rate_limit, transport
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    """Disable the process-wide limiter around every test."""
+    rate_limit.disable_rate_limit()
+    yield
+    rate_limit.disable_rate_limit()
+
+
+class FakeClock:
+    """Deterministic replacement for time.monotonic/time.time."""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Test the in-process token bucket."""
+
+    def test_burst_is_immediate_then_throttled(self):
+        """Test the burst is free and later calls wait for refills."""
+        clock = FakeClock()
+        with patch("fmpsdk.rate_limit.time.monotonic", clock):
+            bucket = rate_limit.TokenBucket(calls_per_minute=60, burst=2)
+            assert bucket.reserve() == 0
+            assert bucket.reserve() == 0
+            assert bucket.reserve() == pytest.approx(1.0)
+            assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_refill_over_time(self):
+        """Test tokens refill at calls_per_minute / 60 per second."""
+        clock = FakeClock()
+        with patch("fmpsdk.rate_limit.time.monotonic", clock):
+            bucket = rate_limit.TokenBucket(calls_per_minute=120, burst=1)
+            assert bucket.reserve() == 0
+            clock.now += 0.5
+            assert bucket.reserve() == 0
+            assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_refill_capped_at_capacity(self):
+        """Test idle time does not accumulate more than the burst size."""
+        clock = FakeClock()
+        with patch("fmpsdk.rate_limit.time.monotonic", clock):
+            bucket = rate_limit.TokenBucket(calls_per_minute=60, burst=2)
+            clock.now += 3600
+            assert bucket.reserve() == 0
+            assert bucket.reserve() == 0
+            assert bucket.reserve() > 0
+
+    @patch("fmpsdk.rate_limit.time.sleep")
+    def test_acquire_sleeps_for_wait(self, mock_sleep):
+        """Test acquire sleeps exactly the reserved wait."""
+        clock = FakeClock()
+        with patch("fmpsdk.rate_limit.time.monotonic", clock):
+            bucket = rate_limit.TokenBucket(calls_per_minute=60)
+            bucket.acquire()
+            mock_sleep.assert_not_called()
+            assert bucket.acquire() == pytest.approx(1.0)
+            mock_sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_thread_safe_reservations(self):
+        """Test concurrent reservations each get a distinct slot."""
+        clock = FakeClock()
+        waits = []
+        with patch("fmpsdk.rate_limit.time.monotonic", clock):
+            bucket = rate_limit.TokenBucket(calls_per_minute=60)
+
+            def worker():
+                waits.append(bucket.reserve())
+
+            threads = [threading.Thread(target=worker) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert sorted(round(w) for w in waits) == list(range(20))
+
+    @pytest.mark.parametrize("kwargs", [{"calls_per_minute": 0}, {"burst": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test invalid bucket parameters raise ValueError."""
+        params = {"calls_per_minute": 60, **kwargs}
+        with pytest.raises(ValueError):
+            rate_limit.TokenBucket(**params)
+
+
+class TestFileTokenBucket:
+    """Test the cross-process file-backed bucket."""
+
+    def test_buckets_share_state_file(self, tmp_path):
+        """Test two limiters on one file draw from one quota."""
+        path = str(tmp_path / "fmp.ratelimit")
+        clock = FakeClock()
+        with patch("fmpsdk.rate_limit.time.time", clock):
+            first = rate_limit.FileTokenBucket(60, path)
+            second = rate_limit.FileTokenBucket(60, path)
+            assert first.reserve() == 0
+            assert second.reserve() == pytest.approx(1.0)
+            assert first.reserve() == pytest.approx(2.0)
+            clock.now += 10
+            assert second.reserve() == 0
+
+    def test_corrupt_state_starts_full(self, tmp_path):
+        """Test an unreadable state file resets to a full bucket."""
+        path = tmp_path / "fmp.ratelimit"
+        path.write_text("not json")
+        bucket = rate_limit.FileTokenBucket(60, str(path))
+        assert bucket.reserve() == 0
+
+
+class TestConfiguration:
+    """Test process-wide limiter configuration."""
+
+    def test_disabled_by_default(self):
+        """Test acquire is a no-op without a limiter."""
+        assert rate_limit.get_rate_limiter() is None
+        assert rate_limit.acquire() == 0.0
+
+    def test_configure_by_plan(self):
+        """Test plan names map to their per-minute quota."""
+        limiter = rate_limit.configure_rate_limit(plan="Premium")
+        assert limiter.calls_per_minute == 750
+        assert rate_limit.get_rate_limiter() is limiter
+
+    def test_configure_unknown_plan(self):
+        """Test unknown plans raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown plan"):
+            rate_limit.configure_rate_limit(plan="gold")
+
+    def test_configure_with_path_uses_file_backend(self, tmp_path):
+        """Test a state path selects the file-backed limiter."""
+        limiter = rate_limit.configure_rate_limit(
+            300, path=str(tmp_path / "fmp.ratelimit")
+        )
+        assert isinstance(limiter, rate_limit.FileTokenBucket)
+
+    def test_configure_from_environment(self, monkeypatch, tmp_path):
+        """Test worker processes pick the limit up from the environment."""
+        monkeypatch.setenv(rate_limit.CALLS_PER_MINUTE_ENV, "300")
+        monkeypatch.setenv(rate_limit.RATE_LIMIT_FILE_ENV, str(tmp_path / "state"))
+        monkeypatch.setattr(rate_limit, "_env_checked", False)
+        monkeypatch.setattr(rate_limit, "_limiter", None)
+
+        limiter = rate_limit.get_rate_limiter()
+
+        assert isinstance(limiter, rate_limit.FileTokenBucket)
+        assert limiter.calls_per_minute == 300
+
+    @pytest.mark.parametrize("value", ["fast", "0", "-5", "nan"])
+    def test_invalid_environment_keeps_raising(self, monkeypatch, value):
+        """Test a bad limit in the environment is never silently ignored."""
+        monkeypatch.setenv(rate_limit.CALLS_PER_MINUTE_ENV, value)
+        monkeypatch.setattr(rate_limit, "_env_checked", False)
+        monkeypatch.setattr(rate_limit, "_limiter", None)
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match=rate_limit.CALLS_PER_MINUTE_ENV):
+                rate_limit.get_rate_limiter()
+
+    def test_transport_waits_before_sending(self):
+        """Test the shared transport acquires a token before each request."""
+        limiter = rate_limit.configure_rate_limit(60)
+        session = Mock()
+        order = []
+        session.get.side_effect = lambda *a, **k: order.append("send")
+        transport.set_session(session)
+        try:
+            with patch.object(
+                limiter, "acquire", side_effect=lambda: order.append("acquire")
+            ):
+                transport.get("https://example.com/")
+        finally:
+            transport.set_session(None)
+
+        assert order == ["acquire", "send"]
@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fmpsdk.models import FMPIntradayDataPoint
+from fmpsdk.resample import Session, resample, resample_columns, session
+
+NASDAQ_HOURS = [
+    {
+        "exchange": "NASDAQ",
+        "name": "NASDAQ",
+        "openingHour": "09:30 AM -04:00",
+        "closingHour": "04:00 PM -04:00",
+        "timezone": "America/New_York",
+        "isMarketOpen": False,
+    }
+]
+
+
+def minute_bars(start="2024-01-02 04:00", days=3, seed=0):
+    """One-minute bars from 04:00 to 20:00 on consecutive weekdays."""
+    index = pd.date_range(start, periods=days * 1440, freq="min")
+    index = index[(index.dayofweek < 5) & (index.hour >= 4) & (index.hour < 20)]
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=len(index)) * 0.05)
+    return pd.DataFrame(
+        {
+            "date": index.strftime("%Y-%m-%d %H:%M:%S"),
+            "open": close + rng.normal(size=len(index)) * 0.01,
+            "low": close - rng.uniform(0, 0.1, size=len(index)),
+            "high": close + rng.uniform(0, 0.1, size=len(index)),
+            "close": close,
+            "volume": rng.integers(1, 1000, size=len(index)).astype(float),
+        }
+    )
+
+
+def pandas_resample(frame, rule, offset):
+    indexed = frame.set_index(pd.to_datetime(frame["date"]))
+    indexed = indexed.between_time("09:30", "15:59")
+    result = indexed.resample(rule, origin="start_day", offset=offset).agg(
+        {"open": "first", "low": "min", "high": "max", "close": "last", "volume": "sum"}
+    )
+    return result.dropna()
+
+
+class TestResample:
+    """Test building longer bars from one-minute bars."""
+
+    def test_small_example(self):
+        """Test first open, extremes, last close and summed volume."""
+        bars = [
+            {
+                "date": "2024-01-02 09:34:00",
+                "open": 5,
+                "low": 4,
+                "high": 6,
+                "close": 5.5,
+                "volume": 1,
+            },
+            {
+                "date": "2024-01-02 09:33:00",
+                "open": 3,
+                "low": 1,
+                "high": 4,
+                "close": 4,
+                "volume": 2,
+            },
+            {
+                "date": "2024-01-02 09:32:00",
+                "open": 2,
+                "low": 2,
+                "high": 9,
+                "close": 3,
+                "volume": 3,
+            },
+            {
+                "date": "2024-01-02 09:31:00",
+                "open": 1,
+                "low": 1,
+                "high": 2,
+                "close": 2,
+                "volume": 4,
+            },
+        ]
+
+        result = resample(bars, "3min", output="raw")
+
+        assert result == [
+            {
+                "date": "2024-01-02 09:33:00",
+                "open": 3.0,
+                "low": 1.0,
+                "high": 6.0,
+                "close": 5.5,
+                "volume": 3.0,
+            },
+            {
+                "date": "2024-01-02 09:30:00",
+                "open": 1.0,
+                "low": 1.0,
+                "high": 9.0,
+                "close": 3.0,
+                "volume": 7.0,
+            },
+        ]
+
+    @pytest.mark.parametrize(
+        "timeframe,rule,offset",
+        [
+            ("5min", "5min", "0min"),
+            ("15min", "15min", "0min"),
+            ("1hour", "60min", "30min"),
+            ("4hour", "240min", "9h30min"),
+            ("1day", "1D", None),
+            ("10min", "10min", "0min"),
+        ],
+    )
+    def test_matches_pandas(self, timeframe, rule, offset):
+        """Test session-aligned bars equal pandas resampling of the session."""
+        frame = minute_bars()
+        expected = pandas_resample(frame, rule, offset)
+
+        result = resample(frame.iloc[::-1], timeframe, NASDAQ_HOURS, output="columns")
+
+        if timeframe == "1day":
+            dates = expected.index.strftime("%Y-%m-%d")
+        else:
+            dates = expected.index.strftime("%Y-%m-%d %H:%M:%S")
+        assert result["date"].tolist() == dates.tolist()[::-1]
+        for key in ("open", "low", "high", "close", "volume"):
+            np.testing.assert_allclose(result[key], expected[key].to_numpy()[::-1])
+
+    def test_session_alignment(self):
+        """Test hourly buckets start at the opening and end at the close."""
+        result = resample(minute_bars(days=1), "1hour", NASDAQ_HOURS, output="pandas")
+
+        times = result["date"].str[11:16].tolist()[::-1]
+        assert times == ["09:30", "10:30", "11:30", "12:30", "13:30", "14:30", "15:30"]
+        assert result["volume"].iloc[0] == pytest.approx(
+            minute_bars(days=1)
+            .set_index("date")
+            .loc["2024-01-02 15:30:00":"2024-01-02 15:59:00", "volume"]
+            .sum()
+        )
+
+    def test_order_independent(self):
+        """Test newest-first, ascending and shuffled input agree."""
+        frame = minute_bars(days=1)
+        shuffled = frame.sample(frac=1, random_state=1)
+        results = [
+            resample(f, "15min", NASDAQ_HOURS, output="columns")
+            for f in (frame, frame.iloc[::-1], shuffled)
+        ]
+        for other in results[1:]:
+            for key, column in results[0].items():
+                np.testing.assert_array_equal(column, other[key])
+
+    def test_many_timeframes_and_outputs(self):
+        """Test a list of timeframes and every input and output form."""
+        frame = minute_bars(days=1).iloc[::-1]
+        models = resample(frame, "1min", output="models")
+        assert all(isinstance(bar, FMPIntradayDataPoint) for bar in models.root)
+        assert len(models.root) == len(frame)
+
+        results = resample(models, ["5min", 30, "1day"], ("09:30", "16:00"))
+        assert set(results) == {"5min", 30, "1day"}
+        assert len(results["5min"].root) == 78
+        assert len(results[30].root) == 13
+        assert results["1day"].root[0].date == "2024-01-02"
+
+        columns = resample(frame.to_dict(orient="list"), "5min", output="columns")
+        np.testing.assert_array_equal(
+            columns["close"], resample(frame, "5min", output="columns")["close"]
+        )
+
+    def test_empty(self):
+        """Test no bars, or none inside the session, give no bars."""
+        assert resample([], "5min", output="raw") == []
+        early = minute_bars(days=1).head(10)
+        assert resample(early, "5min", NASDAQ_HOURS, output="raw") == []
+
+    def test_invalid_arguments(self):
+        """Test unknown timeframes and outputs raise ValueError."""
+        with pytest.raises(ValueError):
+            resample(minute_bars(days=1), "1week")
+        with pytest.raises(ValueError):
+            resample(minute_bars(days=1), "5min", output="arrow")
+        with pytest.raises(ValueError):
+            resample_columns({}, 0)
+
+
+class TestSession:
+    """Test reading sessions from market hours."""
+
+    def test_market_hours(self):
+        """Test exchange_market_hours records and clock pairs are read."""
+        assert session(NASDAQ_HOURS) == Session(570, 960)
+        assert session(NASDAQ_HOURS[0]) == Session(570, 960)
+        assert session(("08:00", "16:30")) == Session(480, 990)
+        assert session({"openingHour": "12:00 AM", "closingHour": "12:30 PM"}) == (
+            Session(0, 750)
+        )
+
+    def test_invalid(self):
+        """Test unreadable or overnight hours raise ValueError."""
+        with pytest.raises(ValueError):
+            session([])
+        with pytest.raises(ValueError):
+            session({"openingHour": "closed", "closingHour": "04:00 PM"})
+        with pytest.raises(ValueError):
+            session(("18:00", "06:00"))
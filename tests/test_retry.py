@@ -0,0 +1,233 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+import fmpsdk.url_methods as url_methods
+from fmpsdk import retry
+from fmpsdk.exceptions import RateLimitExceededException
+from fmpsdk.retry import RetryPolicy
+from tests.conftest import make_response
+
+# Access the private function outside of classes to avoid name mangling
+return_json_func = url_methods.__return_json
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_state():
+    """Reset global policy and counters around every test."""
+    default = retry.get_retry_policy()
+    retry.reset_retry_stats()
+    yield
+    retry.set_retry_policy(default)
+    retry.reset_retry_stats()
+
+
+class TestRetryPolicy:
+    """Test delay computation."""
+
+    def test_exponential_backoff_without_jitter(self):
+        """Test delays double up to max_delay."""
+        policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False, deadline=None)
+        assert [policy.backoff(n) for n in range(5)] == [1, 2, 4, 5, 5]
+
+    def test_full_jitter_within_bounds(self):
+        """Test jittered delays fall between zero and the exponential ceiling."""
+        policy = RetryPolicy(base_delay=1, max_delay=60)
+        for attempt in range(6):
+            for _ in range(50):
+                assert 0 <= policy.backoff(attempt) <= 2**attempt
+
+    def test_jitter_spreads_delays(self):
+        """Test jitter does not produce identical delays."""
+        policy = RetryPolicy(base_delay=10)
+        assert len({policy.backoff(3) for _ in range(20)}) > 1
+
+    def test_gives_up_after_max_retries(self):
+        """Test no delay is returned once retries are used up."""
+        policy = RetryPolicy(max_retries=2, jitter=False, deadline=None)
+        assert policy.next_delay(1, 0) is not None
+        assert policy.next_delay(2, 0) is None
+
+    def test_deadline_budget(self):
+        """Test retries stop when the next sleep would overrun the deadline."""
+        policy = RetryPolicy(base_delay=4, jitter=False, deadline=10)
+        assert policy.next_delay(0, 5) == 4
+        assert policy.next_delay(0, 7) is None
+
+    def test_retry_after_overrides_backoff(self):
+        """Test a Retry-After value replaces the computed delay."""
+        policy = RetryPolicy(base_delay=1, jitter=False)
+        assert policy.next_delay(0, 0, retry_after=7) == 7
+
+    def test_retry_after_ignored_when_disabled(self):
+        """Test Retry-After can be ignored."""
+        policy = RetryPolicy(base_delay=1, jitter=False, respect_retry_after=False)
+        assert policy.next_delay(0, 0, retry_after=7) == 1
+
+    def test_constant_policy(self):
+        """Test the legacy fixed-delay policy."""
+        policy = RetryPolicy.constant(3, 0.5)
+        assert [policy.next_delay(n, 1000) for n in range(4)] == [0.5, 0.5, 0.5, None]
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_retries": -1}, {"base_delay": -1}, {"multiplier": 0.5}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        """Test invalid policy parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_delta_seconds(self):
+        """Test numeric Retry-After values."""
+        assert (
+            retry.parse_retry_after(make_response(headers={"Retry-After": "12"})) == 12
+        )
+
+    def test_http_date(self):
+        """Test HTTP-date Retry-After values."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = make_response(headers={"retry-after": format_datetime(when)})
+        assert 25 <= retry.parse_retry_after(response) <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        """Test absent or unparseable values return None."""
+        headers = {} if value is None else {"Retry-After": value}
+        assert retry.parse_retry_after(make_response(headers=headers)) is None
+
+    def test_mock_headers_ignored(self):
+        """Test objects without mapping headers return None."""
+        assert retry.parse_retry_after(Mock()) is None
+
+
+class TestPolicySelection:
+    """Test global, contextual and per-call policies."""
+
+    def test_set_retry_policy(self):
+        """Test the global policy can be replaced."""
+        policy = RetryPolicy(max_retries=1)
+        retry.set_retry_policy(policy)
+        assert retry.get_retry_policy() is policy
+
+    def test_set_retry_policy_type_checked(self):
+        """Test non-policy objects are rejected."""
+        with pytest.raises(TypeError):
+            retry.set_retry_policy({"max_retries": 1})
+
+    def test_use_retry_policy_is_scoped(self):
+        """Test contextual policies apply only inside the block."""
+        policy = RetryPolicy(max_retries=1)
+        with retry.use_retry_policy(policy):
+            assert retry.get_retry_policy() is policy
+        assert retry.get_retry_policy() is not policy
+
+    def test_resolve_policy_precedence(self):
+        """Test explicit policy beats legacy arguments beats context."""
+        explicit = RetryPolicy(max_retries=4)
+        assert retry.resolve_policy(1, 1, explicit) is explicit
+        legacy = retry.resolve_policy(retries=2, retry_delay=3)
+        assert (legacy.max_retries, legacy.base_delay, legacy.jitter) == (2, 3, False)
+        assert retry.resolve_policy() is retry.get_retry_policy()
+
+
+class TestReturnJsonRetries:
+    """Test __return_json retries iteratively under the policy."""
+
+    @patch("fmpsdk.url_methods.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_exponential_delays_and_stats(self, mock_get, mock_sleep):
+        """Test 429s back off exponentially and are counted."""
+        mock_get.side_effect = [make_response(status_code=429)] * 3 + [make_response()]
+        policy = RetryPolicy(base_delay=1, jitter=False, deadline=None)
+
+        assert return_json_func("quote", {"apikey": "k"}, retry_policy=policy) == []
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 4]
+        stats = retry.get_retry_stats()
+        assert stats["retries"] == 3
+        assert stats["rate_limit_retries"] == 3
+        assert stats["total_delay"] == 7
+
+    @patch("fmpsdk.url_methods.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_honors_retry_after(self, mock_get, mock_sleep):
+        """Test the server's Retry-After header sets the delay."""
+        mock_get.side_effect = [
+            make_response(status_code=429, headers={"Retry-After": "9"}),
+            make_response(),
+        ]
+
+        return_json_func("quote", {"apikey": "k"})
+
+        mock_sleep.assert_called_once_with(9.0)
+        assert retry.get_retry_stats()["retry_after_honored"] == 1
+
+    @patch("fmpsdk.url_methods.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_gives_up_with_rate_limit_exception(self, mock_get, mock_sleep):
+        """Test exhausted retries raise RateLimitExceededException."""
+        mock_get.return_value = make_response(status_code=429)
+        policy = RetryPolicy(max_retries=2, jitter=False, deadline=None)
+
+        with pytest.raises(RateLimitExceededException):
+            return_json_func("quote", {"apikey": "k"}, retry_policy=policy)
+
+        assert mock_get.call_count == 3
+        assert retry.get_retry_stats()["gave_up"] == 1
+
+    @patch("fmpsdk.url_methods.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_context_policy_applies_to_endpoints(self, mock_get, mock_sleep):
+        """Test use_retry_policy governs calls made inside the block."""
+        mock_get.return_value = make_response(status_code=429)
+
+        with retry.use_retry_policy(RetryPolicy(max_retries=0)):
+            with pytest.raises(RateLimitExceededException):
+                return_json_func("quote", {"apikey": "k"})
+
+        mock_sleep.assert_not_called()
+
+    @patch("fmpsdk.url_methods.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_per_call_policy_applies_to_endpoints(self, mock_get, mock_sleep):
+        """Test an endpoint's retry_policy keyword governs that call only."""
+        from fmpsdk import quote
+
+        mock_get.return_value = make_response(status_code=429)
+        retry.set_retry_policy(RetryPolicy(base_delay=0, jitter=False))
+
+        with pytest.raises(RateLimitExceededException):
+            quote(apikey="k", symbol="AAPL", retry_policy=RetryPolicy(max_retries=0))
+
+        mock_sleep.assert_not_called()
+        assert mock_get.call_count == 1
+        assert retry.get_retry_policy().max_retries == retry.MAX_RETRIES
+
+    def test_per_call_policy_type_checked(self):
+        """Test a retry_policy that is not a RetryPolicy is rejected."""
+        from fmpsdk import quote
+
+        with pytest.raises(TypeError):
+            quote(apikey="k", symbol="AAPL", retry_policy=3)
+
+    @patch("fmpsdk.url_methods.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_read_timeouts_do_not_recurse(self, mock_get, mock_sleep):
+        """Test many timeouts are retried in a loop, not by recursion."""
+        mock_get.side_effect = [requests.exceptions.ReadTimeout()] * 50 + [
+            make_response()
+        ]
+        policy = RetryPolicy(max_retries=60, base_delay=0, deadline=None)
+
+        with patch("fmpsdk.url_methods.__return_json") as recursive:
+            assert return_json_func("quote", {"apikey": "k"}, retry_policy=policy) == []
+            recursive.assert_not_called()
+
+        assert retry.get_retry_stats()["timeout_retries"] == 50
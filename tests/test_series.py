@@ -0,0 +1,248 @@
+import copy
+import datetime
+import json
+import pickle
+import sys
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fmpsdk
+from fmpsdk import indicators, resample
+from fmpsdk.model_registry import ENDPOINT_MODEL_MAP
+from fmpsdk.series import PriceSeries
+
+
+def eod_records(days=10):
+    """historical_price_eod records, newest first like the API."""
+    records = []
+    for day in range(days, 0, -1):
+        records.append(
+            {
+                "symbol": "AAPL",
+                "date": f"2024-01-{day:02d}",
+                "open": 100.0 + day,
+                "high": 102.0 + day,
+                "low": 99.0 + day,
+                "close": 101.0 + day,
+                "volume": 1000.0 * day,
+                "change": 1.0,
+                "changePercent": 0.5,
+                "vwap": 100.5 + day,
+            }
+        )
+    return records
+
+
+def intraday_records():
+    """historical_chart 1min records across two days, newest first."""
+    dates = ["2024-01-03 09:31:00", "2024-01-03 09:30:00", "2024-01-02 15:59:00"]
+    return [
+        {
+            "date": date,
+            "open": 1.0 + i,
+            "low": 0.5 + i,
+            "high": 2.0 + i,
+            "close": 1.5 + i,
+            "volume": 10.0 * (i + 1),
+        }
+        for i, date in enumerate(dates)
+    ]
+
+
+def eod_series(days=10):
+    return PriceSeries.from_records(
+        eod_records(days), ENDPOINT_MODEL_MAP["historical_price_eod"]
+    )
+
+
+class TestPriceSeries:
+    """Test building and slicing array-backed price series."""
+
+    def test_from_records(self):
+        """Test columns are typed, contiguous, ascending and keep one symbol."""
+        series = eod_series()
+
+        assert series.symbol == "AAPL"
+        assert len(series) == 10
+        assert series.dates.dtype == np.dtype("M8[D]")
+        assert series.dates[0] == np.datetime64("2024-01-01")
+        assert series.fields == (
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "change",
+            "changePercent",
+            "vwap",
+        )
+        for name in ("open", "high", "low", "close", "volume", "vwap"):
+            assert series[name].dtype == np.float64
+            assert series[name].flags.c_contiguous
+        assert series.close.tolist() == [102.0 + i for i in range(10)]
+        assert series["date"] is series.dates
+
+    def test_intraday_dates(self):
+        """Test intraday dates keep their time of day."""
+        series = PriceSeries.from_records(
+            intraday_records(), ENDPOINT_MODEL_MAP["historical_chart"]
+        )
+
+        assert series.symbol is None
+        assert series.dates.dtype == np.dtype("M8[s]")
+        assert str(series.dates[0]) == "2024-01-02T15:59:00"
+        assert len(series["2024-01-03":"2024-01-03"]) == 2
+        assert len(series.between(to_date="2024-01-02")) == 1
+        assert len(series[datetime.datetime(2024, 1, 3, 9, 31) :]) == 1
+
+    @pytest.mark.parametrize(
+        "clone", [copy.copy, copy.deepcopy, lambda s: pickle.loads(pickle.dumps(s))]
+    )
+    def test_copy_and_pickle_round_trip(self, clone):
+        """Test copies and pickles keep dates, columns and symbol."""
+        series = eod_series()
+
+        restored = clone(series)
+
+        assert restored is not series
+        assert restored.symbol == "AAPL"
+        assert restored.fields == series.fields
+        np.testing.assert_array_equal(restored.dates, series.dates)
+        np.testing.assert_array_equal(restored.close, series.close)
+
+    def test_private_names_not_columns(self):
+        """Test private and dunder lookups raise AttributeError."""
+        series = eod_series()
+        with pytest.raises(AttributeError):
+            series.__setstate__
+        with pytest.raises(AttributeError):
+            series._missing
+
+    def test_slices_are_views(self):
+        """Test date and position slices share memory with the series."""
+        series = eod_series()
+
+        window = series["2024-01-03":"2024-01-05"]
+        assert window.dates.tolist() == [
+            datetime.date(2024, 1, 3),
+            datetime.date(2024, 1, 4),
+            datetime.date(2024, 1, 5),
+        ]
+        assert window.symbol == "AAPL"
+        for view in (window, series[-3:], series[::2]):
+            assert np.shares_memory(view.close, series.close)
+            assert np.shares_memory(view.dates, series.dates)
+
+        assert len(series[datetime.date(2024, 1, 8) :]) == 3
+        assert len(series[: np.datetime64("2024-01-02")]) == 2
+        assert len(series["2025-01-01":]) == 0
+        assert len(series["2024-01-05":"2024-01-04"]) == 0
+
+    def test_order_independent(self):
+        """Test ascending and shuffled records give the same series."""
+        model = ENDPOINT_MODEL_MAP["historical_price_eod"]
+        records = eod_records()
+        shuffled = [records[i] for i in (3, 0, 9, 5, 1, 7, 2, 8, 4, 6)]
+        expected = eod_series()
+        for other in (records[::-1], shuffled):
+            series = PriceSeries.from_records(other, model)
+            np.testing.assert_array_equal(series.dates, expected.dates)
+            np.testing.assert_array_equal(series.close, expected.close)
+
+    def test_invalid(self):
+        """Test mixed symbols, bad keys and undated models are rejected."""
+        records = eod_records(2)
+        records[0]["symbol"] = "MSFT"
+        with pytest.raises(ValueError):
+            PriceSeries.from_records(
+                records, ENDPOINT_MODEL_MAP["historical_price_eod"]
+            )
+        with pytest.raises(ValueError):
+            PriceSeries.from_records([], ENDPOINT_MODEL_MAP["stock_list"])
+        with pytest.raises(ValueError):
+            PriceSeries(["2024-01-01"], {"close": [1.0, 2.0]})
+        with pytest.raises(AttributeError):
+            eod_series().adjClose
+        with pytest.raises(TypeError):
+            eod_series()[0]
+
+    def test_empty(self):
+        """Test an empty response gives an empty series."""
+        series = PriceSeries.from_records(
+            [], ENDPOINT_MODEL_MAP["historical_price_eod"]
+        )
+        assert len(series) == 0
+        assert len(series["2024-01-01":]) == 0
+
+    def test_smaller_than_models(self):
+        """Test the arrays take a fraction of the memory of the models."""
+        records = eod_records(30)
+        models = ENDPOINT_MODEL_MAP["historical_price_eod"].model_validate(records)
+        series = eod_series(30)
+
+        model_bytes = sum(
+            sys.getsizeof(bar) + sys.getsizeof(bar.__dict__) for bar in models.root
+        )
+        assert series.nbytes == 30 * 9 * 8
+        assert series.nbytes < model_bytes / 4
+
+    def test_to_pandas(self):
+        """Test the DataFrame has a date column and every field."""
+        frame = eod_series().to_pandas()
+        assert list(frame.columns) == ["date", *eod_series().fields]
+        assert pd.api.types.is_datetime64_any_dtype(frame["date"])
+
+
+class TestSeriesOutput:
+    """Test output="series" on endpoints and local tools."""
+
+    @patch("fmpsdk.transport.get")
+    def test_endpoint_output(self, mock_get):
+        """Test chart endpoints return a PriceSeries without model objects."""
+        mock_get.return_value = Mock(
+            status_code=200, content=json.dumps(eod_records()).encode()
+        )
+        model = ENDPOINT_MODEL_MAP["historical_price_eod"]
+
+        with patch.object(model, "model_validate") as validate:
+            series = fmpsdk.historical_price_eod("k", "AAPL", output="series")
+            validate.assert_not_called()
+
+        assert isinstance(series, PriceSeries)
+        assert series.close[-1] == 111.0
+        assert "output" not in mock_get.call_args.kwargs["params"]
+
+        mock_get.return_value = Mock(
+            status_code=200, content=json.dumps(intraday_records()).encode()
+        )
+        bars = fmpsdk.historical_chart("AAPL", "1min", "k", output="series")
+        assert bars.dates.dtype == np.dtype("M8[s]")
+
+    @patch("fmpsdk.transport.get")
+    def test_non_price_endpoint(self, mock_get):
+        """Test endpoints without dated records reject the series output."""
+        mock_get.return_value = Mock(status_code=200, content=b"[]")
+        with pytest.raises(ValueError):
+            fmpsdk.stock_list("k", output="series")
+
+    def test_indicators_and_resample(self):
+        """Test series are accepted by the indicator and resample tools."""
+        series = eod_series()
+        expected = indicators.technical_indicators(eod_records(), "sma", 3)
+        result = indicators.technical_indicators(series, "sma", 3)
+        assert [r.sma for r in result.root] == [r.sma for r in expected.root]
+        assert result.root[0].date == "2024-01-10"
+
+        bars = PriceSeries.from_records(
+            intraday_records(), ENDPOINT_MODEL_MAP["historical_chart"]
+        )
+        daily = resample.resample(bars, "1day", output="series")
+        assert isinstance(daily, PriceSeries)
+        assert daily.dates.tolist() == [
+            datetime.date(2024, 1, 2),
+            datetime.date(2024, 1, 3),
+        ]
+        assert daily.volume.tolist() == [30.0, 30.0]
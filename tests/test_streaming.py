@@ -0,0 +1,224 @@
+import csv
+import io
+import json
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import RootModel
+
+import fmpsdk
+from fmpsdk import columnar, streaming
+from fmpsdk.models import FMPBulkEOD, FMPSymbolAndCompanyNameList
+from fmpsdk.streaming import (
+    NotAJSONArray,
+    iter_csv_frames,
+    iter_csv_records,
+    iter_json_array,
+)
+from tests.conftest import make_response
+
+RECORDS = [{"symbol": f"S{i}", "companyName": f"Company {i} é☃"} for i in range(25)]
+
+EOD_CSV = (
+    "symbol,date,open,low,high,close,adjClose,volume\n"
+    + "".join(
+        f"S{i},2024-01-02,{i}.5,{i}.25,{i + 1}.0,{i}.75,{i}.75,{i * 100}\n"
+        for i in range(25)
+    )
+).encode()
+GAPS = b"X,2024-01-02,None,1.0,2.0,1.5,1.5,\n"
+
+
+def split(body, size):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+class TestIterJsonArray:
+    """Test incremental JSON array decoding."""
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 100000])
+    def test_any_chunking(self, size):
+        """Test elements decode identically however the bytes are split."""
+        nested = {"a": {"b": {"c": 1}}, "text": '}, {"x": 1}]'}
+        data = RECORDS + [nested, 12345, -1.5e3, "x", True, None, [1, {"a": []}]]
+        body = json.dumps(data, ensure_ascii=False).encode()
+        assert list(iter_json_array(split(body, size))) == data
+
+    def test_lazy(self):
+        """Test elements are yielded before the input is exhausted."""
+        chunks = iter([b'[{"a": 1},', b'{"a": 2}]'])
+        items = iter_json_array(chunks)
+        assert next(items) == {"a": 1}
+        assert next(chunks) == b'{"a": 2}]'
+
+    def test_empty_array(self):
+        """Test empty arrays yield nothing."""
+        assert list(iter_json_array([b" [ ", b"] "])) == []
+
+    def test_not_an_array(self):
+        """Test other documents raise NotAJSONArray carrying the document."""
+        with pytest.raises(NotAJSONArray) as error:
+            list(iter_json_array([b'{"Error Message":', b' "x"}']))
+        assert error.value.document == {"Error Message": "x"}
+
+    @pytest.mark.parametrize("body", [b"", b"[1,", b"[1 2]", b'[{"a":', b"[1,]"])
+    def test_malformed(self, body):
+        """Test truncated or invalid input raises JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(split(body, 2)))
+
+
+class TestStream:
+    """Test streaming endpoint records."""
+
+    @patch("fmpsdk.transport.get")
+    def test_yields_validated_records(self, mock_get):
+        """Test records are validated and yielded one by one."""
+        mock_get.return_value = make_response(json.dumps(RECORDS).encode())
+
+        records = list(streaming.stream(fmpsdk.stock_list, apikey="k"))
+
+        assert all(isinstance(r, FMPSymbolAndCompanyNameList) for r in records)
+        assert [r.symbol for r in records] == [r["symbol"] for r in RECORDS]
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert mock_get.call_args.args[0].endswith("/stock-list")
+
+    @patch("fmpsdk.transport.get")
+    def test_chunks(self, mock_get):
+        """Test chunk_size yields lists, and tabular outputs one frame each."""
+        mock_get.return_value = make_response(json.dumps(RECORDS).encode())
+        chunks = list(streaming.stream(fmpsdk.stock_list, apikey="k", chunk_size=10))
+        assert [len(c) for c in chunks] == [10, 10, 5]
+
+        frames = list(
+            streaming.stream(
+                fmpsdk.stock_list, apikey="k", chunk_size=10, output="pandas"
+            )
+        )
+        assert all(isinstance(f, pd.DataFrame) for f in frames)
+        assert sum(len(f) for f in frames) == 25
+
+    @patch("fmpsdk.transport.get")
+    def test_raw_output(self, mock_get):
+        """Test output="raw" yields decoded dictionaries."""
+        mock_get.return_value = make_response(json.dumps(RECORDS).encode())
+        assert (
+            list(streaming.stream(fmpsdk.stock_list, apikey="k", output="raw"))
+            == RECORDS
+        )
+
+    def test_invalid_arguments(self):
+        """Test bad options fail before any request is sent."""
+        with patch("fmpsdk.transport.get") as mock_get:
+            with pytest.raises(ValueError):
+                streaming.stream(fmpsdk.stock_list, apikey="k", output="pandas")
+            with pytest.raises(ValueError):
+                streaming.stream(fmpsdk.stock_list, apikey="k", output="arrow")
+            with pytest.raises(ValueError):
+                streaming.stream(len, apikey="k")
+        mock_get.assert_not_called()
+
+    @patch("fmpsdk.transport.get")
+    def test_error_message(self, mock_get):
+        """Test API error documents raise instead of yielding records."""
+        mock_get.return_value = make_response(b'{"Error Message": "Invalid"}')
+        with pytest.raises(Exception, match="Invalid"):
+            list(streaming.stream(fmpsdk.stock_list, apikey="k"))
+
+    @patch("fmpsdk.transport.get")
+    def test_empty_object(self, mock_get):
+        """Test an empty object is treated as no data."""
+        mock_get.return_value = make_response(b"{}")
+        assert list(streaming.stream(fmpsdk.stock_list, apikey="k")) == []
+
+    @patch("fmpsdk.streaming.time.sleep")
+    @patch("fmpsdk.transport.get")
+    def test_rate_limit_retried(self, mock_get, sleep):
+        """Test 429 responses are retried before streaming starts."""
+        limited = make_response(b"", status_code=429)
+        limited.headers = {}
+        mock_get.side_effect = [limited, make_response(json.dumps(RECORDS).encode())]
+
+        assert len(list(streaming.stream(fmpsdk.stock_list, apikey="k"))) == 25
+        assert mock_get.call_count == 2
+        limited.close.assert_called_once()
+
+
+class TestCSV:
+    """Test incremental CSV parsing."""
+
+    def test_records_match_dict_reader(self):
+        """Test rows match csv.DictReader, including quoted newlines."""
+        body = 'a,b\n1,"x\ny é"\n2,"z,☃"\n'.encode()
+        expected = list(csv.DictReader(io.StringIO(body.decode(), newline="")))
+        assert list(iter_csv_records(split(body, 3))) == expected
+
+    def test_frames_match_to_pandas(self):
+        """Test typed chunks match converting all rows at once."""
+        model = RootModel[List[FMPBulkEOD]]
+        body = EOD_CSV + GAPS
+        frames = list(iter_csv_frames(split(body, 50), model, 10))
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        expected = columnar.to_pandas(rows, model)
+
+        assert [len(f) for f in frames] == [10, 10, 6]
+        combined = pd.concat(frames, ignore_index=True)
+        assert list(combined.columns) == list(expected.columns)
+        assert (combined.dtypes == expected.dtypes).all()
+        np.testing.assert_array_equal(combined["open"], expected["open"])
+        assert combined["volume"].tolist()[:-1] == expected["volume"].tolist()[:-1]
+        assert combined["volume"].isna().tolist()[-1]
+
+    def test_empty_body(self):
+        """Test an empty body yields no frames or records."""
+        model = RootModel[List[FMPBulkEOD]]
+        assert list(iter_csv_frames([b""], model, 10)) == []
+        assert list(iter_csv_records([b""])) == []
+
+
+class TestStreamCSV:
+    """Test streaming CSV endpoint responses."""
+
+    @patch("fmpsdk.transport.get")
+    def test_models(self, mock_get):
+        """Test CSV rows are validated into typed models."""
+        mock_get.return_value = make_response(EOD_CSV)
+
+        records = list(streaming.stream(fmpsdk.eod_bulk, apikey="k", date="d"))
+
+        assert len(records) == 25
+        assert isinstance(records[0], FMPBulkEOD)
+        assert records[1].open == 1.5 and records[1].volume == 100
+
+    @patch("fmpsdk.transport.get")
+    def test_tabular_outputs(self, mock_get):
+        """Test pandas and columns outputs yield typed chunks."""
+        mock_get.side_effect = lambda *a, **k: make_response(EOD_CSV)
+
+        frames = list(
+            streaming.stream(
+                fmpsdk.eod_bulk, apikey="k", date="d", chunk_size=20, output="pandas"
+            )
+        )
+        columns = list(
+            streaming.stream(
+                fmpsdk.eod_bulk, apikey="k", date="d", chunk_size=20, output="columns"
+            )
+        )
+
+        assert [len(f) for f in frames] == [20, 5]
+        assert frames[0]["close"].dtype == "float64"
+        assert columns[0]["volume"].dtype == np.int64
+
+
+class TestStreamEmpty:
+    """Test responses without a body."""
+
+    @patch("fmpsdk.transport.get")
+    def test_empty_body(self, mock_get):
+        """Test an empty body yields nothing."""
+        mock_get.return_value = make_response(b"")
+        assert list(streaming.stream(fmpsdk.stock_list, apikey="k")) == []
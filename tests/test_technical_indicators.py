@@ -1,5 +1,6 @@
 import pytest
 
+from fmpsdk import indicators
 from fmpsdk.exceptions import InvalidAPIKeyException
 from fmpsdk.models import FMPTechnicalIndicator
 from fmpsdk.technical_indicators import technical_indicators
@@ -911,3 +912,44 @@ class TestTechnicalIndicatorsValidation:
         std_dev = variance**0.5
 
         return std_dev / abs(mean)
+
+
+class TestLocalIndicators:
+    """Test local indicators against the API."""
+
+    # Periods of history skipped before comparing: exponential indicators are
+    # seeded from whatever data each side starts with (tema and adx smooth up
+    # to three times), and only converge once that seed has decayed
+    WARMUP_PERIODS = 20
+
+    @pytest.mark.parametrize("indicator", indicators.INDICATORS)
+    def test_local_matches_api(self, api_key, indicator):
+        """Test fmpsdk.indicators reproduces the API's values past the warm-up."""
+        period = 14
+        remote, _ = handle_api_call_with_validation(
+            technical_indicators,
+            "technical_indicators",
+            apikey=api_key,
+            symbol="AAPL",
+            indicator=indicator,
+            periodLength=period,
+            timeframe="1day",
+            from_date="2023-01-01",
+        )
+        # The API's own price columns are the input, so both sides see the
+        # same (adjusted or not) prices
+        records = sorted(
+            get_response_models(remote, FMPTechnicalIndicator), key=lambda r: r.date
+        )
+        field = indicators.FIELD_NAMES[indicator]
+        local = indicators.technical_indicators(records, indicator, period).root[::-1]
+
+        compared = 0
+        for bar, (item, mine) in enumerate(zip(records, local)):
+            expected = getattr(item, field)
+            if bar < self.WARMUP_PERIODS * period or expected is None:
+                continue
+            assert mine.date[:10] == item.date[:10]
+            assert getattr(mine, field) == pytest.approx(expected, rel=1e-4, abs=1e-6)
+            compared += 1
+        assert compared > 0
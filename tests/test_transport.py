@@ -0,0 +1,287 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+import fmpsdk.url_methods as url_methods
+from fmpsdk import transport
+
+# Access the private functions outside of classes to avoid name mangling
+return_json_func = url_methods.__return_json
+return_binary_stable_func = url_methods.__return_binary_stable
+
+
+@pytest.fixture(autouse=True)
+def reset_transport():
+    """Restore the default transport configuration around every test."""
+    transport.configure_transport()
+    yield
+    transport.configure_transport()
+    transport.close_session()
+
+
+class TestSharedSession:
+    """Test the shared keep-alive session."""
+
+    def test_get_session_is_shared(self):
+        """Test repeated calls return the same session instance."""
+        assert transport.get_session() is transport.get_session()
+
+    def test_get_session_thread_safe_creation(self):
+        """Test concurrent first use creates a single session."""
+        transport.close_session()
+        sessions = []
+
+        def worker():
+            sessions.append(transport.get_session())
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(s) for s in sessions}) == 1
+
+    def test_default_pool_sizes(self):
+        """Test the default adapter uses the configured pool sizes."""
+        adapter = transport.get_session().get_adapter("https://example.com/")
+        assert adapter._pool_connections == transport.POOL_CONNECTIONS
+        assert adapter._pool_maxsize == transport.POOL_MAXSIZE
+        assert adapter._pool_block == transport.POOL_BLOCK
+
+    def test_set_session_swaps_and_closes_previous(self):
+        """Test swapping the session closes the old one."""
+        previous = transport.get_session()
+        previous.close = Mock()
+        replacement = requests.Session()
+
+        assert transport.set_session(replacement) is replacement
+        assert transport.get_session() is replacement
+        previous.close.assert_called_once()
+
+    def test_set_session_none_rebuilds_default(self):
+        """Test resetting the session builds a new default session."""
+        previous = transport.get_session()
+        current = transport.set_session(None)
+        assert current is not previous
+        assert isinstance(current, requests.Session)
+
+    def test_get_uses_shared_session(self):
+        """Test transport.get delegates to the shared session."""
+        session = Mock()
+        transport.set_session(session)
+        transport.get("https://example.com/x", params={"a": 1}, timeout=(1, 2))
+        session.get.assert_called_once_with(
+            "https://example.com/x", params={"a": 1}, timeout=(1, 2)
+        )
+
+
+class TestConfigureTransport:
+    """Test connection pool configuration."""
+
+    def test_configure_pool_sizes(self):
+        """Test configure_transport applies new pool sizes."""
+        session = transport.configure_transport(
+            pool_connections=4, pool_maxsize=64, pool_block=True
+        )
+        adapter = session.get_adapter("https://example.com/")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+
+    def test_configure_host_limits(self):
+        """Test per-host limits mount a blocking adapter for that host."""
+        session = transport.configure_transport(
+            host_limits={"financialmodelingprep.com": 3}
+        )
+        adapter = session.get_adapter("https://financialmodelingprep.com/stable/quote")
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block is True
+
+        other = session.get_adapter("https://example.com/")
+        assert other._pool_maxsize == transport.POOL_MAXSIZE
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"pool_connections": 0},
+            {"pool_maxsize": 0},
+            {"host_limits": {"financialmodelingprep.com": 0}},
+        ],
+    )
+    def test_configure_rejects_invalid_sizes(self, kwargs):
+        """Test invalid pool sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            transport.configure_transport(**kwargs)
+
+
+class TestUrlMethodsUseTransport:
+    """Test url_methods routes requests through the shared session."""
+
+    def test_return_json_uses_session(self):
+        """Test __return_json issues its request via the shared session."""
+        response = Mock()
+        response.status_code = 200
+        response.content = b"[]"
+        response.json.return_value = []
+        session = Mock()
+        session.get.return_value = response
+        transport.set_session(session)
+
+        with patch("fmpsdk.url_methods.requests.get") as bare_get:
+            assert return_json_func("quote", {"apikey": "k"}) == []
+            bare_get.assert_not_called()
+        session.get.assert_called_once()
+
+    def test_return_binary_uses_session(self):
+        """Test __return_binary_stable issues its request via the shared session."""
+        response = Mock()
+        response.content = b"data"
+        response.raise_for_status.return_value = None
+        session = Mock()
+        session.get.return_value = response
+        transport.set_session(session)
+
+        assert return_binary_stable_func("file", {"apikey": "k"}) == b"data"
+        session.get.assert_called_once()
+
+
+class TestSingleFlight:
+    """Test deduplication of identical concurrent requests."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test callers arriving during a call receive its result."""
+        flight = transport.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ["result"]
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+            for _ in range(5)
+        ]
+        for thread in followers:
+            thread.start()
+        while flight.stats()["coalesced"] < 5:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [["result"]] * 6
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == {"calls": 1, "coalesced": 5}
+
+    def test_exception_shared_and_not_retained(self):
+        """Test errors propagate and the next call starts afresh."""
+        flight = transport.SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: 1) == 1
+
+    def test_distinct_keys_not_shared(self):
+        """Test different keys run separately."""
+        flight = transport.SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats()["calls"] == 2
+
+    def test_request_key_ignores_param_order(self):
+        """Test query order does not change the key."""
+        assert transport.request_key("u", {"a": 1, "b": 2}) == (
+            transport.request_key("u", {"b": 2, "a": 1})
+        )
+        assert transport.request_key("u", {"a": 1}) != transport.request_key(
+            "u", {"a": 2}
+        )
+
+    @patch("fmpsdk.transport.get")
+    def test_return_json_coalesces_concurrent_calls(self, mock_get):
+        """Test concurrent identical __return_json calls issue one request."""
+        release = threading.Event()
+        response = Mock()
+        response.status_code = 200
+        response.content = b'[{"symbol": "SPY"}]'
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return response
+
+        mock_get.side_effect = slow_get
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    return_json_func("quote", {"apikey": "k", "symbol": "SPY"})
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        while mock_get.call_count == 0:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert mock_get.call_count == 1
+        assert results == [[{"symbol": "SPY"}]] * 8
+
+    @patch("fmpsdk.transport.get")
+    def test_raw_output_never_shared(self, mock_get):
+        """Test output="raw" callers each get their own, unshared object."""
+        import fmpsdk
+
+        response = Mock()
+        response.status_code = 200
+        response.content = b'[{"symbol": "SPY"}]'
+        mock_get.return_value = response
+        barrier = threading.Barrier(4)
+        results = []
+
+        def call():
+            barrier.wait()
+            results.append(fmpsdk.quote(apikey="k", symbol="SPY", output="raw"))
+
+        with patch.object(transport._flight, "do") as do:
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            do.assert_not_called()
+
+        results[0][0]["symbol"] = "MUTATED"
+        assert [r[0]["symbol"] for r in results[1:]] == ["SPY"] * 3
+
+    @patch("fmpsdk.transport.get")
+    def test_coalescing_can_be_disabled(self, mock_get):
+        """Test set_coalescing(False) bypasses the single-flight group."""
+        mock_get.return_value = Mock(status_code=200, content=b"")
+        transport.set_coalescing(False)
+        try:
+            with patch.object(transport._flight, "do") as do:
+                return_json_func("quote", {"apikey": "k"})
+                do.assert_not_called()
+        finally:
+            transport.set_coalescing(True)
@@ -0,0 +1,173 @@
+import json
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import RootModel, ValidationError
+
+import fmpsdk
+from fmpsdk import trusted
+from fmpsdk.models import FMPBulkEOD, FMPDcfValuation, FMPStockScreenerResult
+from fmpsdk.utils import validate_response
+
+EOD = RootModel[List[FMPBulkEOD]]
+
+
+def eod_record(**overrides):
+    record = {
+        "symbol": "AAPL",
+        "date": "2024-01-02",
+        "open": 185.1,
+        "low": 183.4,
+        "high": 188.4,
+        "close": 185.6,
+        "adjClose": 185.6,
+        "volume": 82488700,
+    }
+    record.update(overrides)
+    return record
+
+
+def csv_record(**overrides):
+    return {k: str(v) for k, v in eod_record(**overrides).items()}
+
+
+@pytest.fixture(autouse=True)
+def reset_trusted_mode():
+    """Restore validated mode around every test."""
+    trusted.set_trusted_mode(False)
+    yield
+    trusted.set_trusted_mode(False)
+
+
+class TestConstruct:
+    """Test the trusted model constructor."""
+
+    def test_matches_full_validation(self):
+        """Test typed records build the same models as validation."""
+        raw = [eod_record(), eod_record(symbol="MSFT", volume=1)]
+        assert trusted.construct(EOD, raw) == EOD.model_validate(raw)
+
+    def test_csv_batches_use_validation(self):
+        """Test batches whose values need coercion are validated as a whole."""
+        raw = [csv_record(), csv_record(symbol="MSFT")]
+        with patch.object(EOD, "model_validate", wraps=EOD.model_validate) as validate:
+            result = trusted.construct(EOD, raw)
+        validate.assert_called_once_with(raw)
+        assert result.root[0].volume == 82488700
+
+    def test_coercion_inside_typed_batch(self):
+        """Test stray string values in a typed batch are converted."""
+        raw = [eod_record(), eod_record(close="185.6", volume="82488700")]
+        result = trusted.construct(EOD, raw)
+        assert result == EOD.model_validate(raw)
+
+    def test_matches_full_validation_for_json_values(self):
+        """Test already-typed JSON values, optional None and aliases."""
+        model = RootModel[List[FMPDcfValuation]]
+        raw = [
+            {"symbol": "A", "date": "d", "dcf": 1.0, "Stock Price": 2.5},
+            {"symbol": "B", "date": "d", "dcf": "None"},
+        ]
+        result = trusted.construct(model, raw)
+        assert result == model.model_validate(raw)
+        assert isinstance(result.root[1], FMPDcfValuation)
+        assert result.root[0].Stock_Price == 2.5
+        assert result.root[1].dcf is None
+
+    def test_skips_validators(self):
+        """Test records are built with model_construct."""
+        with patch.object(
+            FMPBulkEOD, "model_validate", side_effect=AssertionError
+        ) as validate:
+            trusted.construct(EOD, [eod_record()])
+            validate.assert_not_called()
+
+    def test_bad_record_falls_back_to_validation(self):
+        """Test values the fast path cannot convert are validated normally."""
+        with pytest.raises(ValidationError):
+            trusted.construct(EOD, [eod_record(), eod_record(close="n/a")])
+
+    def test_unset_defaults(self):
+        """Test omitted optional fields get defaults and are not marked set."""
+        model = RootModel[List[FMPDcfValuation]]
+        result = trusted.construct(model, [{"symbol": "A", "date": "d"}])
+        record = result.root[0]
+        assert record.dcf is None
+        assert record.model_fields_set == {"symbol", "date"}
+
+    def test_missing_required_field_falls_back(self):
+        """Test missing required fields still raise."""
+        record = eod_record()
+        del record["close"]
+        with pytest.raises(ValidationError):
+            trusted.construct(EOD, [record])
+
+    def test_bool_fields(self):
+        """Test booleans are kept and non-booleans are validated."""
+        model = RootModel[List[FMPStockScreenerResult]]
+        record = {
+            "symbol": "A",
+            "companyName": "A Inc",
+            "price": 1.0,
+            "volume": 2.0,
+            "exchange": "X",
+            "exchangeShortName": "X",
+            "isEtf": False,
+            "isFund": "true",
+        }
+        result = trusted.construct(model, [record])
+        assert result == model.model_validate([record])
+        assert result.root[0].isFund is True
+
+    def test_sample_size(self):
+        """Test the sampled fraction of records is validated."""
+        raw = [eod_record() for _ in range(200)]
+        with patch.object(
+            FMPBulkEOD, "model_validate", wraps=FMPBulkEOD.model_validate
+        ) as validate:
+            trusted.construct(EOD, raw, sample=0.05)
+        assert validate.call_count == 10
+
+
+class TestTrustedMode:
+    """Test global, contextual and per-call trusted mode."""
+
+    def test_default_is_validated(self):
+        """Test validation runs unless trusted mode is enabled."""
+        with patch("fmpsdk.trusted.construct") as construct:
+            validate_response("eod_bulk", [eod_record()])
+            construct.assert_not_called()
+
+    def test_global_mode(self):
+        """Test set_trusted_mode applies to every response."""
+        trusted.set_trusted_mode(True, sample=0.1)
+        with patch("fmpsdk.trusted.construct") as construct:
+            validate_response("eod_bulk", [eod_record()])
+        assert construct.call_args.args[2] == 0.1
+
+    def test_context_mode(self):
+        """Test trusted_mode is scoped to the block."""
+        with trusted.trusted_mode():
+            assert trusted.get_trusted_mode().enabled
+        assert not trusted.get_trusted_mode().enabled
+
+    def test_invalid_sample(self):
+        """Test sample fractions outside 0-1 are rejected."""
+        with pytest.raises(ValueError):
+            trusted.set_trusted_mode(True, sample=2)
+
+    @patch("fmpsdk.transport.get")
+    def test_per_call_option(self, mock_get):
+        """Test endpoints accept trusted/validate_sample keyword arguments."""
+        response = Mock(status_code=200, content=json.dumps([eod_record()]).encode())
+        mock_get.return_value = response
+
+        with patch("fmpsdk.trusted.construct", wraps=trusted.construct) as construct:
+            result = fmpsdk.eod_bulk(
+                apikey="k", date="2024-01-02", trusted=True, validate_sample=0
+            )
+
+        construct.assert_called_once()
+        assert result.root[0].volume == 82488700
+        assert "trusted" not in mock_get.call_args.kwargs["params"]
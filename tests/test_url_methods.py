@@ -44,7 +44,7 @@ class TestGetBaseUrl:
 class TestReturnJson:
     """Test the __return_json function."""
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_successful_json_response(self, mock_get):
         """Test successful JSON response."""
         # Mock successful response
@@ -59,7 +59,7 @@ class TestReturnJson:
         assert len(result) > 0 and result[0].get("symbol", "") != ""
         mock_get.assert_called_once()
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_premium_endpoint_402_response(self, mock_get):
         """Test premium endpoint 402 status code raises PremiumEndpointException."""
         from fmpsdk.exceptions import PremiumEndpointException
@@ -74,7 +74,7 @@ class TestReturnJson:
         with pytest.raises(PremiumEndpointException):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_error_status_code_with_json_response(self, mock_get):
         """Test error status code with JSON error response raises Exception."""
         # Mock 404 response with JSON error (404 is not in retryable codes)
@@ -87,7 +87,7 @@ class TestReturnJson:
         with pytest.raises(Exception, match="Resource not found. Status code: 404"):
             return_json_func("test/path", {"apikey": "invalid"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_error_status_code_with_non_json_response(self, mock_get):
         """Test error status code with non-JSON error response raises Exception."""
         # Mock 404 response with non-JSON error (404 is not in retryable codes)
@@ -101,7 +101,7 @@ class TestReturnJson:
         with pytest.raises(Exception, match=r"Resource not found. Status code: 404"):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_error_status_code_with_unicode_decode_error(self, mock_get):
         """Test error status code with unicode decode error raises Exception."""
         # Mock response with content that can't be decoded
@@ -117,7 +117,7 @@ class TestReturnJson:
         with pytest.raises(Exception, match=r"Resource not found. Status code: 404"):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_csv_response(self, mock_get):
         """Test CSV response parsing."""
         # Mock CSV response
@@ -133,7 +133,7 @@ class TestReturnJson:
         assert len(result) > 0 and result[0].get("symbol", "") != ""
         assert len(result) > 0 and result[0].get("symbol", "") != ""
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_csv_response_with_error(self, mock_get):
         """Test CSV response with decode error raises UnicodeDecodeError."""
         # Mock response with invalid UTF-8 content
@@ -148,7 +148,7 @@ class TestReturnJson:
         with pytest.raises(UnicodeDecodeError):
             return_json_func("test/path", {"apikey": "test", "datatype": "csv"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_empty_response(self, mock_get):
         """Test empty response returns empty list."""
         # Mock empty response
@@ -161,7 +161,7 @@ class TestReturnJson:
 
         assert result == []
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_empty_dict_response(self, mock_get):
         """Test empty dict response returns empty list."""
         # Mock empty dict response
@@ -175,7 +175,7 @@ class TestReturnJson:
 
         assert result == []
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_timeout_exception(self, mock_get):
         """Test timeout exception is raised."""
         # Mock timeout exception
@@ -184,7 +184,7 @@ class TestReturnJson:
         with pytest.raises(requests.Timeout):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_connection_error_exception(self, mock_get):
         """Test connection error exception is raised."""
         # Mock connection error
@@ -193,7 +193,7 @@ class TestReturnJson:
         with pytest.raises(requests.ConnectionError):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_too_many_redirects_exception(self, mock_get):
         """Test too many redirects exception is raised."""
         # Mock too many redirects error
@@ -202,7 +202,7 @@ class TestReturnJson:
         with pytest.raises(requests.TooManyRedirects):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_http_error_exception(self, mock_get):
         """Test HTTP error exception is raised."""
         # Mock HTTP error
@@ -211,7 +211,7 @@ class TestReturnJson:
         with pytest.raises(requests.HTTPError):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_generic_exception_handling(self, mock_get):
         """Test generic exception handling raises the exception."""
         # Mock generic exception
@@ -220,7 +220,7 @@ class TestReturnJson:
         with pytest.raises(ValueError, match="Some other error"):
             return_json_func("test/path", {"apikey": "test"})
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_generic_exception_with_response_info(self, mock_get):
         """Test generic exception with response information available raises the exception."""
 
@@ -236,7 +236,7 @@ class TestReturnJson:
 
     def test_v4_version_url(self):
         """Test that v4 version uses correct base URL."""
-        with patch("fmpsdk.url_methods.requests.get") as mock_get:
+        with patch("fmpsdk.transport.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b"[]"
@@ -253,7 +253,7 @@ class TestReturnJson:
 class TestReturnBinaryStable:
     """Test the __return_binary_stable function."""
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_successful_binary_response(self, mock_get):
         """Test successful binary response."""
         # Mock successful binary response
@@ -266,7 +266,7 @@ class TestReturnBinaryStable:
 
         assert result == b"binary data content"
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_empty_binary_response(self, mock_get):
         """Test empty binary response."""
         # Mock empty binary response
@@ -279,7 +279,7 @@ class TestReturnBinaryStable:
 
         assert result == b""
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_timeout_exception_binary(self, mock_get):
         """Test timeout exception for binary requests."""
         # Mock timeout exception
@@ -290,7 +290,7 @@ class TestReturnBinaryStable:
         # Should return None when exception occurs
         assert result is None
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_connection_error_exception_binary(self, mock_get):
         """Test connection error exception for binary requests."""
         # Mock connection error
@@ -301,7 +301,7 @@ class TestReturnBinaryStable:
         # Should return None when exception occurs
         assert result is None
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_too_many_redirects_exception_binary(self, mock_get):
         """Test too many redirects exception for binary requests."""
         # Mock too many redirects error
@@ -312,7 +312,7 @@ class TestReturnBinaryStable:
         # Should return None when exception occurs
         assert result is None
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_http_error_exception_binary(self, mock_get):
         """Test HTTP error exception for binary requests."""
         # Mock HTTP error
@@ -327,7 +327,7 @@ class TestReturnBinaryStable:
         # Should return None when exception occurs
         assert result is None
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_generic_exception_binary(self, mock_get):
         """Test generic exception handling for binary requests."""
         # Mock generic exception
@@ -358,7 +358,7 @@ class TestUrlMethodsIntegration:
         assert requests_logger.level == logging.WARNING
         assert urllib3_logger.level == logging.WARNING
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_url_construction_stable(self, mock_get):
         """Test URL construction for stable API."""
         mock_response = Mock()
@@ -377,7 +377,7 @@ class TestUrlMethodsIntegration:
         # Verify the function returns the expected result
         assert result == []
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_url_construction_v4(self, mock_get):
         """Test URL construction for v4 API."""
         mock_response = Mock()
@@ -392,7 +392,7 @@ class TestUrlMethodsIntegration:
         call_args = mock_get.call_args
         assert call_args[0][0] == f"{BASE_URL_V4}social-sentiments/trending"
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_timeout_parameters_passed(self, mock_get):
         """Test that timeout parameters are correctly passed to requests."""
         mock_response = Mock()
@@ -411,7 +411,7 @@ class TestUrlMethodsIntegration:
 class TestUrlMethodsCoverageCompleteness:
     """Tests to achieve 100% coverage for remaining uncovered lines in url_methods.py."""
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     @patch("fmpsdk.url_methods.time.sleep")
     def test_rate_limit_retry_with_logging(self, mock_sleep, mock_get):
         """Test rate limit retry logic with logging (covers lines 67-77)."""
@@ -443,7 +443,7 @@ class TestUrlMethodsCoverageCompleteness:
             # Verify successful result
             assert result == {"data": "success"}
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_csv_parsing_error_handling(self, mock_get):
         """Test CSV parsing error handling (covers lines 90-92)."""
         import csv
@@ -467,7 +467,7 @@ class TestUrlMethodsCoverageCompleteness:
                 # Verify error logging occurred (might be called multiple times due to error handling)
                 assert mock_logging.error.call_count >= 1
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     @patch("fmpsdk.url_methods.time.sleep")
     def test_read_timeout_retry_logic(self, mock_sleep, mock_get):
         """Test read timeout retry logic (covers lines 104-110)."""
@@ -497,7 +497,7 @@ class TestUrlMethodsCoverageCompleteness:
             # Verify successful result
             assert result == {"data": "success"}
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_read_timeout_no_retries_left(self, mock_get):
         """Test read timeout with no retries raises exception (covers lines 105-106)."""
         mock_get.side_effect = requests.exceptions.ReadTimeout("Read timeout")
@@ -505,7 +505,7 @@ class TestUrlMethodsCoverageCompleteness:
         with pytest.raises(requests.exceptions.ReadTimeout):
             return_json_func("test/path", {"apikey": "test"}, retries=0)
 
-    @patch("fmpsdk.url_methods.requests.get")
+    @patch("fmpsdk.transport.get")
     def test_json_decode_error_re_raised(self, mock_get):
         """Test JSON decode error is re-raised (covers line 132)."""
         # Mock response with invalid JSON
@@ -1839,3 +1839,196 @@ class TestUtilsCoverageCompleteness:
 
         result = to_dict_list(mock_response)
         assert result == []  # Should return empty list when root is None
+
+
+class TestIterateOverPagesPrefetch:
+    """Test speculative parallel page prefetching in iterate_over_pages."""
+
+    @staticmethod
+    def make_paged_func(num_pages, delays=None):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        state = {"calls": [], "active": 0, "peak": 0}
+
+        def paged_func(**kwargs):
+            page = kwargs["page"]
+            with lock:
+                state["calls"].append(page)
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep((delays or {}).get(page, 0.01))
+            with lock:
+                state["active"] -= 1
+            if page < num_pages:
+                return [{"page": page, "item": i} for i in range(3)]
+            return []
+
+        return paged_func, state
+
+    @pytest.mark.parametrize("prefetch", [1, 2, 4, 8])
+    def test_prefetch_matches_sequential(self, prefetch):
+        """Test prefetching returns the same data in page order."""
+        func, _ = self.make_paged_func(7)
+        expected = iterate_over_pages(func, {"symbol": "AAPL"}, page_limit=20)
+
+        func, _ = self.make_paged_func(7)
+        result = iterate_over_pages(
+            func, {"symbol": "AAPL"}, page_limit=20, prefetch=prefetch
+        )
+
+        assert result == expected
+        assert [r["page"] for r in result] == sorted(r["page"] for r in result)
+
+    def test_prefetch_keeps_pages_in_flight(self):
+        """Test several pages are requested concurrently."""
+        func, state = self.make_paged_func(12)
+        iterate_over_pages(func, {}, page_limit=20, prefetch=4)
+        assert 1 < state["peak"] <= 4
+
+    def test_prefetch_order_with_uneven_latency(self):
+        """Test slow early pages do not reorder results."""
+        func, _ = self.make_paged_func(5, delays={0: 0.1, 1: 0.05})
+        result = iterate_over_pages(func, {}, page_limit=10, prefetch=5)
+        assert [r["page"] for r in result][::3] == [0, 1, 2, 3, 4]
+
+    def test_prefetch_stops_at_first_empty_page(self):
+        """Test no pages beyond the speculative window are requested."""
+        func, state = self.make_paged_func(3)
+        result = iterate_over_pages(func, {}, page_limit=100, prefetch=4)
+        assert len(result) == 9
+        assert max(state["calls"]) <= 3 + 4
+
+    def test_prefetch_respects_page_limit(self):
+        """Test prefetching never requests past page_limit."""
+        func, state = self.make_paged_func(50)
+        result = iterate_over_pages(func, {}, page_limit=5, prefetch=8)
+        assert max(state["calls"]) == 5
+        assert len(result) == 18
+
+    def test_prefetch_does_not_mutate_args(self):
+        """Test caller arguments are copied per page."""
+        func, _ = self.make_paged_func(2)
+        args = {"symbol": "AAPL"}
+        iterate_over_pages(func, args, page_limit=10, prefetch=3)
+        assert args == {"symbol": "AAPL"}
+
+    def test_prefetch_sees_caller_context(self):
+        """Test prefetched pages run with the caller's context-scoped settings."""
+        from fmpsdk import retry
+        from fmpsdk.retry import RetryPolicy
+
+        def paged(**kwargs):
+            if kwargs["page"] < 6:
+                return [retry.get_retry_policy().max_retries]
+            return []
+
+        with retry.use_retry_policy(RetryPolicy(max_retries=1)):
+            result = iterate_over_pages(paged, {}, page_limit=10, prefetch=3)
+
+        assert result == [1] * 6
+
+    def test_prefetch_propagates_errors(self):
+        """Test errors on a page surface to the caller."""
+
+        def failing(**kwargs):
+            if kwargs["page"] == 2:
+                raise ValueError("boom")
+            return [kwargs["page"]]
+
+        with pytest.raises(ValueError, match="boom"):
+            iterate_over_pages(failing, {}, page_limit=10, prefetch=3)
+
+
+class TestIterPages:
+    """Test the lazy iter_pages generator."""
+
+    def test_yields_records_in_page_order(self):
+        """Test records from every page are yielded in order."""
+        from fmpsdk.utils import iter_pages
+
+        def paged(**kwargs):
+            page = kwargs["page"]
+            return [page * 10, page * 10 + 1] if page < 3 else []
+
+        assert list(iter_pages(paged, {"symbol": "AAPL"})) == [0, 1, 10, 11, 20, 21]
+
+    def test_batch_yields_whole_pages(self):
+        """Test batch mode yields one list per page."""
+        from fmpsdk.utils import iter_pages
+
+        def paged(**kwargs):
+            page = kwargs["page"]
+            return [page, page] if page < 2 else []
+
+        assert list(iter_pages(paged, {}, batch=True)) == [[0, 0], [1, 1]]
+
+    def test_unwraps_root_models(self):
+        """Test RootModel responses are unwrapped to their records."""
+        from fmpsdk.utils import iter_pages
+
+        class Page(RootModel):
+            root: List[MockFMPObject]
+
+        record = {
+            "symbol": "AAPL",
+            "companyName": "Apple",
+            "sector": "Tech",
+            "price": 1,
+        }
+
+        def paged(**kwargs):
+            return Page([record] if kwargs["page"] == 0 else [])
+
+        items = list(iter_pages(paged, {}))
+        assert len(items) == 1
+        assert isinstance(items[0], MockFMPObject)
+
+    def test_early_stop_fetches_no_more_pages(self):
+        """Test breaking out of the loop stops further requests."""
+        from fmpsdk.utils import iter_pages
+
+        requested = []
+
+        def paged(**kwargs):
+            requested.append(kwargs["page"])
+            return [kwargs["page"]] * 5
+
+        for record in iter_pages(paged, {}, page_limit=100):
+            if record == 1:
+                break
+
+        assert requested == [0, 1]
+
+    def test_early_stop_with_prefetch_is_bounded(self):
+        """Test early stop with prefetch only fetches the speculative window."""
+        from fmpsdk.utils import iter_pages
+
+        requested = []
+
+        def paged(**kwargs):
+            requested.append(kwargs["page"])
+            return [kwargs["page"]]
+
+        pages = iter_pages(paged, {}, page_limit=100, prefetch=3)
+        assert next(pages) == 0
+        pages.close()
+
+        assert len(requested) <= 4
+
+    @patch("fmpsdk.utils.time.sleep")
+    def test_keeps_rate_limit_retry(self, mock_sleep):
+        """Test rate-limited pages are retried before being yielded."""
+        from fmpsdk.utils import iter_pages
+
+        calls = {"count": 0}
+
+        def paged(**kwargs):
+            if kwargs["page"] == 0 and calls["count"] == 0:
+                calls["count"] += 1
+                return {"Error Message": "Limit Reach. Please upgrade your plan"}
+            return [kwargs["page"]] if kwargs["page"] < 2 else []
+
+        assert list(iter_pages(paged, {}, retry_delay=1)) == [0, 1]
+        mock_sleep.assert_called_once_with(1)